@@ -0,0 +1,10 @@
+"""
+Benchmark imports
+"""
+
+from .corpus import Corpus
+from .database import DatabaseBenchmark
+from .parser import ParserBenchmark
+from .pipeline import PipelineBenchmark
+from .reader import ReaderBenchmark
+from .transport import TransportBenchmark
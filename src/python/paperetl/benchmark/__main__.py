@@ -0,0 +1,94 @@
+"""
+Defines main entry point for benchmarks.
+"""
+
+import argparse
+import datetime
+import json
+import platform
+import subprocess
+import tempfile
+
+from importlib import metadata
+
+from .database import DatabaseBenchmark
+from .parser import ParserBenchmark
+from .pipeline import PipelineBenchmark
+from .reader import ReaderBenchmark
+from .transport import TransportBenchmark
+
+
+def parse():
+    """
+    Parses command line arguments.
+
+    Returns:
+        parsed arguments
+    """
+
+    parser = argparse.ArgumentParser(description="paperetl benchmarks")
+    parser.add_argument("benchmark", choices=["database", "parser", "pipeline", "reader", "transport"], help="benchmark to run")
+    parser.add_argument("--directory", default=None, help="working directory, defaults to a temporary directory")
+    parser.add_argument("--articles", type=int, default=30000, help="number of articles per generated file")
+    parser.add_argument("--files", type=int, default=4, help="number of generated files")
+    parser.add_argument("--repeat", type=int, default=1, help="number of runs, best run is reported")
+    parser.add_argument("--seed", type=int, default=0, help="random seed")
+    parser.add_argument("--url", action="append", default=None, help="database url to benchmark, can be repeated")
+    parser.add_argument("--output", default=None, help="path to JSON results file")
+
+    return parser.parse_args()
+
+
+def environment():
+    """
+    Describes the environment benchmarks run in. Stored with results to compare runs across commits.
+
+    Returns:
+        dict
+    """
+
+    try:
+        version = metadata.version("paperetl")
+    except metadata.PackageNotFoundError:
+        version = None
+
+    # pylint: disable=W0718
+    try:
+        commit = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, check=True, text=True).stdout.strip()
+    except Exception:
+        commit = None
+
+    return {
+        "paperetl": version,
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+if __name__ == "__main__":
+    args = parse()
+    directory = args.directory if args.directory else tempfile.mkdtemp()
+
+    results = {}
+    if args.benchmark == "database":
+        results = DatabaseBenchmark(directory, args.articles, args.seed, args.url)(repeat=args.repeat)
+    elif args.benchmark == "parser":
+        results = ParserBenchmark(directory, args.articles, args.seed)(repeat=args.repeat)
+    elif args.benchmark == "pipeline":
+        results = PipelineBenchmark(directory, args.articles, args.seed, args.url)(repeat=args.repeat)
+    elif args.benchmark == "reader":
+        results = ReaderBenchmark(directory, args.articles, args.seed)(repeat=args.repeat)
+    elif args.benchmark == "transport":
+        results = TransportBenchmark(directory, args.articles, args.files, args.seed)(repeat=args.repeat)
+
+    # Write results
+    output = json.dumps(
+        {"benchmark": args.benchmark, "environment": environment(), "parameters": vars(args), "results": results}, indent=2, default=str
+    )
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output)
+
+    print(output)
@@ -0,0 +1,483 @@
+"""
+Corpus module
+"""
+
+import csv
+import gzip
+import io
+import os
+import random
+
+from xml.sax.saxutils import escape
+
+
+class Corpus:
+    """
+    Generates synthetic article corpora for benchmarking. Output is fully determined by the random seed.
+    """
+
+    # Word list used to generate text
+    WORDS = (
+        "acute analysis antibody associated binding blood cancer cell cells clinical cohort compared control coronavirus "
+        "data disease dose effect effects expression factor gene genes health higher human immune increased infection "
+        "levels model mortality mouse patients pathway population protein proteins rate receptor response results risk "
+        "role sample severe signaling study studies surgery syndrome therapy tissue treatment trial tumor vaccine viral virus"
+    ).split()
+
+    # Abstract section labels
+    LABELS = ("BACKGROUND", "OBJECTIVE", "METHODS", "RESULTS", "CONCLUSIONS")
+
+    # Month abbreviations
+    MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+    def __init__(self, seed=0):
+        """
+        Creates a new corpus generator.
+
+        Args:
+            seed: random seed
+        """
+
+        self.random = random.Random(seed)
+
+    def pubmed(self, path, articles, start=1):
+        """
+        Writes a PubMed XML file. Files ending in .gz are gzip compressed.
+
+        Args:
+            path: output path
+            articles: number of articles
+            start: first PMID
+
+        Returns:
+            path
+        """
+
+        with self.open(path) as output:
+            for chunk in self.pubmedstream(articles, start):
+                output.write(chunk)
+
+        return path
+
+    def pubmedstream(self, articles, start=1):
+        """
+        Generates PubMed XML content.
+
+        Args:
+            articles: number of articles
+            start: first PMID
+
+        Returns:
+            generator of XML strings
+        """
+
+        yield '<?xml version="1.0" encoding="utf-8"?>\n<PubmedArticleSet>\n'
+
+        for uid in range(start, start + articles):
+            yield self.pubmedarticle(uid)
+
+        yield "</PubmedArticleSet>\n"
+
+    def pubmedarticle(self, uid):
+        """
+        Generates a single PubmedArticle element.
+
+        Args:
+            uid: PMID
+
+        Returns:
+            XML string
+        """
+
+        rand = self.random
+
+        # Authors with affiliations
+        authors = "".join(
+            f"<Author><LastName>{self.word().title()}</LastName><ForeName>{self.word().title()}</ForeName>"
+            f"<AffiliationInfo><Affiliation>{self.affiliation()}</Affiliation></AffiliationInfo></Author>"
+            for _ in range(rand.randint(1, 8))
+        )
+
+        # Journal publication date, some only have a MedlineDate
+        year = rand.randint(1990, 2024)
+        if rand.random() < 0.1:
+            pubdate = f"<MedlineDate>{year} {rand.choice(Corpus.MONTHS)}-{rand.choice(Corpus.MONTHS)}</MedlineDate>"
+        else:
+            pubdate = f"<Year>{year}</Year><Month>{rand.choice(Corpus.MONTHS)}</Month><Day>{rand.randint(1, 28)}</Day>"
+
+        # MeSH headings
+        mesh = "".join(
+            f'<MeshHeading><DescriptorName UI="D{rand.randint(1, 999999):06d}">{self.word().title()}</DescriptorName></MeshHeading>'
+            for _ in range(rand.randint(0, 10))
+        )
+
+        # Citations
+        references = "".join(
+            f'<Reference><Citation>{escape(self.sentence())}</Citation><ArticleIdList><ArticleId IdType="pubmed">'
+            f"{rand.randint(1, 40000000)}</ArticleId></ArticleIdList></Reference>"
+            for _ in range(rand.randint(0, 20))
+        )
+
+        return (
+            '<PubmedArticle><MedlineCitation Status="MEDLINE" Owner="NLM">'
+            f'<PMID Version="1">{uid}</PMID>'
+            f"<DateRevised><Year>{rand.randint(2015, 2024)}</Year><Month>{rand.randint(1, 12):02d}</Month>"
+            f"<Day>{rand.randint(1, 28):02d}</Day></DateRevised>"
+            '<Article PubModel="Print"><Journal><JournalIssue CitedMedium="Print">'
+            f"<Volume>{rand.randint(1, 200)}</Volume><PubDate>{pubdate}</PubDate></JournalIssue>"
+            f"<Title>Journal of {self.word().title()} {self.word().title()}</Title></Journal>"
+            f"<ArticleTitle>{escape(self.sentence())}</ArticleTitle>"
+            f"<Abstract>{self.abstract()}</Abstract>"
+            f'<AuthorList CompleteYN="Y">{authors}</AuthorList></Article>'
+            f"<MeshHeadingList>{mesh}</MeshHeadingList></MedlineCitation>"
+            f"<PubmedData><ReferenceList>{references}</ReferenceList></PubmedData></PubmedArticle>\n"
+        )
+
+    def arxiv(self, path, articles, start=1):
+        """
+        Writes an arXiv Atom XML feed. Files ending in .gz are gzip compressed.
+
+        Args:
+            path: output path
+            articles: number of entries
+            start: first entry number
+
+        Returns:
+            path
+        """
+
+        with self.open(path) as output:
+            for chunk in self.arxivstream(articles, start):
+                output.write(chunk)
+
+        return path
+
+    def arxivstream(self, articles, start=1):
+        """
+        Generates arXiv Atom XML content.
+
+        Args:
+            articles: number of entries
+            start: first entry number
+
+        Returns:
+            generator of XML strings
+        """
+
+        yield (
+            '<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom">\n'
+            '  <link href="http://arxiv.org/api/query" rel="self" type="application/atom+xml"/>\n'
+            '  <title type="html">ArXiv Query: search_query=all</title>\n'
+            "  <id>http://arxiv.org/api/query</id>\n  <updated>2024-01-01T00:00:00-05:00</updated>\n"
+            f'  <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">{articles}</opensearch:totalResults>\n'
+        )
+
+        for uid in range(start, start + articles):
+            yield self.arxiventry(uid)
+
+        yield "</feed>\n"
+
+    def arxiventry(self, uid):
+        """
+        Generates a single arXiv Atom entry element.
+
+        Args:
+            uid: entry number
+
+        Returns:
+            XML string
+        """
+
+        rand, namespace = self.random, 'xmlns:arxiv="http://arxiv.org/schemas/atom"'
+
+        identifier = f"{rand.randint(7, 24):02d}{rand.randint(1, 12):02d}.{uid:05d}v{rand.randint(1, 3)}"
+        published = f"{rand.randint(2007, 2023)}-{rand.randint(1, 12):02d}-{rand.randint(1, 28):02d}"
+        updated = f"{int(published[:4]) + rand.randint(0, 1)}-{rand.randint(1, 12):02d}-{rand.randint(1, 28):02d}"
+
+        authors = ""
+        for _ in range(rand.randint(1, 6)):
+            affiliations = "".join(
+                f"\n      <arxiv:affiliation {namespace}>{self.affiliation()}</arxiv:affiliation>" for _ in range(rand.randint(0, 2))
+            )
+            authors += f"\n    <author>\n      <name>{self.word().title()} {self.word().title()}</name>{affiliations}\n    </author>"
+
+        # Summaries are wrapped across lines like the arXiv API
+        words = escape(self.paragraph(rand.randint(3, 10))).split()
+        summary = "\n".join(" ".join(words[x : x + 12]) for x in range(0, len(words), 12))
+
+        categories = [rand.choice(["cs.LG", "cs.CL", "q-bio.QM", "stat.ML", "physics.med-ph"]) for _ in range(rand.randint(1, 3))]
+        journal = f"\n    <arxiv:journal_ref {namespace}>J. {self.word().title()} {rand.randint(1, 99)} ({published[:4]})</arxiv:journal_ref>"
+
+        return (
+            f"  <entry>\n    <id>http://arxiv.org/abs/{identifier}</id>\n"
+            f"    <updated>{updated}T18:00:00Z</updated>\n    <published>{published}T18:00:00Z</published>\n"
+            f"    <title>{escape(self.sentence())}\n  {escape(self.sentence())}</title>\n"
+            f"    <summary>  {summary}\n</summary>{authors}"
+            f"{journal if rand.random() < 0.3 else ''}\n"
+            f'    <link href="http://arxiv.org/abs/{identifier}" rel="alternate" type="text/html"/>\n'
+            f'    <link title="pdf" href="http://arxiv.org/pdf/{identifier}" rel="related" type="application/pdf"/>\n'
+            f'    <arxiv:primary_category {namespace} term="{categories[0]}" scheme="http://arxiv.org/schemas/atom"/>\n'
+            + "".join(f'    <category term="{category}" scheme="http://arxiv.org/schemas/atom"/>\n' for category in categories)
+            + "  </entry>\n"
+        )
+
+    def csv(self, path, articles, start=1):
+        """
+        Writes a CSV file with article metadata. Files ending in .gz are gzip compressed.
+
+        Args:
+            path: output path
+            articles: number of rows
+            start: first row id
+
+        Returns:
+            path
+        """
+
+        with self.open(path) as output:
+            for chunk in self.csvstream(articles, start):
+                output.write(chunk)
+
+        return path
+
+    def csvstream(self, articles, start=1, chunksize=1000):
+        """
+        Generates CSV content.
+
+        Args:
+            articles: number of rows
+            start: first row id
+            chunksize: number of rows per generated string
+
+        Returns:
+            generator of CSV strings
+        """
+
+        rand = self.random
+
+        fields = ["id", "source", "published", "publication", "authors", "affiliations", "affiliation", "title", "tags", "reference", "entry"]
+        fields += ["abstract"]
+
+        for offset in range(start, start + articles, chunksize):
+            buffer = io.StringIO()
+            writer = csv.DictWriter(buffer, fieldnames=fields)
+
+            if offset == start:
+                writer.writeheader()
+
+            for uid in range(offset, min(offset + chunksize, start + articles)):
+                authors = [f"{self.word().title()}, {self.word().title()}" for _ in range(rand.randint(1, 5))]
+                writer.writerow(
+                    {
+                        "id": f"csv{uid}",
+                        "source": "CSV",
+                        "published": f"{rand.randint(1990, 2024)}-{rand.randint(1, 12):02d}-{rand.randint(1, 28):02d}",
+                        "publication": f"Journal of {self.word().title()}",
+                        "authors": "; ".join(authors),
+                        "affiliations": self.affiliation(),
+                        "affiliation": self.affiliation(),
+                        "title": self.sentence(),
+                        "tags": "CSV",
+                        "reference": f"https://example.org/{uid}",
+                        # Missing entry dates default to the current date
+                        "entry": f"{rand.randint(2015, 2024)}-{rand.randint(1, 12):02d}-{rand.randint(1, 28):02d}" if rand.random() < 0.9 else "",
+                        "abstract": self.paragraph(),
+                    }
+                )
+
+            yield buffer.getvalue()
+
+    def tei(self, directory, articles, start=1):
+        """
+        Writes GROBID TEI XML files, one file per article.
+
+        Args:
+            directory: output directory
+            articles: number of articles
+            start: first article number
+
+        Returns:
+            list of paths
+        """
+
+        paths = []
+        for uid in range(start, start + articles):
+            path = os.path.join(directory, f"tei{uid:06d}.xml")
+            with self.open(path) as output:
+                output.write(self.teidocument(uid))
+
+            paths.append(path)
+
+        return paths
+
+    def teidocument(self, uid):
+        """
+        Generates a single GROBID TEI XML document.
+
+        Args:
+            uid: article number
+
+        Returns:
+            XML string
+        """
+
+        rand = self.random
+
+        title = escape(self.sentence()[:-1])
+        published = f"{rand.randint(2000, 2023)}-{rand.randint(1, 12):02d}-{rand.randint(1, 28):02d}"
+
+        authors = ""
+        for x in range(rand.randint(1, 6)):
+            authors += (
+                f'<author><persName><forename type="first">{self.word().title()}</forename><surname>{self.word().title()}</surname></persName>'
+                f'<affiliation key="aff{x}"><orgName type="department">Department of {self.word().title()}</orgName>'
+                f'<orgName type="institution">University of {self.word().title()}</orgName></affiliation></author>'
+            )
+
+        # Body sections with a numbered head
+        sections = ""
+        for x in range(rand.randint(3, 8)):
+            paragraphs = "".join(f"<p>{escape(self.paragraph())}</p>" for _ in range(rand.randint(1, 4)))
+            sections += f'<div xmlns="http://www.tei-c.org/ns/1.0"><head n="{x + 1}">{self.word().title()}</head>{paragraphs}</div>'
+
+        # Table figures
+        figures = ""
+        for x in range(rand.randint(0, 2)):
+            rows = "".join(
+                "<row>" + "".join(f"<cell>{self.word() if y == 0 else rand.randint(1, 999)}</cell>" for y in range(4)) + "</row>"
+                for _ in range(rand.randint(2, 6))
+            )
+            header = "<row>" + "".join(f"<cell>{self.word().title()}</cell>" for _ in range(4)) + "</row>"
+            figures += (
+                f'<figure xmlns="http://www.tei-c.org/ns/1.0" type="table" xml:id="tab_{x}"><head>Table {x + 1}</head>'
+                f"<figDesc>{escape(self.sentence())}</figDesc><table>{header}{rows}</table></figure>"
+            )
+
+        references = "".join(
+            f'<biblStruct xml:id="b{x}"><analytic><title level="a" type="main">{escape(self.sentence()[:-1])}</title></analytic>'
+            f'<monogr><title level="j">J. {self.word().title()}</title><imprint><date type="published" when="{rand.randint(1990, 2023)}"/>'
+            "</imprint></monogr></biblStruct>"
+            for x in range(rand.randint(1, 20))
+        )
+
+        return (
+            '<?xml version="1.0" encoding="UTF-8"?>\n'
+            '<TEI xml:space="preserve" xmlns="http://www.tei-c.org/ns/1.0" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">\n'
+            '<teiHeader xml:lang="en"><fileDesc><titleStmt><title level="a" type="main">'
+            f"{title}</title></titleStmt>"
+            f'<publicationStmt><publisher/><availability status="unknown"><licence/></availability>'
+            f'<date type="published" when="{published}">{published}</date></publicationStmt>'
+            f"<sourceDesc><biblStruct><analytic>{authors}"
+            f'<title level="a" type="main">{title}</title></analytic>'
+            f'<monogr><title level="j" type="main">J. {self.word().title()}</title>'
+            f'<imprint><date type="published" when="{published}"/></imprint></monogr>'
+            f'<idno type="DOI">10.{rand.randint(1000, 9999)}/{uid:06d}</idno></biblStruct></sourceDesc></fileDesc>'
+            f"<profileDesc><abstract><div><p>{escape(self.paragraph())}</p></div></abstract></profileDesc></teiHeader>\n"
+            f'<text xml:lang="en"><body>{sections}{figures}</body>'
+            f'<back><div type="references"><listBibl>{references}</listBibl></div></back></text>\n'
+            "</TEI>\n"
+        )
+
+    def abstract(self):
+        """
+        Generates PubMed AbstractText elements. Generates raw text, labeled sections and HTML formatted abstracts.
+
+        Returns:
+            XML string
+        """
+
+        rand, kind = self.random, self.random.random()
+
+        # Labeled sections
+        if kind < 0.4:
+            return "".join(
+                f'<AbstractText Label="{label}" NlmCategory="{label}">{escape(self.paragraph())}</AbstractText>'
+                for label in Corpus.LABELS[: rand.randint(2, len(Corpus.LABELS))]
+            )
+
+        # HTML formatted text
+        if kind < 0.5:
+            return "<AbstractText>" + "".join(f"<b>{label}:</b> {escape(self.paragraph())} " for label in Corpus.LABELS[:3]) + "</AbstractText>"
+
+        # Raw text
+        return f"<AbstractText>{escape(self.paragraph(rand.randint(3, 12)))}</AbstractText>"
+
+    def affiliation(self):
+        """
+        Generates an affiliation string.
+
+        Returns:
+            affiliation
+        """
+
+        rand = self.random
+        return escape(f"Department of {self.word().title()}, University of {self.word().title()}, {rand.choice(['USA', 'UK', 'China', 'Germany'])}")
+
+    def paragraph(self, sentences=None):
+        """
+        Generates a paragraph of text.
+
+        Args:
+            sentences: number of sentences, random if None
+
+        Returns:
+            paragraph text
+        """
+
+        sentences = sentences if sentences else self.random.randint(2, 6)
+        return " ".join(self.sentence() for _ in range(sentences))
+
+    def sentence(self):
+        """
+        Generates a sentence. Some sentences have citation markers, emails, urls and other content removed by text cleaning.
+
+        Returns:
+            sentence
+        """
+
+        rand = self.random
+
+        words = [self.word() for _ in range(rand.randint(6, 25))]
+        words[0] = words[0].title()
+
+        kind = rand.random()
+        if kind < 0.1:
+            words.append(f"[{', '.join(str(rand.randint(1, 60)) for _ in range(rand.randint(1, 4)))}]")
+        elif kind < 0.13:
+            words.append(f"https://example.org/{self.word()}")
+        elif kind < 0.15:
+            words.append(f"{self.word()}@{self.word()}.org")
+        elif kind < 0.2:
+            words.insert(rand.randint(1, len(words) - 1), f"({rand.randint(1, 99)}%)")
+
+        return " ".join(words) + "."
+
+    def word(self):
+        """
+        Gets a random word.
+
+        Returns:
+            word
+        """
+
+        return self.random.choice(Corpus.WORDS)
+
+    def open(self, path):
+        """
+        Opens an output file for writing. Creates parent directories as necessary.
+
+        Args:
+            path: output path
+
+        Returns:
+            file handle
+        """
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        if path.endswith(".gz"):
+            return gzip.open(path, "wt", encoding="utf-8", newline="")
+
+        return open(path, "w", encoding="utf-8", newline="")
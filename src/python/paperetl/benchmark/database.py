@@ -0,0 +1,98 @@
+"""
+Database benchmark module
+"""
+
+import os
+import time
+
+from ..factory import Factory
+from ..file.pmb import PMB
+
+from .corpus import Corpus
+
+
+class DatabaseBenchmark:
+    """
+    Benchmarks each database backend in isolation. Articles are parsed once up front, only saving is timed.
+    """
+
+    def __init__(self, directory, articles=30000, seed=0, urls=None):
+        """
+        Creates a new database benchmark. Generates and parses a synthetic PubMed corpus.
+
+        Args:
+            directory: working directory
+            articles: number of articles
+            seed: random seed
+            urls: list of database urls, defaults to SQLite, JSON and YAML databases in the working directory
+        """
+
+        directory = os.path.join(directory, "database")
+
+        # Generate and parse corpus
+        path = os.path.join(directory, "pubmed.xml")
+        if not os.path.exists(path):
+            Corpus(seed).pubmed(path, articles)
+
+        with open(path, "rb") as stream:
+            self.articles = [article for article in PMB.parse(stream, "pubmed", None) if article]
+
+        # Article, section and citation rows inserted per run
+        self.rows = sum(1 + len(article.sections) + len(article.citations) for article in self.articles)
+
+        self.urls = urls if urls else [f"sqlite://{directory}/sqlite", f"json://{directory}/json", f"yaml://{directory}/yaml"]
+
+    def __call__(self, repeat=1):
+        """
+        Runs the benchmark.
+
+        Args:
+            repeat: number of runs per database, best run is reported
+
+        Returns:
+            {backend: {"url", "seconds", "articles", "articles/s", "rows", "rows/s"}}
+        """
+
+        results = {}
+        for url in self.urls:
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+
+                db = Factory.create(url, True)
+                for article in self.articles:
+                    db.save(article)
+
+                db.complete()
+                db.close()
+
+                elapsed = time.perf_counter() - start
+                best = min(best, elapsed) if best else elapsed
+
+            results[DatabaseBenchmark.backend(url)] = {
+                "url": url,
+                "seconds": best,
+                "articles": len(self.articles),
+                "articles/s": len(self.articles) / best,
+                "rows": self.rows,
+                "rows/s": self.rows / best,
+            }
+
+        return results
+
+    @staticmethod
+    def backend(url):
+        """
+        Gets the backend name for a database url.
+
+        Args:
+            url: database url
+
+        Returns:
+            backend name
+        """
+
+        if url.startswith("http://"):
+            return "elastic"
+
+        return url.split("://")[0] if "://" in url else "sqlite"
@@ -0,0 +1,216 @@
+"""
+Parser benchmark module
+"""
+
+import io
+import os
+import re
+import time
+
+from ..file.arx import ARX
+from ..file.csvf import CSV
+from ..file.pmb import PMB
+from ..file.tei import TEI
+from ..splitter import Splitter
+from ..text import Text
+
+from .corpus import Corpus
+
+# Original text cleaning rules, applied as two separate passes. Used as a comparison for the single pass Text.transform.
+TWOPASS = re.compile(
+    r"(\w+@\w+(\.[a-z]{2,})+)|(http(s)?\:\/\/\S+)|((^|\s)(\w\s+){3,})|((\[\d+\]\,?\s?){3,}(\.|\,)?)|(\[[\d\,\s]+\])|((\(\d+\)\s){3,})"
+)
+
+
+class ParserBenchmark:
+    """
+    Benchmarks each file parser, text cleaning and sentence splitting in isolation. Input files are loaded into memory
+    before timing.
+    """
+
+    def __init__(self, directory, articles=30000, seed=0):
+        """
+        Creates a new parser benchmark. Generates a file for each format, if not already generated. TEI documents are
+        generated one file per article, so one tenth as many are generated. Formats with a -soup suffix run the
+        BeautifulSoup parser for comparison.
+
+        Args:
+            directory: working directory
+            articles: number of articles per format
+            seed: random seed
+        """
+
+        directory = os.path.join(directory, "parser")
+
+        corpus = Corpus(seed)
+        self.formats = {
+            "pubmed": ([os.path.join(directory, "pubmed.xml")], "rb", corpus.pubmed, lambda stream: PMB.parse(stream, "pubmed", None)),
+            "arxiv": ([os.path.join(directory, "arxiv.xml")], "rb", corpus.arxiv, lambda stream: ARX.parse(stream, "arxiv")),
+            "arxiv-soup": ([os.path.join(directory, "arxiv.xml")], "rb", corpus.arxiv, lambda stream: ARX.soup(stream, "arxiv")),
+            "csv": ([os.path.join(directory, "metadata.csv")], "rb", corpus.csv, lambda stream: CSV.parse(stream, "csv")),
+        }
+
+        for paths, _, generate, _ in self.formats.values():
+            if not os.path.exists(paths[0]):
+                generate(paths[0], articles)
+
+        # TEI files, one per article
+        tei = os.path.join(directory, "tei")
+        paths = sorted(os.path.join(tei, x) for x in os.listdir(tei)) if os.path.exists(tei) else corpus.tei(tei, max(articles // 10, 1))
+        self.formats["tei"] = (paths, "rb", None, lambda stream: [TEI.parse(stream, "tei")])
+        self.formats["tei-soup"] = (paths, "rb", None, lambda stream: [TEI.parse(stream, "tei", "soup")])
+
+        # Sentences for text cleaning
+        self.sentences = [corpus.sentence() for _ in range(articles * 10)]
+
+        # Paragraphs for batch text cleaning and sentence splitting
+        self.paragraphs = [corpus.paragraph() for _ in range(articles)]
+
+    def __call__(self, repeat=1):
+        """
+        Runs the benchmark.
+
+        Args:
+            repeat: number of runs per parser, best run is reported
+
+        Returns:
+            {format: {"seconds", "articles", "articles/s", "MB/s"}, "transform": {"seconds", "sentences", "sentences/s"},
+             "transform-twopass": {"seconds", "sentences", "sentences/s"},
+             "transform-batch": {"seconds", "paragraphs", "paragraphs/s", "MB/s"},
+             "splitter": {method: {"seconds", "paragraphs/s", "sentences", "agreement"}}}
+        """
+
+        results = {}
+        for name, (paths, mode, _, parse) in self.formats.items():
+            # Load files into memory
+            data = []
+            for path in paths:
+                with open(path, mode, encoding="utf-8" if mode == "r" else None) as f:
+                    data.append(f.read())
+
+            size = sum(os.path.getsize(path) for path in paths)
+
+            best, articles = None, 0
+            for _ in range(repeat):
+                start = time.perf_counter()
+                articles = sum(1 for x in data for article in parse(io.BytesIO(x) if mode == "rb" else io.StringIO(x)) if article)
+                elapsed = time.perf_counter() - start
+
+                best = min(best, elapsed) if best else elapsed
+
+            results[name] = {"seconds": best, "articles": articles, "articles/s": articles / best, "MB/s": size / best / 1e6}
+
+        # Text cleaning
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for sentence in self.sentences:
+                Text.transform(sentence)
+
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed) if best else elapsed
+
+        results["transform"] = {"seconds": best, "sentences": len(self.sentences), "sentences/s": len(self.sentences) / best}
+
+        # Text cleaning with the original two pass rules for comparison
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for sentence in self.sentences:
+                ParserBenchmark.twopass(sentence)
+
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed) if best else elapsed
+
+        results["transform-twopass"] = {"seconds": best, "sentences": len(self.sentences), "sentences/s": len(self.sentences) / best}
+
+        # Text cleaning of abstract paragraphs, one call per batch
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            Text.transform(self.paragraphs)
+
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed) if best else elapsed
+
+        size = sum(len(x) for x in self.paragraphs)
+        results["transform-batch"] = {
+            "seconds": best,
+            "paragraphs": len(self.paragraphs),
+            "paragraphs/s": len(self.paragraphs) / best,
+            "MB/s": size / best / 1e6,
+        }
+
+        # Sentence splitting, agreement is measured against nltk sentence boundaries
+        results["splitter"], expected = {}, None
+        for method in Splitter.METHODS:
+            splitter, best = Splitter(method), None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                sentences = splitter(self.paragraphs)
+                elapsed = time.perf_counter() - start
+
+                best = min(best, elapsed) if best else elapsed
+
+            expected = expected if expected else sentences
+            results["splitter"][method] = {
+                "seconds": best,
+                "paragraphs/s": len(self.paragraphs) / best,
+                "sentences": sum(len(x) for x in sentences),
+                "agreement": self.agreement(expected, sentences),
+            }
+
+        return results
+
+    @staticmethod
+    def twopass(text):
+        """
+        Cleans text with the original two pass rules. Content is removed in the first pass and extra spacing in the second.
+
+        Args:
+            text: input text
+
+        Returns:
+            transformed text
+        """
+
+        text = TWOPASS.sub(" ", text)
+        return re.sub(r" {2,}|\.{2,}", " ", text)
+
+    def agreement(self, expected, actual):
+        """
+        Calculates sentence boundary agreement as the F1 score of actual sentence boundaries vs expected boundaries.
+
+        Args:
+            expected: list of expected sentences per paragraph
+            actual: list of actual sentences per paragraph
+
+        Returns:
+            agreement between 0 and 1
+        """
+
+        matches, etotal, atotal = 0, 0, 0
+        for paragraph, x, y in zip(self.paragraphs, expected, actual):
+            x, y = self.boundaries(paragraph, x), self.boundaries(paragraph, y)
+            matches, etotal, atotal = matches + len(x & y), etotal + len(x), atotal + len(y)
+
+        return 2 * matches / (etotal + atotal) if etotal + atotal else 1.0
+
+    def boundaries(self, paragraph, sentences):
+        """
+        Gets the end offsets of sentences in paragraph.
+
+        Args:
+            paragraph: paragraph text
+            sentences: sentences split from paragraph
+
+        Returns:
+            set of offsets
+        """
+
+        offsets, position = set(), 0
+        for sentence in sentences:
+            position = paragraph.find(sentence, position) + len(sentence)
+            offsets.add(position)
+
+        return offsets
@@ -0,0 +1,68 @@
+"""
+Pipeline benchmark module
+"""
+
+import os
+
+from ..file.execute import Execute
+
+from .corpus import Corpus
+from .database import DatabaseBenchmark
+
+
+class PipelineBenchmark:
+    """
+    Benchmarks the full ETL pipeline on a mixed corpus for each database backend.
+    """
+
+    def __init__(self, directory, articles=30000, seed=0, urls=None):
+        """
+        Creates a new pipeline benchmark. Generates a mixed PubMed, arXiv, CSV and TEI corpus, if not already generated.
+
+        Args:
+            directory: working directory
+            articles: number of articles per format, one tenth as many TEI documents are generated
+            seed: random seed
+            urls: list of database urls, defaults to SQLite, JSON and YAML databases in the working directory
+        """
+
+        directory = os.path.join(directory, "pipeline")
+        self.data = os.path.join(directory, "data")
+
+        # Generate corpus
+        if not os.path.exists(self.data):
+            corpus = Corpus(seed)
+            corpus.pubmed(os.path.join(self.data, "pubmed.xml"), articles)
+            corpus.pubmed(os.path.join(self.data, "pubmed.xml.gz"), articles, articles + 1)
+            corpus.arxiv(os.path.join(self.data, "arxiv.xml.gz"), articles)
+            corpus.csv(os.path.join(self.data, "metadata.csv"), articles)
+            corpus.tei(self.data, max(articles // 10, 1))
+
+        self.urls = urls if urls else [f"sqlite://{directory}/sqlite", f"json://{directory}/json", f"yaml://{directory}/yaml"]
+
+    def __call__(self, repeat=1, **kwargs):
+        """
+        Runs the benchmark.
+
+        Args:
+            repeat: number of runs per database, best run is reported
+            kwargs: additional arguments passed to Execute.run
+
+        Returns:
+            {backend: run report summary}
+        """
+
+        results = {}
+        for url in self.urls:
+            best = None
+            for _ in range(repeat):
+                report = Execute.run(self.data, url, replace=True, **kwargs)
+                best = report if not best or report.seconds < best.seconds else best
+
+            # Per file statistics are excluded
+            summary = best.summary()
+            del summary["inputs"]
+
+            results[DatabaseBenchmark.backend(url)] = {"url": url, **summary}
+
+        return results
@@ -0,0 +1,97 @@
+"""
+Reader benchmark module
+"""
+
+import gzip
+import os
+import time
+
+from ..file.arx import ARX
+from ..file.csvf import CSV
+from ..file.pmb import PMB
+from ..file.reader import Reader
+
+from .corpus import Corpus
+
+
+class ReaderBenchmark:
+    """
+    Benchmarks parsing gzip compressed files with the standard gzip module and the pipelined Reader.
+    """
+
+    def __init__(self, directory, articles=30000, seed=0):
+        """
+        Creates a new reader benchmark. Generates a compressed file for each format, if not already generated.
+
+        Args:
+            directory: working directory
+            articles: number of articles per file
+            seed: random seed
+        """
+
+        directory = os.path.join(directory, "reader")
+
+        corpus = Corpus(seed)
+        self.files = {
+            "pubmed": (os.path.join(directory, "pubmed.xml.gz"), "rb", corpus.pubmed, lambda stream: PMB.parse(stream, "pubmed", None)),
+            "arxiv": (os.path.join(directory, "arxiv.xml.gz"), "rb", corpus.arxiv, lambda stream: ARX.parse(stream, "arxiv")),
+            "csv": (os.path.join(directory, "metadata.csv.gz"), "r", corpus.csv, lambda stream: CSV.parse(stream, "csv")),
+        }
+
+        for path, _, generate, _ in self.files.values():
+            if not os.path.exists(path):
+                generate(path, articles)
+
+    def __call__(self, repeat=1):
+        """
+        Runs the benchmark.
+
+        Args:
+            repeat: number of runs per format, best run is reported
+
+        Returns:
+            {format: {"gzip", "reader", "speedup", "inflate", "MB"}}
+        """
+
+        results = {}
+        for name, (path, mode, _, parse) in self.files.items():
+            # Bind the loop variables to each stream factory
+            baseline = self.time(
+                lambda path=path, mode=mode: gzip.open(path, mode) if mode == "rb" else gzip.open(path, "rt", encoding="utf-8"), parse, repeat
+            )
+            pipelined = self.time(lambda path=path, mode=mode: Reader.open(path, mode), parse, repeat)
+
+            results[name] = {
+                "gzip": baseline,
+                "reader": pipelined,
+                "speedup": baseline / pipelined,
+                "inflate": Reader.inflate(),
+                "MB": os.path.getsize(path) / 1e6,
+            }
+
+        return results
+
+    def time(self, factory, parse, repeat):
+        """
+        Times a full parse of a stream.
+
+        Args:
+            factory: opens the input stream
+            parse: parses the input stream
+            repeat: number of runs
+
+        Returns:
+            best elapsed time in seconds
+        """
+
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            with factory() as stream:
+                for _ in parse(stream):
+                    pass
+
+            elapsed = time.perf_counter() - start
+            best = min(best, elapsed) if best else elapsed
+
+        return best
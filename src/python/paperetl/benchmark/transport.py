@@ -0,0 +1,81 @@
+"""
+Transport benchmark module
+"""
+
+import os
+import sqlite3
+import time
+
+from ..file.execute import Execute
+
+from .corpus import Corpus
+
+
+class TransportBenchmark:
+    """
+    Benchmarks end-to-end ETL throughput for each batch transport method.
+    """
+
+    def __init__(self, directory, articles=30000, files=4, seed=0):
+        """
+        Creates a new transport benchmark. Generates a synthetic PubMed corpus, if not already generated.
+
+        Args:
+            directory: working directory
+            articles: number of articles per file
+            files: number of files
+            seed: random seed
+        """
+
+        self.data = os.path.join(directory, "transport", "data")
+        self.models = os.path.join(directory, "transport", "models")
+
+        # Generate corpus
+        corpus = Corpus(seed)
+        for x in range(files):
+            path = os.path.join(self.data, f"pubmed{x:04d}.xml")
+            if not os.path.exists(path):
+                corpus.pubmed(path, articles, x * articles + 1)
+
+        self.bytes = sum(os.path.getsize(os.path.join(self.data, f)) for f in os.listdir(self.data))
+
+    def __call__(self, transports=("file", "pipe", "shm"), repeat=1):
+        """
+        Runs the benchmark.
+
+        Args:
+            transports: list of transport methods to test
+            repeat: number of runs per transport, best run is reported
+
+        Returns:
+            {transport: {"seconds", "articles", "articles/s", "MB/s"}}
+        """
+
+        results = {}
+        for transport in transports:
+            best = None
+            for _ in range(repeat):
+                start = time.perf_counter()
+                Execute.run(self.data, self.models, replace=True, transport=transport)
+                elapsed = time.perf_counter() - start
+
+                best = min(best, elapsed) if best else elapsed
+
+            articles = self.count()
+            results[transport] = {"seconds": best, "articles": articles, "articles/s": articles / best, "MB/s": self.bytes / best / 1e6}
+
+        return results
+
+    def count(self):
+        """
+        Counts the number of articles loaded.
+
+        Returns:
+            number of articles
+        """
+
+        db = sqlite3.connect(os.path.join(self.models, "articles.sqlite"))
+        count = db.execute("SELECT COUNT(*) FROM articles").fetchone()[0]
+        db.close()
+
+        return count
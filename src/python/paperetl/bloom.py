@@ -0,0 +1,66 @@
+"""
+Bloom module
+"""
+
+import math
+
+
+class Bloom:
+    """
+    Bloom filter of strings. Membership tests can return false positives but never false negatives. Positions are derived
+    from Python's string hash, which is randomized per process, so filters are only valid in the process that built them.
+    """
+
+    def __init__(self, capacity, error=0.01):
+        """
+        Creates a new empty filter.
+
+        Args:
+            capacity: expected number of values
+            error: false positive rate at capacity
+        """
+
+        # Number of bits and hash functions for the expected number of values and error rate
+        self.capacity = max(capacity, 1)
+        self.size = max(int(-self.capacity * math.log(error) / math.log(2) ** 2), 64)
+        self.hashes = max(round(self.size / self.capacity * math.log(2)), 1)
+
+        self.bits = bytearray((self.size + 7) // 8)
+
+        # Number of values added, the error rate increases once over capacity
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, value):
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self.positions(value))
+
+    def add(self, value):
+        """
+        Adds a value to the filter.
+
+        Args:
+            value: string value
+        """
+
+        for position in self.positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+        self.count += 1
+
+    def positions(self, value):
+        """
+        Gets the bit positions of a value using double hashing.
+
+        Args:
+            value: string value
+
+        Returns:
+            bit positions
+        """
+
+        uid = hash(value)
+        first, second = uid & 0xFFFFFFFF, ((uid >> 32) & 0xFFFFFFFF) | 1
+
+        return [(first + x * second) % self.size for x in range(self.hashes)]
@@ -14,6 +14,9 @@ class Database:
 
         Args:
             article: article metadata and text content
+
+        Returns:
+            True if article saved, False if skipped as a duplicate
         """
 
     def complete(self):
@@ -0,0 +1,136 @@
+"""
+Date module
+"""
+
+import calendar
+import datetime
+import functools
+import re
+
+from dateutil import parser
+
+
+class Date:
+    """
+    Parses date strings. ISO-8601 dates and PubMed date parts are parsed directly, other strings are parsed with dateutil.
+    Parsed dates are the same as dateutil, missing date fields default to the current date and missing time fields
+    default to 0. Parsed strings are cached.
+    """
+
+    # ISO-8601 date with an optional time, without a time zone
+    ISO = re.compile(r"(\d{4})(?:-(\d{1,2})(?:-(\d{1,2})(?:[T ](\d{2}):(\d{2})(?::(\d{2})(?:\.(\d{1,6}))?)?)?)?)?")
+
+    # Month names and abbreviations
+    MONTHS = {
+        name: x + 1
+        for x, names in enumerate(
+            [
+                ("jan", "january"),
+                ("feb", "february"),
+                ("mar", "march"),
+                ("apr", "april"),
+                ("may",),
+                ("jun", "june"),
+                ("jul", "july"),
+                ("aug", "august"),
+                ("sep", "sept", "september"),
+                ("oct", "october"),
+                ("nov", "november"),
+                ("dec", "december"),
+            ]
+        )
+        for name in names
+    }
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def today():
+        """
+        Gets the current date. The current date is computed once per process, it's used as the entry date for articles
+        without one.
+
+        Returns:
+            current date
+        """
+
+        return datetime.datetime.combine(datetime.date.today(), datetime.time())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def parse(text):
+        """
+        Parses a date string.
+
+        Args:
+            text: date string
+
+        Returns:
+            datetime
+        """
+
+        match = Date.ISO.fullmatch(text)
+        if match:
+            year, month, day, hour, minute, second, fraction = match.groups()
+            date = Date.build(int(year), int(month) if month else None, int(day) if day else None)
+
+            # Time fields, fractional seconds are converted to microseconds
+            hour, minute, second = int(hour) if hour else 0, int(minute) if minute else 0, int(second) if second else 0
+            if date and hour < 24 and minute < 60 and second < 60:
+                return date.replace(hour=hour, minute=minute, second=second, microsecond=int(fraction.ljust(6, "0")) if fraction else 0)
+
+        return parser.parse(text, default=Date.today())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=65536)
+    def parts(year, month=None, day=None):
+        """
+        Parses a date from year, month and day strings. Months can be numbers or names.
+
+        Args:
+            year: year string
+            month: month string
+            day: day string
+
+        Returns:
+            datetime or None if all parts are empty
+        """
+
+        # Parse numeric years with an optional numeric or named month and an optional day
+        if year and year.isdigit() and len(year) == 4 and (month or not day):
+            number = int(month) if month and month.isdigit() else Date.MONTHS.get(month.lower()) if month else None
+            if (number or not month) and (not day or day.isdigit()):
+                date = Date.build(int(year), number, int(day) if day else None)
+                if date:
+                    return date
+
+        # Fallback to dateutil
+        date = "-".join(part for part in (year, month, day) if part)
+        return Date.parse(date) if date else None
+
+    @staticmethod
+    def build(year, month, day):
+        """
+        Builds a date. Missing fields default to the current date, same as dateutil.
+
+        Args:
+            year: year
+            month: month or None
+            day: day or None
+
+        Returns:
+            datetime or None if the date is invalid
+        """
+
+        # Years before 1000 are parsed by dateutil, which treats some as 2 digit years
+        if year < 1000 or (month is not None and not 1 <= month <= 12):
+            return None
+
+        default = Date.today()
+        month = month if month else default.month
+
+        # Days in month
+        days = calendar.monthrange(year, month)[1]
+        if day is not None and not 1 <= day <= days:
+            return None
+
+        return datetime.datetime(year, month, day if day else min(default.day, days))
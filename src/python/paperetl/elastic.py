@@ -86,6 +86,8 @@ class Elastic(Database):
 
             print(f"Inserted {self.rows} articles", end="\r")
 
+        return True
+
     def complete(self):
         # Load remaining buffered articles
         if self.buffer:
@@ -13,13 +13,15 @@ class Factory:
     """
 
     @staticmethod
-    def create(url, replace):
+    def create(url, replace, transaction=None, bulk=False):
         """
         Creates a new database connection.
 
         Args:
             url: connection url
             replace: if true, a new database will be created, overwriting any existing database
+            transaction: number of articles per transaction for SQLite databases, uses the default if None
+            bulk: if True, new SQLite databases are loaded in bulk-load mode
 
         Returns:
             Database
@@ -33,6 +35,6 @@ class Factory:
             return YAML(url.replace("yaml://", ""))
         if url:
             # If URL is present, assume it's SQLite
-            return SQLite(url.replace("sqlite://", ""), replace)
+            return SQLite(url.replace("sqlite://", ""), replace, transaction, bulk)
 
         return None
@@ -2,16 +2,77 @@
 Defines main entry point for ETL process.
 """
 
-import sys
+import argparse
 
 from .execute import Execute
 
+
+def parse():
+    """
+    Parses command line arguments. The original positional argument order (indir, url, config, replace, batchsize) is supported.
+
+    Returns:
+        parsed arguments
+    """
+
+    parser = argparse.ArgumentParser(description="Transforms and loads medical/scientific files into an articles database")
+    parser.add_argument("indir", help="input directory")
+    parser.add_argument("url", help="database url")
+    parser.add_argument("config", nargs="?", default=None, help="path to config directory")
+    parser.add_argument("replace", nargs="?", default="False", help="if True, an existing database is replaced")
+    parser.add_argument("batchsize", nargs="?", type=int, default=32, help="batch size")
+    parser.add_argument("--schedule", default="cost", choices=["path", "size", "cost"], help="file ordering policy")
+    parser.add_argument("--maxbatches", type=int, default=None, help="maximum number of batches in flight, defaults to 4 per worker")
+    parser.add_argument("--maxbytes", type=int, default=None, help="maximum number of serialized bytes in flight")
+    parser.add_argument("--transport", default="file", choices=["file", "pipe", "shm"], help="batch transport method")
+    parser.add_argument("--workers", type=int, default=None, help="number of worker processes, defaults to available cpus minus reserved cpus")
+    parser.add_argument("--reserve", type=int, default=0, help="number of cpus reserved for the database writer")
+    parser.add_argument("--method", default=None, choices=["fork", "forkserver", "spawn"], help="multiprocessing start method")
+    parser.add_argument("--pin", action="store_true", help="pin worker processes to cpus and the writer to reserved cpus (Linux only)")
+    parser.add_argument("--incremental", action="store_true", help="skip input files unchanged since the last run")
+    parser.add_argument("--manifest", default=None, help="path to manifest file for incremental runs, defaults to next to the database")
+    parser.add_argument("--split", type=int, default=None, help="split PubMed XML and CSV files larger than this many bytes into parts")
+    parser.add_argument("--report", default=None, help="write a JSON run report to this path")
+    parser.add_argument("--grobid", default=None, help="GROBID endpoint used to convert PDFs, defaults to http://localhost:8070")
+    parser.add_argument("--concurrency", type=int, default=None, help="maximum number of GROBID requests in flight per worker")
+    parser.add_argument("--cache", default=None, help="directory of a cache for TEI XML converted from PDFs")
+    parser.add_argument("--cachesize", type=int, default=None, help="maximum TEI cache size in bytes")
+    parser.add_argument("--shards", action="store_true", help="each worker writes a SQLite shard database, shards are merged when complete")
+    parser.add_argument("--splitter", default=None, choices=["nltk", "rules", "none"], help="sentence splitting method, defaults to nltk")
+    parser.add_argument("--transaction", type=int, default=None, help="number of articles per SQLite transaction, defaults to 1000")
+    parser.add_argument("--bulk", action="store_true", help="load new SQLite databases in bulk-load mode, a failed load must be rerun with replace")
+    parser.add_argument("--profile", default=None, help="profile worker processes and the database writer, profiles are written to this directory")
+
+    return parser.parse_args()
+
+
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        Execute.run(
-            sys.argv[1],
-            sys.argv[2],
-            sys.argv[3] if len(sys.argv) > 3 else None,
-            sys.argv[4] == "True" if len(sys.argv) > 4 else False,
-            int(sys.argv[5]) if len(sys.argv) > 5 else 32,
-        )
+    args = parse()
+
+    Execute.run(
+        args.indir,
+        args.url,
+        args.config,
+        args.replace == "True",
+        args.batchsize,
+        schedule=args.schedule,
+        maxbatches=args.maxbatches,
+        maxbytes=args.maxbytes,
+        transport=args.transport,
+        workers=args.workers,
+        reserve=args.reserve,
+        method=args.method,
+        pin=args.pin,
+        incremental=(args.manifest if args.manifest else True) if args.incremental else False,
+        split=args.split,
+        report=args.report,
+        profile=args.profile,
+        grobid=args.grobid,
+        concurrency=args.concurrency,
+        cache=args.cache,
+        cachesize=args.cachesize,
+        shards=args.shards,
+        splitter=args.splitter,
+        transaction=args.transaction,
+        bulk=args.bulk,
+    )
@@ -0,0 +1,196 @@
+"""
+Archive module
+"""
+
+import gzip
+import io
+import tarfile
+import zipfile
+
+from contextlib import contextmanager
+
+from .partition import Partition
+
+
+class Archive:
+    """
+    Reads members of tar, tar.gz and zip archives. Members are read directly from the archive, which allows each member
+    to be processed as a separate task without extracting the archive.
+
+    Plain tar members are byte ranges of the archive. Compressed tar archives are decompressed into a temporary directory
+    first, since gzip streams can't be read at arbitrary offsets. Zip members are read through the zip central directory.
+    """
+
+    # Archive formats by file name suffix
+    FORMATS = {".tar": "tar", ".tar.gz": "tgz", ".tgz": "tgz", ".zip": "zip"}
+
+    # Open zip archives, only kept open within a scope
+    ZIP = {}
+    SCOPED = False
+
+    @staticmethod
+    def format(name):
+        """
+        Gets the archive format for a file name.
+
+        Args:
+            name: file name
+
+        Returns:
+            tar, tgz, zip or None if name isn't an archive
+        """
+
+        name = name.lower()
+        for suffix, archive in Archive.FORMATS.items():
+            if name.endswith(suffix):
+                return archive
+
+        return None
+
+    @staticmethod
+    def members(path, tempdir):
+        """
+        Lists the file members of an archive.
+
+        Args:
+            path: path to archive
+            tempdir: directory for decompressed tar archives
+
+        Returns:
+            (path to readable archive, zip or tar, list of (member name, start offset, end offset))
+        """
+
+        archive = Archive.format(path)
+
+        if archive == "zip":
+            with zipfile.ZipFile(path) as f:
+                # Offsets are only used to estimate member cost, which is based on the uncompressed size as with tar members
+                members = [(info.filename, info.header_offset, info.header_offset + info.file_size) for info in f.infolist() if not info.is_dir()]
+
+            return path, "zip", members
+
+        # Decompress tar.gz archives so members can be read at arbitrary offsets
+        target = Partition.decompress(path, tempdir) if archive == "tgz" else path
+        with tarfile.open(target, "r:") as f:
+            members = [(member.name, member.offset_data, member.offset_data + member.size) for member in f if member.isfile() and not member.sparse]
+
+        return target, "tar", members
+
+    @staticmethod
+    def open(path, part, mode, compress):
+        """
+        Opens an archive member stream.
+
+        Args:
+            path: path to readable archive
+            part: archive member
+            mode: file open mode
+            compress: True if member is gzip compressed
+
+        Returns:
+            input stream
+        """
+
+        if part["archive"] == "zip":
+            stream = Archive.zipmember(path, part["member"])
+        else:
+            stream = io.BufferedReader(Member(path, part["start"], part["end"]))
+
+        if compress:
+            stream = gzip.GzipFile(fileobj=stream, mode="rb")
+
+        return io.TextIOWrapper(stream, encoding="utf-8") if mode == "r" else stream
+
+    @staticmethod
+    @contextmanager
+    def scope():
+        """
+        Keeps zip archives open while reading consecutive members of the same archive, so the central directory is only
+        read once per archive. The open archive is closed when switching archives and when the scope exits.
+        """
+
+        previous, Archive.SCOPED = Archive.SCOPED, True
+        try:
+            yield
+        finally:
+            # Nested scopes leave the archive open for the outer scope
+            if not previous:
+                Archive.release()
+
+            Archive.SCOPED = previous
+
+    @staticmethod
+    def zipmember(path, member):
+        """
+        Opens a zip archive member stream. Outside of a scope, the archive is closed once the member stream is closed.
+
+        Args:
+            path: path to zip archive
+            member: member name
+
+        Returns:
+            member stream
+        """
+
+        # Open member streams keep the underlying file open after the archive is closed
+        if not Archive.SCOPED:
+            with zipfile.ZipFile(path) as f:
+                return f.open(member)
+
+        # Close the previous archive when switching archives
+        if path not in Archive.ZIP:
+            Archive.release()
+
+            # pylint: disable=R1732
+            Archive.ZIP[path] = zipfile.ZipFile(path)
+
+        return Archive.ZIP[path].open(member)
+
+    @staticmethod
+    def release():
+        """
+        Closes open zip archives.
+        """
+
+        while Archive.ZIP:
+            _, f = Archive.ZIP.popitem()
+            f.close()
+
+
+class Member(io.RawIOBase):
+    """
+    Read-only binary stream for a byte range of a file.
+    """
+
+    def __init__(self, path, start, end):
+        """
+        Opens a new member stream.
+
+        Args:
+            path: path to file
+            start: start offset
+            end: end offset
+        """
+
+        super().__init__()
+
+        # pylint: disable=R1732
+        self.file = open(path, "rb")
+        self.file.seek(start)
+        self.remaining = end - start
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = self.file.readinto(memoryview(buffer)[: min(len(buffer), self.remaining)]) if self.remaining else 0
+
+        # Guard against files truncated while reading
+        self.remaining = self.remaining - size if size else 0
+        return size
+
+    def close(self):
+        if not self.closed:
+            self.file.close()
+
+        super().close()
@@ -3,12 +3,11 @@ arXiv XML processing module
 """
 
 import hashlib
-import re
 
 from bs4 import BeautifulSoup
-from dateutil import parser
-from nltk.tokenize import sent_tokenize
+from lxml import etree
 
+from ..date import Date
 from ..schema.article import Article
 from ..text import Text
 
@@ -21,12 +20,51 @@ class ARX:
     @staticmethod
     def parse(stream, source):
         """
-        Parses a XML datastream and yields processed articles.
+        Parses a XML datastream and yields processed articles. Entries are parsed incrementally, memory use doesn't
+        grow with the size of the feed.
+
+        Args:
+            stream: handle to input binary data stream
+            source: text string describing stream source, can be None
+        """
+
+        # Parse XML content using lxml, only end events for entry elements are generated. Elements are matched by name
+        # in any namespace.
+        # pylint: disable=c-extension-no-member
+        for _, entry in etree.iterparse(stream, events=("end",), tag="{*}entry"):
+            # Authors as (name, affiliations)
+            authors = [
+                (ARX.value(author, "name"), [Text.clean(ARX.text(x)) for x in author.iterfind(".//{*}affiliation")])
+                for author in entry.iterfind(".//{*}author")
+            ]
+
+            yield ARX.article(
+                source,
+                ARX.value(entry, "id"),
+                ARX.value(entry, "title"),
+                ARX.value(entry, "published"),
+                ARX.value(entry, "updated"),
+                ARX.value(entry, "journal_ref"),
+                authors,
+                [category.get("term") for category in entry.iterfind(".//{*}category")],
+                ARX.value(entry, "summary"),
+            )
+
+            # Free processed entry along with preceding siblings
+            entry.clear(keep_tail=False)
+            parent = entry.getparent()
+            while entry.getprevious() is not None:
+                del parent[0]
+
+    @staticmethod
+    def soup(stream, source):
+        """
+        Parses a XML datastream with BeautifulSoup and yields processed articles. This method loads the full feed into
+        memory. It's kept to compare against parse.
 
         Args:
             stream: handle to input data stream
             source: text string describing stream source, can be None
-            config: path to config directory
         """
 
         # Parse XML
@@ -34,83 +72,131 @@ class ARX:
 
         # Process each entry
         for entry in soup.find_all("entry"):
-            reference = ARX.get(entry, "id")
-            title = ARX.get(entry, "title")
-            published = parser.parse(ARX.get(entry, "published").split("T")[0])
-            updated = parser.parse(ARX.get(entry, "updated").split("T")[0])
+            # Authors as (name, affiliations)
+            authors = [
+                (ARX.get(author, "name"), [Text.clean(affiliation.text) for affiliation in author.find_all("arxiv:affiliation")])
+                for author in entry.find_all("author")
+            ]
 
-            # Derive uid
-            uid = hashlib.sha1(reference.encode("utf-8")).hexdigest()
+            yield ARX.article(
+                source,
+                ARX.get(entry, "id"),
+                ARX.get(entry, "title"),
+                ARX.get(entry, "published"),
+                ARX.get(entry, "updated"),
+                ARX.get(entry, "arxiv:journal_ref"),
+                authors,
+                [category.get("term") for category in entry.find_all("category")],
+                ARX.get(entry, "summary"),
+            )
 
-            # Get journal reference
-            journal = ARX.get(entry, "arxiv:journal_ref")
+    @staticmethod
+    def article(source, reference, title, published, updated, journal, authors, categories, summary):
+        """
+        Builds an article from entry fields.
 
-            # Get authors
-            authors, affiliations, affiliation = ARX.authors(entry.find_all("author"))
+        Args:
+            source: text string describing stream source, can be None
+            reference: entry id
+            title: entry title
+            published: published date string
+            updated: updated date string
+            journal: journal reference
+            authors: list of (name, list of affiliations)
+            categories: list of category terms
+            summary: summary text
 
-            # Get tags
-            tags = "; ".join(["ARX"] + [category.get("term") for category in entry.find_all("category")])
+        Returns:
+            Article
+        """
 
-            # Transform section text
-            sections = ARX.sections(title, ARX.get(entry, "summary"))
+        # Parse dates
+        published = Date.parse(published.split("T")[0])
+        updated = Date.parse(updated.split("T")[0])
+
+        # Derive uid
+        uid = hashlib.sha1(reference.encode("utf-8")).hexdigest()
+
+        # Get authors
+        authors, affiliations, affiliation = ARX.authors(authors)
+
+        # Get tags
+        tags = "; ".join(["ARX"] + categories)
+
+        # Transform section text
+        sections = ARX.sections(title, summary)
+
+        # Article metadata - id, source, published, publication, authors, affiliations, affiliation, title,
+        #                    tags, reference, entry date
+        metadata = (
+            uid,
+            source,
+            published,
+            journal,
+            authors,
+            affiliations,
+            affiliation,
+            title,
+            tags,
+            reference,
+            updated,
+        )
 
-            # Article metadata - id, source, published, publication, authors, affiliations, affiliation, title,
-            #                    tags, reference, entry date
-            metadata = (
-                uid,
-                source,
-                published,
-                journal,
-                authors,
-                affiliations,
-                affiliation,
-                title,
-                tags,
-                reference,
-                updated,
-            )
+        return Article(metadata, sections)
+
+    @staticmethod
+    def value(element, name):
+        """
+        Finds the first descendant of element with name in any namespace and returns the element text.
+
+        Args:
+            element: XML element
+            name: element name
+
+        Returns:
+            string
+        """
 
-            yield Article(metadata, sections)
+        element = element.find(f".//{{*}}{name}")
+        return Text.clean(ARX.text(element)) if element is not None else None
 
     @staticmethod
-    def get(element, path):
+    def text(element):
         """
-        Finds the first matching path in element and returns the element text.
+        Flattens elements into a single text string.
 
         Args:
             element: XML element
-            path: path expression
 
         Returns:
             string
         """
 
-        element = element.find(path)
-        return ARX.clean(element.text) if element else None
+        return "".join(element.itertext())
 
     @staticmethod
-    def clean(text):
+    def get(element, path):
         """
-        Removes newlines and extra spacing from text.
+        Finds the first matching path in element and returns the element text.
 
         Args:
-            text: text to clean
+            element: XML element
+            path: path expression
 
         Returns:
-            clean text
+            string
         """
 
-        # Remove newlines and cleanup spacing
-        text = text.replace("\n", " ")
-        return re.sub(r"\s+", " ", text).strip()
+        element = element.find(path)
+        return Text.clean(element.text) if element else None
 
     @staticmethod
     def authors(elements):
         """
-        Parses authors and associated affiliations from the article.
+        Builds author and affiliation fields for the article.
 
         Args:
-            elements: authors elements
+            elements: list of (author name, list of affiliations)
 
         Returns:
             (semicolon separated list of authors, semicolon separated list of affiliations, primary affiliation)
@@ -119,13 +205,12 @@ class ARX:
         authors = []
         affiliations = []
 
-        for author in elements:
+        for name, names in elements:
             # Create authors as lastname, firstname
-            name = ARX.get(author, "name")
             authors.append(", ".join(name.rsplit(maxsplit=1)[::-1]))
 
             # Add affiliations
-            affiliations.extend([ARX.clean(affiliation.text) for affiliation in author.find_all("arxiv:affiliation")])
+            affiliations.extend(names)
 
         return (
             "; ".join(authors),
@@ -153,6 +238,6 @@ class ARX:
         text = Text.transform(text)
 
         # Split text into sentences, transform text and add to sections
-        sections.extend([("ABSTRACT", x) for x in sent_tokenize(text)])
+        sections.extend([("ABSTRACT", x) for x in Text.sentences(text)])
 
         return sections
@@ -0,0 +1,144 @@
+"""
+Cache module
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+
+
+class Cache:
+    """
+    On-disk cache of TEI XML converted from PDFs. Entries are keyed by the PDF content hash and the GROBID settings used
+    for conversion and stored gzip compressed. Least recently used entries are evicted once the cache exceeds its
+    maximum size. Entries are written atomically, so a cache can be shared by multiple processes.
+    """
+
+    # Cache entry file extension
+    EXTENSION = ".xml.gz"
+
+    def __init__(self, directory, maxsize=None):
+        """
+        Creates a new cache.
+
+        Args:
+            directory: cache directory
+            maxsize: maximum cache size in bytes, unlimited if None
+        """
+
+        self.directory, self.maxsize = directory, maxsize
+        os.makedirs(directory, exist_ok=True)
+
+    @staticmethod
+    def key(data, settings):
+        """
+        Builds a cache key.
+
+        Args:
+            data: PDF bytes
+            settings: dict of conversion settings
+
+        Returns:
+            cache key
+        """
+
+        digest = hashlib.sha256(data)
+        digest.update(json.dumps(settings, sort_keys=True).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def get(self, key):
+        """
+        Gets a cached entry.
+
+        Args:
+            key: cache key
+
+        Returns:
+            TEI XML string or None if not cached
+        """
+
+        path = self.path(key)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                xml = f.read()
+
+            # Mark as recently used
+            os.utime(path)
+            return xml
+
+        # Missing, evicted or partially removed entry
+        except (OSError, EOFError):
+            return None
+
+    def put(self, key, xml):
+        """
+        Stores an entry.
+
+        Args:
+            key: cache key
+            xml: TEI XML string
+        """
+
+        path = self.path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Write to a temporary file and replace to prevent partially written entries
+        descriptor, temp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as f, gzip.open(f, "wt", encoding="utf-8") as output:
+                output.write(xml)
+
+            os.replace(temp, path)
+        except Exception:
+            # Remove temporary file when the write fails
+            if os.path.exists(temp):
+                os.remove(temp)
+            raise
+
+    def evict(self):
+        """
+        Removes least recently used entries until the cache is within its maximum size.
+
+        Returns:
+            number of entries removed
+        """
+
+        if self.maxsize is None:
+            return 0
+
+        # Cache entries sorted by last use
+        entries = []
+        for root, _, files in os.walk(self.directory):
+            for f in files:
+                if f.endswith(Cache.EXTENSION):
+                    stat = os.stat(os.path.join(root, f))
+                    entries.append((stat.st_mtime, stat.st_size, os.path.join(root, f)))
+
+        entries.sort()
+
+        total, removed = sum(size for _, size, _ in entries), 0
+        for _, size, path in entries:
+            if total <= self.maxsize:
+                break
+
+            os.remove(path)
+            total -= size
+            removed += 1
+
+        return removed
+
+    def path(self, key):
+        """
+        Gets the path of a cache entry. Entries are grouped into subdirectories by key prefix.
+
+        Args:
+            key: cache key
+
+        Returns:
+            path to entry
+        """
+
+        return os.path.join(self.directory, key[:2], key + Cache.EXTENSION)
@@ -0,0 +1,104 @@
+"""
+Channel module
+"""
+
+from queue import Empty
+
+
+class Channel:
+    """
+    Bounded channel for passing batches from worker processes to the main process. Limits the number of batches and/or
+    the number of bytes in flight. Worker processes block when the main process falls behind.
+    """
+
+    def __init__(self, context, maxbatches=0, maxbytes=0):
+        """
+        Creates a new channel.
+
+        Args:
+            context: multiprocessing context
+            maxbatches: maximum number of messages in flight, 0 for unlimited
+            maxbytes: maximum number of serialized bytes in flight, 0 for unlimited
+        """
+
+        self.queue = context.Queue(maxbatches if maxbatches else 0)
+        self.maxbytes = maxbytes if maxbytes else 0
+
+        # Shared byte budget, only used when maxbytes is set
+        self.used = context.Value("q", 0, lock=False)
+        self.condition = context.Condition()
+
+    def reserve(self, size):
+        """
+        Reserves size bytes from the channel budget. Blocks until enough bytes have been released. A single message larger
+        than the budget is allowed when no other bytes are in flight.
+
+        Args:
+            size: number of bytes
+        """
+
+        if self.maxbytes and size:
+            with self.condition:
+                self.condition.wait_for(lambda: not self.used.value or self.used.value + size <= self.maxbytes)
+                self.used.value += size
+
+    def release(self, size):
+        """
+        Releases size bytes back to the channel budget.
+
+        Args:
+            size: number of bytes
+        """
+
+        if self.maxbytes and size:
+            with self.condition:
+                self.used.value -= size
+                self.condition.notify_all()
+
+    def put(self, message, size=0):
+        """
+        Writes a message to the channel. Blocks when the maximum number of messages are in flight.
+
+        Args:
+            message: message
+            size: number of bytes reserved for this message
+        """
+
+        self.queue.put((message, size))
+
+    def get(self, timeout=None):
+        """
+        Reads the next message from the channel.
+
+        Args:
+            timeout: seconds to wait for a message, waits indefinitely if None
+
+        Returns:
+            (message, size)
+        """
+
+        return self.queue.get(timeout=timeout)
+
+    def drain(self):
+        """
+        Reads all messages remaining in the channel without blocking. Only call once all writers have stopped.
+
+        Returns:
+            list of (message, size)
+        """
+
+        messages = []
+        try:
+            while True:
+                messages.append(self.queue.get(block=False))
+        except Empty:
+            pass
+
+        return messages
+
+    def close(self):
+        """
+        Closes the channel.
+        """
+
+        self.queue.close()
@@ -2,102 +2,146 @@
 CSV processing module
 """
 
-import csv
-import datetime
-
-from dateutil import parser
+import pandas as pd
 
+from ..date import Date
 from ..schema.article import Article
 
 
 class CSV:
     """
-    Methods to transform CSVs into article objects.
+    Methods to transform CSVs into article objects. CSVs are read in chunks of rows with pandas and each chunk is
+    processed column-wise.
     """
 
+    # Number of rows read per chunk
+    CHUNKSIZE = 10000
+
+    # Article metadata - id, source, published, publication, authors, affiliations, affiliation, title,
+    #                    tags, reference, entry date
+    FIELDS = ("id", "source", "published", "publication", "authors", "affiliations", "affiliation", "title", "tags", "reference", "entry")
+
     @staticmethod
-    def parse(stream, source):
+    def parse(stream, source, chunksize=None):
         """
         Parses a CSV datastream and yields processed articles.
 
         Args:
             stream: handle to input data stream
             source: text string describing stream source, can be None
+            chunksize: number of rows read per chunk, defaults to CHUNKSIZE
         """
 
-        for row in csv.DictReader(stream):
+        # Default entry date for rows without one
+        today = Date.today()
+
+        # Read all values as strings, empty values are kept as empty strings. Fields past the header are ignored, same as
+        # csv.DictReader. Selecting all columns with usecols drops these fields without a warning.
+        try:
+            chunks = pd.read_csv(
+                stream,
+                dtype=str,
+                keep_default_na=False,
+                na_filter=False,
+                index_col=False,
+                usecols=lambda column: True,
+                chunksize=chunksize if chunksize else CSV.CHUNKSIZE,
+                encoding="utf-8",
+            )
+        except pd.errors.EmptyDataError:
+            # Empty file
+            return
+
+        for chunk in chunks:
             # Parse metadata
-            metadata = CSV.metadata(row, source)
+            metadata = CSV.metadata(chunk, source, today)
 
             # Parse sections
-            sections = CSV.sections(row)
+            sections = CSV.sections(chunk)
 
-            yield Article(metadata, sections)
+            for x, y in zip(metadata, sections):
+                yield Article(x, y)
 
     @staticmethod
-    def metadata(row, source):
+    def metadata(chunk, source, today):
         """
-        Parses a metadata tuple from input CSV row.
+        Parses metadata tuples from a chunk of input CSV rows.
 
         Args:
-            row: dict record with fields
+            chunk: DataFrame of rows
             source: text string describing stream source, can be None
+            today: default entry date
 
         Returns:
-            metadata tuple
+            list of metadata tuples
         """
 
-        # Article metadata - id, source, published, publication, authors, affiliations, affiliation, title,
-        #                    tags, reference, entry date
-        fields = (
-            "id",
-            "source",
-            "published",
-            "publication",
-            "authors",
-            "affiliations",
-            "affiliation",
-            "title",
-            "tags",
-            "reference",
-            "entry",
-        )
-
-        metadata = []
-        for field in fields:
-            value = None
-            if field == "source":
-                value = row.get(field, source)
-            elif field == "entry":
+        columns = []
+        for field in CSV.FIELDS:
+            if field == "entry":
                 # Parse date field if found, otherwise use current date
-                value = row.get(field)
-                value = parser.parse(value if value else datetime.datetime.now().strftime("%Y-%m-%d"))
+                columns.append(CSV.dates(CSV.column(chunk, field), today))
             else:
-                value = row.get(field)
+                columns.append(CSV.column(chunk, field, source if field == "source" else None))
 
-            metadata.append(value)
+        return list(zip(*columns))
+
+    @staticmethod
+    def dates(values, default):
+        """
+        Parses a column of date strings. ISO dates are parsed column-wise with pandas. Other formats are parsed with
+        dateutil, once per distinct value.
+
+        Args:
+            values: list of date strings
+            default: date for empty values
+
+        Returns:
+            list of dates
+        """
 
-        return tuple(metadata)
+        # Parse ISO dates, other values are set to NaT
+        dates = pd.to_datetime(pd.Series(values, dtype=object), format="%Y-%m-%d", errors="coerce")
+        missing, dates = dates.isna().tolist(), dates.dt.to_pydatetime().tolist()
+
+        # Parse remaining dates
+        other = {value: Date.parse(value) for value, flag in zip(values, missing) if value and flag}
+
+        return [(other[value] if value else default) if flag else date for value, flag, date in zip(values, missing, dates)]
 
     @staticmethod
-    def sections(row):
+    def sections(chunk):
         """
-        Parses section text data from input CSV row.
+        Parses section text data from a chunk of input CSV rows.
 
         Args:
-            row: dict record with fields
+            chunk: DataFrame of rows
 
         Returns:
-            list of sections
+            list of sections per row
+        """
+
+        # Start with title as text and append abstract if available. Create single section from text.
+        return [
+            [(None, f"{title} {abstract}" if abstract else title)]
+            for title, abstract in zip(CSV.column(chunk, "title"), CSV.column(chunk, "abstract"))
+        ]
+
+    @staticmethod
+    def column(chunk, field, default=None):
         """
+        Gets the values of a column. Rows missing the column are set to None.
+
+        Args:
+            chunk: DataFrame of rows
+            field: column name
+            default: value for all rows when the column doesn't exist
 
-        # Start with title as text
-        text = row.get("title")
+        Returns:
+            list of values
+        """
 
-        # Append abstract if available
-        abstract = row.get("abstract")
-        if abstract:
-            text += " " + abstract
+        if field not in chunk:
+            return [default] * len(chunk)
 
-        # Create single section from text
-        return [(None, text)]
+        return chunk[field].astype(object).where(chunk[field].notna(), None).tolist()
@@ -2,20 +2,28 @@
 Transforms and loads medical/scientific files into an articles database.
 """
 
-import gzip
+import multiprocessing
 import os
-import pickle
+import shutil
 import tempfile
-
-from multiprocessing import Process, Queue
+import time
 
 from ..factory import Factory
-
-from .arx import ARX
-from .csvf import CSV
-from .pdf import PDF
-from .pmb import PMB
-from .tei import TEI
+from ..metrics import Metrics
+from ..sqlite import SQLite
+
+from .cache import Cache
+from .channel import Channel
+from .manifest import Manifest
+from .options import Options
+from .pool import Pool
+from .profiler import Profiler
+from .report import Report
+from .schedule import Schedule
+from .stream import Stream
+from .tasks import Tasks
+from .transport import Transport
+from .worker import Worker
 
 
 class Execute:
@@ -23,234 +31,199 @@ class Execute:
     Transforms and loads medical/scientific files into an articles database.
     """
 
-    # Completion process signal
-    COMPLETE = 1
-
     @staticmethod
-    def mode(source, extension):
+    def run(indir, url, config=None, replace=False, batchsize=32, **kwargs):
         """
-        Determines file open mode for source file.
+        Main execution method.
 
         Args:
-            source: text string describing stream source
-            extension: data format
+            indir: input directory
+            url: database url
+            config: path to config directory, if any
+            replace: if true, a new database will be created, overwriting any existing database
+            batchsize: batch size
+            kwargs: additional options, see Options
 
         Returns:
-            file open mode
-        """
-
-        return "rb" if extension == "pdf" or (source and source.lower().startswith("pubmed")) else "r"
-
-    @staticmethod
-    def parse(path, source, extension, compress, config):
-        """
-        Parses articles from file at path.
-
-        Args:
-            path: path to input file
-            source: text string describing stream source
-            extension: data format
-            config: path to config directory
+            Report
         """
 
-        print(f"Processing: {path}")
+        options = Options(batchsize=batchsize, **kwargs)
 
-        # Determine if file needs to be open in binary or text mode
-        mode = Execute.mode(source, extension)
+        processes, inputs, outputs, affinity, tempdir = None, None, None, None, None
+        summary = Report()
+        try:
+            # Build database connection
+            db = Factory.create(url, replace, options["transaction"], options["bulk"])
+            if options["shards"] and not isinstance(db, SQLite):
+                raise ValueError("Shards require a SQLite database")
 
-        with gzip.open(path, mode) if compress else open(path, mode, encoding="utf-8" if mode == "r" else None) as stream:
-            if extension == "pdf":
-                yield PDF.parse(stream, source)
-            elif extension == "xml":
-                if source and source.lower().startswith("arxiv"):
-                    yield from ARX.parse(stream, source)
-                elif source and source.lower().startswith("pubmed"):
-                    yield from PMB.parse(stream, source, config)
-                else:
-                    yield TEI.parse(stream, source)
-            elif extension == "csv":
-                yield from CSV.parse(stream, source)
+            # Create inputs queue
+            context = multiprocessing.get_context(options["method"])
+            inputs = context.Queue()
 
-    @staticmethod
-    def process(inputs, outputs, batchsize):
-        """
-        Main worker process loop. Processes file paths stored in inputs and writes articles
-        to outputs. Writes a final message upon completion.
+            # Load manifest of processed files. A new database discards the manifest, files it lists aren't in the database.
+            manifest, incremental = None, options["incremental"]
+            if incremental:
+                created = replace or (isinstance(db, SQLite) and db.created)
+                manifest = Manifest(incremental if isinstance(incremental, str) else Manifest.location(url), indir, config, created)
 
-        Args:
-            inputs: inputs queue
-            outputs: outputs queue
-            batchsize: batch size
-        """
+            # Scan input directory and add files to inputs queue
+            schedule = Schedule(options["schedule"])
+            tempdir = tempfile.mkdtemp()
+            tasks = Tasks.scan(indir, config, schedule, manifest, options["split"], tempdir)
 
-        batch = []
-        try:
-            # Process until inputs queue is exhausted
-            while not inputs.empty():
-                params = inputs.get()
-
-                # Parse file and save successfully parsed (not None) results
-                for result in Execute.parse(*params):
-                    if result:
-                        batch.append(result)
-                        if len(batch) == batchsize:
-                            outputs.put(Execute.serialize(batch))
-                            batch = []
+            # Create bounded outputs channel
+            workers, cpus, writer = Pool.cpus(len(tasks), options["workers"], options["reserve"], options["pin"])
+            outputs = Channel(context, workers * 4 if options["maxbatches"] is None else options["maxbatches"], options["maxbytes"])
 
-        finally:
-            # Final batch
-            if batch:
-                outputs.put(Execute.serialize(batch))
+            # Start worker processes
+            paths = [db.shard(f"worker-{x}") for x in range(workers)] if options["shards"] else None
+            summary.launch()
+            processes = Pool.start(context, inputs, outputs, options.worker(manifest=bool(manifest)), cpus, paths)
 
-            # Write message that process is complete
-            outputs.put(Execute.COMPLETE)
+            # Write tasks to inputs queue followed by end of work sentinels
+            Tasks.dispatch(inputs, tasks, 0, len(tasks), len(processes))
 
-    @staticmethod
-    def serialize(batch):
-        """
-        Saves a batch of data to a temporary file for later processing.
-
-        Args:
-            batch to save
+            # Pin main process to reserved cpus
+            if writer:
+                affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, writer)
 
-        Returns:
-            temporary file name
-        """
+            # Start writer profiler
+            profiler = Profiler(options["profile"], "writer") if options["profile"] else None
+            if profiler:
+                profiler.start()
 
-        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as output:
-            # Serialize batch to temporary file
-            pickle.dump(batch, output)
+            # Read results from worker processes and save to database
+            Execute.save(processes, outputs, options["transport"], db, summary, manifest)
 
-            # Temporary file name
-            return output.name
+            # Complete and close database, merges shard databases
+            start = time.perf_counter()
+            db.complete()
+            db.close()
 
-    @staticmethod
-    def scan(indir, config, inputs):
-        """
-        Scans for files in indir and writes to inputs queue.
+            if options["shards"]:
+                summary.merged(db.aindex, time.perf_counter() - start)
 
-        Args:
-            indir: input directory
-            config: path to config directory, if any
-            inputs: inputs queue
+            if profiler:
+                profiler.stop()
 
-        Returns:
-            total number of items put into inputs queue
-        """
+            # Save manifest after all articles are committed
+            if manifest:
+                manifest.save()
 
-        # Total number of files put into input queue
-        total = 0
+            # Wait for processes to terminate
+            for process in processes:
+                process.join()
 
-        # Recursively walk directory looking for files
-        for root, _, files in sorted(os.walk(indir)):
-            for f in sorted(files):
-                # Extract file extension
-                parts = f.lower().split(".")
-                extension, compress = (parts[-2], True) if parts[-1] == "gz" else (parts[-1], False)
+            return Execute.complete(summary, schedule, options)
 
-                # Check if file ends with accepted extension
-                if any(extension for ext in ["csv", "pdf", "xml"] if ext == extension):
-                    # Build full path to file
-                    path = os.path.join(root, f)
+        finally:
+            # Restore main process cpu affinity
+            if affinity:
+                os.sched_setaffinity(0, affinity)
 
-                    # Write parameters to inputs queue
-                    inputs.put((path, f, extension, compress, config))
-                    total += 1
+            # Delete decompressed files
+            if tempdir:
+                shutil.rmtree(tempdir, ignore_errors=True)
 
-        return total
+            Pool.close(processes, inputs, outputs, options["transport"])
 
     @staticmethod
-    def save(processes, outputs, db):
+    def complete(summary, schedule, options):
         """
-        Main consumer loop that saves articles created by worker processes.
+        Completes a run. Evicts cache entries, merges profiles and writes the run report.
 
         Args:
-            processes: list of worker processes
-            outputs: outputs queue
-            db: output database
-        """
-
-        # Read output from worker processes
-        empty, complete = False, 0
-        while not empty:
-            # Get next result
-            result = outputs.get()
+            summary: run report
+            schedule: schedule used to order files
+            options: Options
 
-            # Mark process as complete if all workers are complete and output queue is empty
-            if result == Execute.COMPLETE:
-                complete += 1
-                empty = len(processes) == complete and outputs.empty()
-
-            # Save article, this method will skip duplicates based on entry date
-            elif result:
-                with open(result, "rb") as f:
-                    for x in pickle.load(f):
-                        db.save(x)
+        Returns:
+            Report
+        """
 
-                # Delete temporary file
-                os.remove(result)
+        # Evict least recently used cache entries
+        if options["cache"] and options["cachesize"]:
+            Cache(options["cache"], options["cachesize"]).evict()
 
-    @staticmethod
-    def close(processes, inputs, outputs):
-        """
-        Closes open processes and queues.
+        # Merge worker and writer profiles
+        if options["profile"]:
+            for path in Profiler.merge(options["profile"]):
+                print(f"Profile written to {path}")
 
-        Args:
-            processes: list of processes
-            inputs: input queue
-            outputs: output queue
-        """
+        # Compare predicted and actual makespan
+        summary.complete(schedule.report(summary.elapsed))
+        print(summary)
 
-        if processes:
-            # Close processes
-            for process in processes:
-                process.close()
+        # Write run report
+        if options["report"]:
+            summary.write(options["report"])
 
-            # Close queues
-            inputs.close()
-            outputs.close()
+        return summary
 
     @staticmethod
-    def run(indir, url, config=None, replace=False, batchsize=32):
+    def stream(indir, config=None, batchsize=32, **kwargs):
         """
-        Main execution method.
+        Parses files in indir with worker processes and yields articles, without writing to a database. See Stream for
+        details on memory limits and orderings.
 
         Args:
             indir: input directory
-            url: database url
             config: path to config directory, if any
-            replace: if true, a new database will be created, overwriting any existing database
             batchsize: batch size
-        """
+            kwargs: additional options, see Options
 
-        processes, inputs, outputs = None, None, None
-        try:
-            # Build database connection
-            db = Factory.create(url, replace)
-
-            # Create queues
-            inputs, outputs = Queue(), Queue()
+        Returns:
+            generator of articles
+        """
 
-            # Scan input directory and add files to inputs queue
-            total = Execute.scan(indir, config, inputs)
+        return Stream.articles(indir, config, Options(batchsize=batchsize, **kwargs))
 
-            # Start worker processes
-            processes = []
-            for _ in range(min(total, os.cpu_count())):
-                process = Process(target=Execute.process, args=(inputs, outputs, batchsize))
-                process.start()
-                processes.append(process)
+    @staticmethod
+    def save(processes, outputs, transport, db, report, manifest=None):
+        """
+        Main consumer loop that saves articles created by worker processes. Runs until every worker process
+        has written a completion message.
 
-            # Read results from worker processes and save to database
-            Execute.save(processes, outputs, db)
+        Args:
+            processes: list of worker processes
+            outputs: outputs channel
+            transport: batch transport method
+            db: output database
+            report: run report, collects worker, file and writer statistics
+            manifest: records processed files in this manifest, if set
+        """
 
-            # Complete and close database
-            db.complete()
-            db.close()
+        Metrics.clear()
 
-            # Wait for processes to terminate
-            for process in processes:
-                process.join()
+        reader = Transport.create(transport)
 
-        finally:
-            Execute.close(processes, inputs, outputs)
+        # Read output from worker processes
+        for (message, (result, files, _)), size in Pool.receive(processes, outputs):
+            # Mark process as complete
+            if message == Worker.COMPLETE:
+                report.worker(result)
+
+            # Save article, this method will skip duplicates based on entry date. Batches are empty when worker processes
+            # save articles to shard databases.
+            elif result is not None:
+                start = time.perf_counter()
+                articles = reader.read(result)
+                Metrics.add("deserialize", time.perf_counter() - start)
+
+                start = time.perf_counter()
+                for x in articles:
+                    report.save(db.save(x))
+                Metrics.add("insert", time.perf_counter() - start)
+
+                # Release bytes back to the outputs channel
+                outputs.release(size)
+
+            # Record processed files
+            report.add(files)
+            if manifest:
+                manifest.add(files)
+
+        report.writer = Metrics.snapshot()
@@ -0,0 +1,344 @@
+"""
+GROBID module
+"""
+
+import time
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+import requests
+
+from requests.adapters import HTTPAdapter
+
+from .cache import Cache
+
+
+class Grobid:
+    """
+    GROBID web service client. Requests share a pooled HTTP session. PDFs can be submitted for background conversion,
+    which keeps multiple requests in flight. The number of requests in flight adapts to server latency and load.
+    Converted TEI XML is stored in an optional cache, cached PDFs aren't sent to the server again.
+    """
+
+    # Default GROBID endpoint
+    URL = "http://localhost:8070"
+
+    # Full text conversion service
+    SERVICE = "/api/processFulltextDocument"
+
+    # Version service
+    VERSION = "/api/version"
+
+    # Default maximum number of requests in flight
+    CONCURRENCY = 4
+
+    # Clients by endpoint
+    CLIENTS = {}
+
+    @staticmethod
+    def client(url=None, cache=None):
+        """
+        Gets a shared client for url.
+
+        Args:
+            url: GROBID endpoint, defaults to URL
+            cache: TEI cache directory, if any
+
+        Returns:
+            Grobid
+        """
+
+        url = url if url else Grobid.URL
+        if (url, cache) not in Grobid.CLIENTS:
+            Grobid.CLIENTS[(url, cache)] = Grobid(url, cache=Cache(cache) if cache else None)
+
+        return Grobid.CLIENTS[(url, cache)]
+
+    def __init__(self, url=None, concurrency=None, retries=5, timeout=300, cache=None):
+        """
+        Creates a new GROBID client.
+
+        Args:
+            url: GROBID endpoint, defaults to URL
+            concurrency: maximum number of requests in flight, defaults to CONCURRENCY
+            retries: maximum number of retries for a request when the server is busy (503)
+            timeout: request timeout in seconds
+            cache: TEI cache, if any
+        """
+
+        self.endpoint = (url if url else Grobid.URL).rstrip("/")
+        self.url = self.endpoint + Grobid.SERVICE
+        self.concurrency = concurrency if concurrency else Grobid.CONCURRENCY
+        self.retries, self.timeout = retries, timeout
+
+        # Pooled HTTP session
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        # Adaptive limit on requests in flight
+        self.limiter = Limiter(self.concurrency)
+
+        # Background conversions, created on first submit
+        self.executor, self.pending = None, {}
+
+        # Converted TEI cache and conversion settings, settings are read on first use
+        self.cache, self.parameters = cache, None
+
+    def convert(self, data):
+        """
+        Converts a PDF to TEI XML. Retries with backoff while the server is busy.
+
+        Args:
+            data: PDF bytes or file-like stream
+
+        Returns:
+            TEI XML string or None if conversion failed
+        """
+
+        key = None
+        if self.cache:
+            # Check cache
+            data = data.read() if hasattr(data, "read") else data
+            key = Cache.key(data, self.settings())
+
+            xml = self.cache.get(key)
+            if xml:
+                return xml
+
+        xml = self.request(data)[0]
+        if xml and key:
+            self.cache.put(key, xml)
+
+        return xml
+
+    def settings(self):
+        """
+        Gets the conversion settings used to build cache keys. Settings include the GROBID version. When the version
+        can't be read, the endpoint is used instead.
+
+        Returns:
+            dict of settings
+        """
+
+        if not self.parameters:
+            version = None
+            try:
+                response = self.session.get(self.endpoint + Grobid.VERSION, timeout=self.timeout)
+                version = response.text.strip() if response.ok else None
+            except requests.RequestException:
+                pass
+
+            self.parameters = {"service": Grobid.SERVICE}
+            self.parameters.update({"version": version} if version else {"url": self.endpoint})
+
+        return self.parameters
+
+    def request(self, data):
+        """
+        Runs a conversion request.
+
+        Args:
+            data: PDF bytes or file-like stream
+
+        Returns:
+            (TEI XML string or None, elapsed seconds of the successful request, number of busy responses)
+        """
+
+        busy = 0
+        for attempt in range(self.retries + 1):
+            start = time.perf_counter()
+            try:
+                response = self.session.post(self.url, files={"input": data}, timeout=self.timeout)
+            except requests.RequestException as error:
+                print(f"Failed to process file - {error}")
+                return None, time.perf_counter() - start, busy
+
+            # Server busy, wait and retry
+            if response.status_code == 503 and attempt < self.retries:
+                busy += 1
+                time.sleep(Grobid.backoff(response, attempt))
+
+                # Rewind streams before retrying
+                if hasattr(data, "seek"):
+                    data.seek(0)
+
+                continue
+
+            # Validate request was successful
+            if not response.ok:
+                print(f"Failed to process file - {response.text}")
+                return None, time.perf_counter() - start, busy
+
+            return response.text, time.perf_counter() - start, busy
+
+        return None, 0.0, busy
+
+    @staticmethod
+    def backoff(response, attempt):
+        """
+        Gets the number of seconds to wait before retrying a busy request. Uses the Retry-After header, if available.
+
+        Args:
+            response: HTTP response
+            attempt: attempt number
+
+        Returns:
+            seconds to wait
+        """
+
+        retry = response.headers.get("Retry-After") if response.headers else None
+        if retry and retry.isdigit():
+            return int(retry)
+
+        return min(0.5 * 2**attempt, 30)
+
+    def submit(self, item, data):
+        """
+        Submits a PDF for background conversion. Blocks while the number of requests in flight is at the limit.
+
+        Args:
+            item: item returned with the result
+            data: PDF bytes
+
+        Returns:
+            list of completed conversions - (item, TEI XML string or None, elapsed seconds)
+        """
+
+        if not self.executor:
+            self.executor = ThreadPoolExecutor(self.concurrency)
+
+        completed = []
+
+        # Check cache
+        key = Cache.key(data, self.settings()) if self.cache else None
+        xml = self.cache.get(key) if key else None
+        if xml:
+            completed.append((item, xml, 0.0))
+        else:
+            # Wait for requests to complete while at the limit
+            while len(self.pending) >= self.limiter.value():
+                completed.extend(self.collect(FIRST_COMPLETED))
+
+            self.pending[self.executor.submit(self.request, data)] = (item, len(data), key)
+
+        # Collect any other completed requests without waiting
+        completed.extend(self.collect(None, 0))
+
+        return completed
+
+    def complete(self):
+        """
+        Waits for all submitted conversions to complete.
+
+        Returns:
+            list of completed conversions - (item, TEI XML string or None, elapsed seconds)
+        """
+
+        completed = []
+        while self.pending:
+            completed.extend(self.collect(FIRST_COMPLETED))
+
+        return completed
+
+    def collect(self, condition, timeout=None):
+        """
+        Collects completed requests and updates the limit on requests in flight.
+
+        Args:
+            condition: wait condition, only waits when set
+            timeout: maximum time to wait in seconds
+
+        Returns:
+            list of completed conversions - (item, TEI XML string or None, elapsed seconds)
+        """
+
+        if not self.pending:
+            return []
+
+        done, _ = wait(self.pending, timeout=timeout, return_when=condition if condition else FIRST_COMPLETED)
+
+        completed = []
+        for future in done:
+            item, size, key = self.pending.pop(future)
+            xml, seconds, busy = future.result()
+
+            self.limiter.update(seconds / max(size, 1), busy)
+
+            # Store converted TEI
+            if xml and key:
+                self.cache.put(key, xml)
+            completed.append((item, xml, seconds))
+
+        return completed
+
+    def close(self):
+        """
+        Waits for pending requests and closes the session.
+        """
+
+        if self.executor:
+            self.executor.shutdown()
+            self.executor, self.pending = None, {}
+
+        self.session.close()
+
+
+class Limiter:
+    """
+    Adaptive limit on requests in flight. Uses additive increase/multiplicative decrease. The limit grows while request
+    latency stays close to the best observed latency and shrinks when the server reports it's busy or latency rises,
+    which indicates requests are queueing on the server.
+    """
+
+    def __init__(self, maximum, minimum=1, backoff=0.5, tolerance=2.0):
+        """
+        Creates a new limiter. The limit starts at minimum and grows as requests complete.
+
+        Args:
+            maximum: maximum limit
+            minimum: minimum limit
+            backoff: multiplier applied to the limit when the server is busy
+            tolerance: latency increase over the baseline that triggers a decrease
+        """
+
+        self.maximum, self.minimum = maximum, minimum
+        self.backoff, self.tolerance = backoff, tolerance
+
+        self.limit = float(minimum)
+
+        # Baseline latency, slowly tracks increases to adapt to changing inputs
+        self.baseline = None
+
+    def value(self):
+        """
+        Gets the current limit.
+
+        Returns:
+            maximum number of requests in flight
+        """
+
+        return max(self.minimum, min(self.maximum, int(self.limit)))
+
+    def update(self, latency, busy=0):
+        """
+        Updates the limit with the result of a completed request.
+
+        Args:
+            latency: request latency, normalized by request size
+            busy: number of busy responses received before the request completed
+        """
+
+        if busy:
+            # Server overloaded, back off
+            self.limit = max(self.minimum, self.limit * self.backoff)
+            return
+
+        self.baseline = latency if self.baseline is None else min(latency, 0.95 * self.baseline + 0.05 * latency)
+        if latency > self.tolerance * self.baseline:
+            # Requests queueing on server, reduce gradually
+            self.limit = max(self.minimum, self.limit * 0.9)
+        else:
+            # Additive increase, about one request per limit completions
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
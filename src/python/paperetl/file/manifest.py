@@ -0,0 +1,216 @@
+"""
+Manifest module
+"""
+
+import hashlib
+import json
+import os
+
+from importlib import metadata
+
+
+class Manifest:
+    """
+    Tracks input files processed into an output database. Unchanged files are skipped on subsequent runs.
+    """
+
+    # Manifest file name
+    NAME = "manifest.json"
+
+    def __init__(self, path, indir, config=None, replace=False):
+        """
+        Creates or loads a manifest.
+
+        Args:
+            path: path to manifest file
+            indir: input directory, manifest paths are stored relative to this directory
+            config: path to config directory, if any
+            replace: if True, an existing manifest is discarded
+        """
+
+        self.path, self.indir = path, indir
+
+        # Parser version and config fingerprint, files processed with different settings are reprocessed
+        self.version = Manifest.parser()
+        self.config = Manifest.fingerprint(config)
+
+        # Parts received for files split into multiple parts
+        self.parts = {}
+
+        self.files = {}
+        if not replace and os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.files = json.load(f)
+
+    @staticmethod
+    def location(url):
+        """
+        Gets the default manifest path for a database url. The manifest is stored next to the output database.
+
+        Args:
+            url: database url
+
+        Returns:
+            path to manifest file
+        """
+
+        if url.startswith("http://"):
+            raise ValueError("Incremental mode requires a local database, set a manifest path to use with this url")
+
+        for prefix in ["json://", "yaml://", "sqlite://"]:
+            url = url.replace(prefix, "")
+
+        return os.path.join(url, Manifest.NAME)
+
+    @staticmethod
+    def parser():
+        """
+        Gets the parser version.
+
+        Returns:
+            parser version
+        """
+
+        try:
+            return metadata.version("paperetl")
+        except metadata.PackageNotFoundError:
+            return None
+
+    @staticmethod
+    def fingerprint(config):
+        """
+        Builds a fingerprint of the filter files in a config directory.
+
+        Args:
+            config: path to config directory
+
+        Returns:
+            config fingerprint
+        """
+
+        digest = hashlib.sha256()
+        for name in ["ids", "codes", "keywords"]:
+            path = os.path.join(config, name) if config else None
+            if path and os.path.exists(path):
+                digest.update(name.encode("utf-8"))
+                digest.update(Manifest.hash(path).encode("utf-8"))
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def hash(path):
+        """
+        Builds a content hash for a file.
+
+        Args:
+            path: path to file
+
+        Returns:
+            content hash
+        """
+
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def stat(path):
+        """
+        Reads file metadata stored in the manifest.
+
+        Args:
+            path: path to file
+
+        Returns:
+            {"path", "size", "mtime"}
+        """
+
+        stat = os.stat(path)
+        return {"path": path, "size": stat.st_size, "mtime": stat.st_mtime}
+
+    def changed(self, path):
+        """
+        Checks if a file needs to be processed. Files with the same size and modification time are considered unchanged.
+        Otherwise, the content hash is compared.
+
+        Args:
+            path: path to file
+
+        Returns:
+            True if file is new or changed, False otherwise
+        """
+
+        entry = self.files.get(self.key(path))
+        if not entry or entry.get("version") != self.version or entry.get("config") != self.config:
+            return True
+
+        stat = Manifest.stat(path)
+        if stat["size"] == entry["size"] and stat["mtime"] == entry["mtime"]:
+            return False
+
+        if stat["size"] == entry["size"] and Manifest.hash(path) == entry["hash"]:
+            # Content unchanged, store new modification time
+            entry["mtime"] = stat["mtime"]
+            return False
+
+        return True
+
+    def add(self, files):
+        """
+        Records processed files. Files split into parts are recorded once all parts are processed.
+
+        Args:
+            files: list of {"path", "size", "mtime", "hash", "part"}. Part is optional and stores [index, count].
+        """
+
+        for entry in files:
+            if entry.get("part"):
+                index, count = entry["part"]
+
+                parts = self.parts.setdefault(entry["path"], {})
+                parts[index] = entry
+                if len(parts) < count:
+                    continue
+
+                # All parts processed, the first part stores the content hash
+                entry = {**entry, "hash": parts[0]["hash"]}
+                del self.parts[entry["path"]]
+
+            self.files[self.key(entry["path"])] = {
+                "size": entry["size"],
+                "mtime": entry["mtime"],
+                "hash": entry["hash"],
+                "version": self.version,
+                "config": self.config,
+            }
+
+    def save(self):
+        """
+        Writes the manifest to disk.
+        """
+
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Write to a temporary file and replace to prevent a partially written manifest
+        with open(self.path + ".tmp", "w", encoding="utf-8") as output:
+            json.dump(self.files, output, indent=1)
+
+        os.replace(self.path + ".tmp", self.path)
+
+    def key(self, path):
+        """
+        Builds the manifest key for a path.
+
+        Args:
+            path: path to file
+
+        Returns:
+            path relative to the input directory
+        """
+
+        return os.path.relpath(path, self.indir)
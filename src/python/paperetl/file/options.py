@@ -0,0 +1,118 @@
+"""
+Options module
+"""
+
+from ..splitter import Splitter
+
+
+class Options(dict):
+    """
+    Options for loading and streaming articles. Options not set use the default values.
+    """
+
+    # Default option values
+    DEFAULTS = {
+        "batchsize": 32,
+        "schedule": "cost",
+        "maxbatches": None,
+        "maxbytes": None,
+        "transport": "file",
+        "workers": None,
+        "reserve": 0,
+        "method": None,
+        "pin": False,
+        "split": None,
+        "profile": None,
+        "grobid": None,
+        "concurrency": None,
+        "cache": None,
+        "cachesize": None,
+        "splitter": None,
+        "transaction": None,
+        "bulk": False,
+        "incremental": False,
+        "report": None,
+        "shards": False,
+        "ordering": "completion",
+        "window": None,
+        "build": False,
+    }
+
+    # Options passed to worker processes
+    WORKER = ("batchsize", "transport", "profile", "splitter", "transaction")
+
+    def __init__(self, **kwargs):
+        """
+        Creates a new set of options.
+
+        Options:
+          - batchsize: batch size
+          - schedule: file ordering policy (path, size, cost) or a cost function, see Schedule for details
+          - maxbatches: maximum number of batches in flight between workers and the main process, defaults to 4 per worker,
+                        0 for unlimited
+          - maxbytes: maximum number of serialized bytes in flight between workers and the main process, 0 or None for unlimited
+          - transport: batch transport method from workers to the main process - file (temporary files), pipe or shm (shared memory)
+          - workers: number of worker processes, defaults to the number of available cpus minus reserved cpus
+          - reserve: number of cpus reserved for the main process
+          - method: multiprocessing start method (fork, forkserver or spawn), uses the platform default if None
+          - pin: if True, pins each worker process to a cpu and the main process to the reserved cpus (Linux only)
+          - split: splits PubMed XML and CSV files larger than this many bytes into parts that are parsed in parallel, if set.
+                   Compressed files are decompressed into a temporary directory first.
+          - profile: profiles worker processes and the database writer, merged profiles are written to this directory
+          - grobid: GROBID endpoint used to convert PDFs, defaults to a local GROBID server
+          - concurrency: maximum number of GROBID requests in flight per worker process. The number of requests in flight
+                         adapts to server latency and busy responses.
+          - cache: directory of a cache for TEI XML converted from PDFs, cached PDFs aren't sent to GROBID again
+          - cachesize: maximum cache size in bytes, least recently used entries are evicted once complete
+          - splitter: sentence splitting method - nltk (default), rules (faster, rule-based) or none (no splitting)
+          - transaction: number of articles per SQLite transaction, defaults to 1000. Also applies to shard databases.
+          - bulk: if True, new SQLite databases are loaded in bulk-load mode. Journaling and syncing are relaxed while loading
+                  and indexes are created when complete. A failed load leaves a database that must be recreated.
+
+        Database options:
+          - incremental: if True, skips input files that are unchanged since the last run. Processed files are tracked in
+                         a manifest stored next to the output database. Can also be set to a manifest path.
+          - report: writes a JSON run report to this path, if set
+          - shards: if True, each worker process writes articles to its own SQLite shard database. Shards are merged into
+                    the output database when complete. Requires a SQLite database.
+
+        Stream options:
+          - ordering: completion (articles are yielded as they are received) or input (articles are yielded in scheduled
+                      task order)
+          - window: maximum number of tasks dispatched ahead of the oldest incomplete task with input ordering,
+                    defaults to 2 per worker
+          - build: if True, yields article dicts (Article.build) instead of Article objects
+
+        Args:
+            kwargs: option values
+        """
+
+        unknown = sorted(set(kwargs) - set(Options.DEFAULTS))
+        if unknown:
+            raise TypeError(f"Unknown options: {', '.join(unknown)}")
+
+        super().__init__({**Options.DEFAULTS, **kwargs})
+
+        if self["ordering"] not in ("completion", "input"):
+            raise ValueError(f"Unknown ordering: {self['ordering']}")
+        if self["splitter"] and self["splitter"] not in Splitter.METHODS:
+            raise ValueError(f"Unknown sentence splitting method: {self['splitter']}")
+
+    def worker(self, **kwargs):
+        """
+        Builds settings for worker processes. Settings only hold picklable values, cost functions stay in the main process.
+
+        Args:
+            kwargs: additional settings
+
+        Returns:
+            worker settings
+        """
+
+        settings = {name: self[name] for name in Options.WORKER}
+        settings["grobid"] = {"url": self["grobid"], "concurrency": self["concurrency"], "cache": self["cache"]}
+
+        # Content hashes and flushing after each file are disabled unless set
+        settings.update({"manifest": False, "flush": False, **kwargs})
+
+        return settings
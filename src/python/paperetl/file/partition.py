@@ -0,0 +1,360 @@
+"""
+Partition module
+"""
+
+import gzip
+import os
+import shutil
+import struct
+
+
+class Partition:
+    """
+    Splits large PubMed XML files into byte ranges aligned on article boundaries and large CSV files into byte ranges
+    aligned on row boundaries. Each range can be parsed independently, which allows multiple worker processes to parse a
+    single file.
+    """
+
+    # Article start tag
+    START = b"<PubmedArticle>"
+
+    # Root end tag
+    END = b"</PubmedArticleSet>"
+
+    # Root element wrapped around each range
+    HEADER = b'<?xml version="1.0" encoding="utf-8"?>\n<PubmedArticleSet>\n'
+    FOOTER = b"\n</PubmedArticleSet>\n"
+
+    # Block size used when searching for boundaries
+    BLOCK = 1024 * 1024
+
+    # Maximum deflate compression ratio
+    RATIO = 1032
+
+    @staticmethod
+    def size(path, compress):
+        """
+        Estimates the uncompressed size of a file. The size of gzip files is read from the gzip trailer,
+        which stores the uncompressed size modulo 2^32. Multiples of 2^32 are only added when the trailer size is
+        smaller than the smallest possible uncompressed size and the compressed size allows a file over 4GB.
+
+        Args:
+            path: path to file
+            compress: True if file is gzip compressed
+
+        Returns:
+            uncompressed size in bytes
+        """
+
+        size = os.path.getsize(path)
+        if compress and size >= 4:
+            with open(path, "rb") as f:
+                f.seek(-4, os.SEEK_END)
+                isize = struct.unpack("<I", f.read(4))[0]
+
+            # Smallest possible uncompressed size. Incompressible data is stored with a few bytes of overhead per block
+            # plus the gzip header and trailer.
+            minimum = size - size // 1000 - 1024
+
+            # Adjust for files larger than 4GB
+            while isize < minimum and isize + 2**32 <= size * Partition.RATIO:
+                isize += 2**32
+
+            size = isize
+
+        return size
+
+    @staticmethod
+    def decompress(path, directory):
+        """
+        Decompresses a gzip file into directory.
+
+        Args:
+            path: path to gzip file
+            directory: output directory
+
+        Returns:
+            path to decompressed file
+        """
+
+        output = os.path.join(directory, f"{len(os.listdir(directory))}-{os.path.basename(path)[:-3]}")
+        with gzip.open(path, "rb") as source, open(output, "wb") as target:
+            shutil.copyfileobj(source, target, Partition.BLOCK)
+
+        return output
+
+    @staticmethod
+    def ranges(path, size):
+        """
+        Splits a file into byte ranges of approximately size bytes. Each range starts on an article start tag.
+
+        Args:
+            path: path to uncompressed XML file
+            size: target range size in bytes
+
+        Returns:
+            list of (start, end) byte offsets
+        """
+
+        with open(path, "rb") as f:
+            # First article and end of last article
+            start = Partition.find(f, 0)
+            end = Partition.end(f)
+
+            if start is None or end <= start:
+                return [(0, 0)]
+
+            # Find boundaries closest to each target offset
+            offsets = [start]
+            for target in range(start + size, end, size):
+                offset = Partition.find(f, max(target, offsets[-1] + 1))
+                if offset is None or offset >= end:
+                    break
+
+                offsets.append(offset)
+
+        return list(zip(offsets, offsets[1:] + [end]))
+
+    @staticmethod
+    def rows(path, size):
+        """
+        Splits a CSV file into byte ranges of approximately size bytes. Each range starts at the beginning of a row. Quoted
+        values can contain newlines, so a newline only ends a row when an even number of quotes precede it in the file.
+
+        Args:
+            path: path to uncompressed CSV file
+            size: target range size in bytes
+
+        Returns:
+            (end offset of header row, list of (start, end) byte offsets)
+        """
+
+        with open(path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+
+            # Header row
+            header, quotes = Partition.newline(f, 0, 0)
+            if header is None or header >= end:
+                return (end, [(end, end)])
+
+            # Find row boundaries closest to each target offset
+            offsets = [header]
+            for target in range(header + size, end, size):
+                if target <= offsets[-1]:
+                    continue
+
+                # Count quotes up to target, then find the next newline outside of quotes
+                quotes += Partition.count(f, offsets[-1], target)
+                offset, count = Partition.newline(f, target, quotes)
+                if offset is None or offset >= end:
+                    break
+
+                offsets.append(offset)
+                quotes = count
+
+        return (header, list(zip(offsets, offsets[1:] + [end])))
+
+    @staticmethod
+    def count(f, start, end):
+        """
+        Counts quotes in a byte range.
+
+        Args:
+            f: file handle
+            start: start offset
+            end: end offset
+
+        Returns:
+            number of quotes
+        """
+
+        f.seek(start)
+
+        count = 0
+        while start < end:
+            block = f.read(min(Partition.BLOCK, end - start))
+            if not block:
+                break
+
+            count += block.count(b'"')
+            start += len(block)
+
+        return count
+
+    @staticmethod
+    def newline(f, offset, quotes):
+        """
+        Finds the end of the row at or after offset.
+
+        Args:
+            f: file handle
+            offset: starting offset
+            quotes: number of quotes before offset
+
+        Returns:
+            (offset after the newline ending the row or None if not found, number of quotes before returned offset)
+        """
+
+        f.seek(offset)
+        while True:
+            block = f.read(Partition.BLOCK)
+            if not block:
+                return (None, quotes)
+
+            # Newlines with an even number of quotes before them end a row
+            position = 0
+            index = block.find(b"\n")
+            while index >= 0:
+                quotes += block.count(b'"', position, index)
+                if quotes % 2 == 0:
+                    return (offset + index + 1, quotes)
+
+                position = index
+                index = block.find(b"\n", index + 1)
+
+            quotes += block.count(b'"', position)
+            offset += len(block)
+
+    @staticmethod
+    def find(f, offset):
+        """
+        Finds the next article start tag at or after offset.
+
+        Args:
+            f: file handle
+            offset: starting offset
+
+        Returns:
+            offset of next article start tag or None if not found
+        """
+
+        # Overlap blocks to find tags spanning block boundaries
+        overlap = len(Partition.START) - 1
+
+        f.seek(offset)
+        while True:
+            block = f.read(Partition.BLOCK)
+            if not block:
+                return None
+
+            index = block.find(Partition.START)
+            if index >= 0:
+                return offset + index
+
+            if len(block) < Partition.BLOCK:
+                return None
+
+            offset += len(block) - overlap
+            f.seek(offset)
+
+    @staticmethod
+    def end(f):
+        """
+        Finds the offset of the root end tag. Returns the file size if not found.
+
+        Args:
+            f: file handle
+
+        Returns:
+            end offset
+        """
+
+        size = f.seek(0, os.SEEK_END)
+
+        f.seek(max(size - Partition.BLOCK, 0))
+        block = f.read()
+
+        index = block.rfind(Partition.END)
+        return size - len(block) + index if index >= 0 else size
+
+    @staticmethod
+    def open(path, start, end, header=None):
+        """
+        Opens a byte range of a file. XML ranges are wrapped in a root element. CSV ranges are prefixed with the
+        header row of the file.
+
+        Args:
+            path: path to file
+            start: start offset
+            end: end offset
+            header: end offset of CSV header row, if set
+
+        Returns:
+            Range
+        """
+
+        return Range(path, start, end, header)
+
+
+class Range:
+    """
+    Read-only binary stream for a byte range of a file, wrapped in a root element or prefixed with a CSV header row.
+    """
+
+    def __init__(self, path, start, end, header=None):
+        """
+        Opens a new range stream.
+
+        Args:
+            path: path to file
+            start: start offset
+            end: end offset
+            header: end offset of CSV header row, if set
+        """
+
+        # pylint: disable=R1732
+        self.file = open(path, "rb")
+
+        # CSV ranges start with the header row, XML ranges are wrapped in a root element
+        if header is not None:
+            self.header, self.footer = self.file.read(header), b""
+        else:
+            self.header, self.footer = Partition.HEADER, Partition.FOOTER
+
+        self.file.seek(start)
+        self.remaining = end - start
+
+    def read(self, size=-1):
+        """
+        Reads up to size bytes.
+
+        Args:
+            size: maximum number of bytes to read, reads all remaining bytes if negative
+
+        Returns:
+            bytes
+        """
+
+        size = size if size is not None and size >= 0 else self.remaining + len(self.header) + len(self.footer)
+
+        data = b""
+        if self.header and size > 0:
+            data, self.header = self.header[:size], self.header[size:]
+
+        if self.remaining and size > len(data):
+            block = self.file.read(min(size - len(data), self.remaining))
+            self.remaining -= len(block)
+            data += block
+
+            # Guard against files truncated while reading
+            if not block:
+                self.remaining = 0
+
+        if not self.remaining and self.footer and size > len(data):
+            count = size - len(data)
+            data, self.footer = data + self.footer[:count], self.footer[count:]
+
+        return data
+
+    def close(self):
+        """
+        Closes the underlying file.
+        """
+
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
@@ -4,8 +4,7 @@ PDF processing module
 
 from io import StringIO
 
-import requests
-
+from .grobid import Grobid
 from .tei import TEI
 
 
@@ -15,43 +14,42 @@ class PDF:
     """
 
     @staticmethod
-    def parse(stream, source):
+    def parse(stream, source, url=None, cache=None):
         """
         Parses a medical/scientific PDF datastream and returns a processed article.
 
         Args:
             stream: handle to input data stream
             source: text string describing stream source, can be None
+            url: GROBID endpoint, defaults to a local GROBID server
+            cache: TEI cache directory, if any
 
         Returns:
             Article
         """
 
         # Attempt to convert PDF to TEI XML
-        xml = PDF.convert(stream)
+        xml = PDF.convert(stream, url, cache)
 
         # Parse and return object
         return TEI.parse(xml, source) if xml else None
 
     @staticmethod
-    def convert(stream):
+    def convert(stream, url=None, cache=None):
         """
         Converts a medical/scientific article PDF into TEI XML via a GROBID Web Service API call.
 
         Args:
             stream: handle to input data stream
+            url: GROBID endpoint, defaults to a local GROBID server
+            cache: TEI cache directory, if any
 
         Returns:
             TEI XML stream
         """
 
         # Call GROBID API
-        response = requests.post("http://localhost:8070/api/processFulltextDocument", files={"input": stream})
-
-        # Validate request was successful
-        if not response.ok:
-            print(f"Failed to process file - {response.text}")
-            return None
+        xml = Grobid.client(url, cache).convert(stream)
 
         # Wrap as StringIO
-        return StringIO(response.text)
+        return StringIO(xml) if xml else None
@@ -5,10 +5,9 @@ PubMed archive XML processing module
 import os
 import re
 
-from dateutil import parser
 from lxml import etree
-from nltk.tokenize import sent_tokenize
 
+from ..date import Date
 from ..schema.article import Article
 from ..text import Text
 
@@ -58,15 +57,17 @@ class PMB:
         # Convert ids to ints
         ids = set(int(x) for x in ids) if ids else None
 
-        # Parse HTML content using lxml
-        # pylint: disable=c-extension-no-member,stop-iteration-return
-        document = etree.iterparse(stream, events=("start", "end"))
-        _, root = next(document)
+        # Parse XML content using lxml, only end events for article elements are generated
+        # pylint: disable=c-extension-no-member
+        for _, element in etree.iterparse(stream, events=("end",), tag="PubmedArticle"):
+            yield PMB.process(element, source, ids, codes, keywords)
 
-        for event, element in document:
-            if event == "end" and element.tag == "PubmedArticle":
-                yield PMB.process(element, source, ids, codes, keywords)
-                root.clear()
+            # Free processed article along with preceding siblings (other processed articles and skipped elements).
+            # This keeps memory bounded regardless of file size.
+            element.clear(keep_tail=False)
+            parent = element.getparent()
+            while element.getprevious() is not None:
+                del parent[0]
 
     @staticmethod
     def process(element, source, ids, codes, keywords):
@@ -186,13 +187,7 @@ class PMB:
             Date if parsed
         """
 
-        date = ""
-        for field in ["Year", "Month", "Day"]:
-            value = PMB.get(element, field)
-            if value:
-                date += "-" + value if date else value
-
-        return parser.parse(date) if date else None
+        return Date.parts(*(PMB.get(element, field) for field in ["Year", "Month", "Day"]))
 
     @staticmethod
     def published(journal):
@@ -214,7 +209,7 @@ class PMB:
             # Fallback to MedlineDate
             date = PMB.get(element, "MedlineDate")
             date = re.search(r"\d{4}", date)
-            date = parser.parse(date.group()) if date else None
+            date = Date.parse(date.group()) if date else None
 
         return date if date else None
 
@@ -317,7 +312,7 @@ class PMB:
         text = Text.transform(PMB.text(element))
 
         # No embedded sections
-        return [("ABSTRACT", x) for x in sent_tokenize(text)]
+        return [("ABSTRACT", x) for x in Text.sentences(text)]
 
     @staticmethod
     def formatted(element):
@@ -331,7 +326,8 @@ class PMB:
             list of sections
         """
 
-        sections = []
+        # Section names and texts, split into sentences as a batch
+        names, paragraphs = [], []
         name, tag, texts = "ABSTRACT", None, []
 
         for x in element.getchildren():
@@ -358,7 +354,8 @@ class PMB:
             if ((x.tag == tag and ctext) or (not tag and texts)) and (not texts or texts[-1].strip().endswith(".")):
                 # Save previous section
                 if texts:
-                    sections.extend([(name, t) for t in sent_tokenize("".join(texts).strip())])
+                    names.append(name)
+                    paragraphs.append("".join(texts).strip())
 
                 # Reset section name/texts
                 name = ctext if tag else "ABSTRACT"
@@ -373,9 +370,10 @@ class PMB:
 
         # Save last section
         if texts:
-            sections.extend([(name, t) for t in sent_tokenize("".join(texts).strip())])
+            names.append(name)
+            paragraphs.append("".join(texts).strip())
 
-        return sections
+        return [(name, t) for name, sentences in zip(names, Text.batch(paragraphs)) for t in sentences]
 
     @staticmethod
     def parsed(elements):
@@ -389,7 +387,8 @@ class PMB:
             list of sections
         """
 
-        sections = []
+        # Section names and texts, split into sentences as a batch
+        names, texts = [], []
 
         # Parsed abstract
         for element in elements:
@@ -397,13 +396,11 @@ class PMB:
             name = name if name else "ABSTRACT"
 
             if element.text:
-                # Transform and clean text
-                text = Text.transform(PMB.text(element))
+                names.append(name)
+                texts.append(PMB.text(element))
 
-                # Split text into sentences, transform text and add to sections
-                sections.extend([(name, x) for x in sent_tokenize(text)])
-
-        return sections
+        # Transform and clean text, split text into sentences and add to sections
+        return [(name, x) for name, sentences in zip(names, Text.batch(Text.transform(texts))) for x in sentences]
 
     @staticmethod
     def background(name):
@@ -0,0 +1,147 @@
+"""
+Pool module
+"""
+
+import os
+import time
+
+from queue import Empty
+
+from ..metrics import Metrics
+
+from .transport import Transport
+from .worker import Worker
+
+
+class Pool:
+    """
+    Starts, monitors and stops worker processes. Reads batches of articles written by worker processes to the outputs channel.
+    """
+
+    # Seconds to wait for worker output before checking worker processes are alive
+    TIMEOUT = 5
+
+    @staticmethod
+    def start(context, inputs, outputs, settings, cpus, shards=None):
+        """
+        Starts worker processes.
+
+        Args:
+            context: multiprocessing context
+            inputs: inputs queue
+            outputs: outputs channel
+            settings: worker settings, see Options.worker
+            cpus: cpu for each worker process, one process is started per entry
+            shards: shard database directory for each worker process, if set
+
+        Returns:
+            list of worker processes
+        """
+
+        # Validate transport method and prepare the main process, worker processes share the shared memory resource tracker
+        Transport.create(settings["transport"])
+
+        processes = []
+        for x, cpu in enumerate(cpus):
+            process = context.Process(target=Worker.process, args=(inputs, outputs, settings, x, cpu, shards[x] if shards else None))
+            process.start()
+            processes.append(process)
+
+        return processes
+
+    @staticmethod
+    def cpus(total, workers, reserve, pin):
+        """
+        Plans the number of worker processes and the cpus each process is pinned to.
+
+        Args:
+            total: number of input files
+            workers: number of worker processes, defaults to the number of available cpus minus reserved cpus
+            reserve: number of cpus reserved for the main (database writer) process
+            pin: if True, worker processes are pinned to cpus and the main process is pinned to reserved cpus
+
+        Returns:
+            (number of workers, cpu for each worker process, set of cpus for main process)
+        """
+
+        # Available cpus
+        available = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else list(range(os.cpu_count()))
+
+        # Always leave at least one cpu for worker processes
+        reserve = min(reserve, len(available) - 1) if reserve else 0
+
+        # Number of worker processes
+        workers = workers if workers else max(len(available) - reserve, 1)
+        workers = min(workers, total)
+
+        if pin and hasattr(os, "sched_setaffinity"):
+            cores = available[reserve:]
+            return workers, [cores[x % len(cores)] for x in range(workers)], set(available[:reserve]) if reserve else None
+
+        return workers, [None] * workers, None
+
+    @staticmethod
+    def receive(processes, outputs):
+        """
+        Reads messages written by worker processes. Runs until every worker process has written a completion message.
+
+        Args:
+            processes: list of worker processes
+            outputs: outputs channel
+
+        Returns:
+            generator of ((message type, (result, files, segments)), size)
+        """
+
+        completed = 0
+        while completed < len(processes):
+            try:
+                # Get next result
+                start = time.perf_counter()
+                message, size = outputs.get(timeout=Pool.TIMEOUT)
+            except Empty as error:
+                # Fail if all worker processes exited without sending a completion message
+                if not any(process.is_alive() for process in processes):
+                    raise RuntimeError("Worker process exited unexpectedly") from error
+
+                continue
+            finally:
+                Metrics.add("wait", time.perf_counter() - start)
+
+            if message[0] == Worker.COMPLETE:
+                completed += 1
+
+            yield message, size
+
+    @staticmethod
+    def close(processes, inputs, outputs, transport=None):
+        """
+        Closes open processes and queues.
+
+        Args:
+            processes: list of processes
+            inputs: input queue
+            outputs: outputs channel
+            transport: batch transport method, if set, resources held by batches that were never read are released
+        """
+
+        if processes:
+            # Stop and close processes. Processes are only alive at this point when an error occurred or a stream was closed early.
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+
+                process.join()
+                process.close()
+
+            # Release temporary files and shared memory blocks of batches that were never read
+            transport = Transport.create(transport)
+            if transport.RESOURCES:
+                for (message, (result, _, _)), _ in outputs.drain():
+                    if message == Worker.BATCH and result is not None:
+                        transport.discard(result)
+
+            # Close queues. Tasks not read by workers are discarded, otherwise the inputs feeder thread blocks exit.
+            inputs.cancel_join_thread()
+            inputs.close()
+            outputs.close()
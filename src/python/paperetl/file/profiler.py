@@ -0,0 +1,169 @@
+"""
+Profiler module
+"""
+
+import cProfile
+import glob
+import inspect
+import os
+import pstats
+import signal
+
+from collections import Counter
+
+
+class Profiler:
+    """
+    Profiles a single process. Runs cProfile and, when supported by the platform, a statistical sampler that records
+    collapsed call stacks. Profiles from each process are written to a shared directory and merged once processing
+    is complete.
+
+    The sampler runs alongside cProfile, so sampled stacks include cProfile overhead. Relative costs are still comparable.
+    """
+
+    # Sampling interval in seconds of cpu time
+    INTERVAL = 0.005
+
+    # Merged output file names
+    PSTATS = "profile.pstats"
+    STACKS = "profile.folded"
+
+    def __init__(self, directory, name, interval=None):
+        """
+        Creates a new profiler.
+
+        Args:
+            directory: output directory
+            name: process name, used as output file name and as the root of sampled stacks
+            interval: sampling interval in seconds
+        """
+
+        self.directory, self.name = directory, name
+        self.interval = interval if interval else Profiler.INTERVAL
+
+        self.profile = cProfile.Profile()
+
+        # Sampled stacks, only available on platforms with interval timers
+        self.stacks = Counter() if hasattr(signal, "setitimer") else None
+        self.handler, self.root = None, None
+
+    def start(self):
+        """
+        Starts profiling.
+        """
+
+        if self.stacks is not None:
+            # Sampled stacks start at the function that started the profiler
+            self.root = inspect.currentframe().f_back.f_back
+
+            self.handler = signal.signal(signal.SIGPROF, self.sample)
+            signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+        self.profile.enable()
+
+    def stop(self):
+        """
+        Stops profiling and writes the profile for this process.
+        """
+
+        self.profile.disable()
+
+        if self.stacks is not None:
+            signal.setitimer(signal.ITIMER_PROF, 0, 0)
+            signal.signal(signal.SIGPROF, self.handler if self.handler is not None else signal.SIG_DFL)
+
+        os.makedirs(self.directory, exist_ok=True)
+        self.profile.dump_stats(os.path.join(self.directory, f"{self.name}.pstats"))
+
+        if self.stacks is not None:
+            Profiler.write(os.path.join(self.directory, f"{self.name}.folded"), self.stacks)
+
+    def sample(self, signum, frame):
+        """
+        Signal handler that records the current call stack.
+
+        Args:
+            signum: signal number
+            frame: current stack frame
+        """
+
+        # pylint: disable=W0613
+        stack = []
+        while frame and frame is not self.root:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+            frame = frame.f_back
+
+        # Group by process type, worker processes are aggregated together
+        stack.append(self.name.split("-")[0])
+
+        self.stacks[";".join(reversed(stack))] += 1
+
+    @staticmethod
+    def merge(directory):
+        """
+        Merges per process profiles into a single pstats file and a single collapsed stack file.
+
+        Args:
+            directory: profile directory
+
+        Returns:
+            list of merged file paths
+        """
+
+        outputs = []
+
+        # Merge cProfile stats
+        files = [x for x in sorted(glob.glob(os.path.join(directory, "*.pstats"))) if os.path.basename(x) != Profiler.PSTATS]
+        if files:
+            path = os.path.join(directory, Profiler.PSTATS)
+            pstats.Stats(*files).dump_stats(path)
+            outputs.append(path)
+
+        # Merge sampled stacks
+        files = [x for x in sorted(glob.glob(os.path.join(directory, "*.folded"))) if os.path.basename(x) != Profiler.STACKS]
+        if files:
+            stacks = Counter()
+            for x in files:
+                stacks.update(Profiler.read(x))
+
+            path = os.path.join(directory, Profiler.STACKS)
+            Profiler.write(path, stacks)
+            outputs.append(path)
+
+        return outputs
+
+    @staticmethod
+    def read(path):
+        """
+        Reads a collapsed stack file.
+
+        Args:
+            path: path to file
+
+        Returns:
+            Counter of stack: samples
+        """
+
+        stacks = Counter()
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                stack, _, count = line.rstrip("\n").rpartition(" ")
+                if stack:
+                    stacks[stack] += int(count)
+
+        return stacks
+
+    @staticmethod
+    def write(path, stacks):
+        """
+        Writes stacks in collapsed format, one "frame;frame;frame count" line per stack. This format is read by flame graph tools.
+
+        Args:
+            path: output path
+            stacks: Counter of stack: samples
+        """
+
+        with open(path, "w", encoding="utf-8") as output:
+            for stack, count in sorted(stacks.items()):
+                output.write(f"{stack} {count}\n")
@@ -0,0 +1,142 @@
+"""
+Reader module
+"""
+
+import gzip
+import io
+import threading
+
+from queue import Queue
+
+# Conditional import
+try:
+    from isal import igzip
+
+    ISAL = True
+except ImportError:
+    ISAL = False
+
+try:
+    from zlib_ng import gzip_ng
+
+    ZLIBNG = True
+except ImportError:
+    ZLIBNG = False
+
+
+class Reader(io.RawIOBase):
+    """
+    Reads gzip compressed files. Decompression runs on a background thread that fills a bounded buffer of chunks, which
+    overlaps decompression with parsing. Uses a faster inflate implementation (python-isal or zlib-ng) when installed.
+    """
+
+    # Default chunk size in bytes
+    CHUNKSIZE = 1024 * 1024
+
+    # Default number of buffered chunks
+    BUFFERS = 8
+
+    @staticmethod
+    def open(path, mode="rb", chunksize=None, buffers=None):
+        """
+        Opens a gzip compressed file for reading.
+
+        Args:
+            path: path to file
+            mode: file open mode, "r" for text (utf-8) and "rb" for binary
+            chunksize: chunk size in bytes
+            buffers: maximum number of buffered chunks
+
+        Returns:
+            file handle
+        """
+
+        stream = io.BufferedReader(Reader(path, chunksize, buffers), Reader.CHUNKSIZE)
+        return io.TextIOWrapper(stream, encoding="utf-8") if mode == "r" else stream
+
+    @staticmethod
+    def inflate():
+        """
+        Gets the name of the inflate implementation used.
+
+        Returns:
+            isal, zlib-ng or zlib
+        """
+
+        return "isal" if ISAL else "zlib-ng" if ZLIBNG else "zlib"
+
+    def __init__(self, path, chunksize=None, buffers=None):
+        """
+        Opens a gzip compressed file and starts the background decompression thread.
+
+        Args:
+            path: path to file
+            chunksize: chunk size in bytes
+            buffers: maximum number of buffered chunks
+        """
+
+        super().__init__()
+
+        self.chunksize = chunksize if chunksize else Reader.CHUNKSIZE
+        self.queue = Queue(buffers if buffers else Reader.BUFFERS)
+
+        # Current chunk and read offset
+        self.chunk, self.offset, self.eof = b"", 0, False
+
+        # pylint: disable=R1732
+        self.stream = igzip.open(path, "rb") if ISAL else gzip_ng.open(path, "rb") if ZLIBNG else gzip.open(path, "rb")
+
+        # Start background decompression
+        self.stop = threading.Event()
+        self.thread = threading.Thread(target=self.decompress, daemon=True)
+        self.thread.start()
+
+    def decompress(self):
+        """
+        Background thread loop. Decompresses chunks into the buffer until end of file, an error or close.
+        """
+
+        try:
+            while not self.stop.is_set():
+                chunk = self.stream.read(self.chunksize)
+                self.queue.put(chunk)
+                if not chunk:
+                    break
+
+        # pylint: disable=W0718
+        except Exception as error:
+            # Raise errors in the reading thread
+            self.queue.put(error)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.eof and self.offset >= len(self.chunk):
+            chunk = self.queue.get()
+            if isinstance(chunk, Exception):
+                self.eof = True
+                raise chunk
+
+            self.chunk, self.offset, self.eof = memoryview(chunk), 0, not chunk
+
+        # Copy as much of the current chunk as fits into buffer
+        size = min(len(buffer), len(self.chunk) - self.offset)
+        buffer[:size] = self.chunk[self.offset : self.offset + size]
+        self.offset += size
+
+        return size
+
+    def close(self):
+        if not self.closed:
+            # Stop background thread, drain buffer to unblock pending writes
+            self.stop.set()
+            while self.thread.is_alive():
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+
+                self.thread.join(0.01)
+
+            self.stream.close()
+
+        super().close()
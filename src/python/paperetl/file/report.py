@@ -0,0 +1,259 @@
+"""
+Report module
+"""
+
+import json
+import os
+import time
+
+
+class Report:
+    """
+    Run report. Aggregates throughput and stage timings by worker process and input file.
+
+    Worker stages:
+      - read: reading input streams, includes waiting on decompression
+      - parse: XML/CSV/PDF parsing, time spent on a file not covered by another stage
+      - transform: Text.transform
+      - tokenize: sentence tokenization
+      - serialize: encoding and writing batches to the transport
+      - wait: waiting for room in the outputs channel
+      - hash: content hashing for incremental runs
+      - insert: shard database inserts, when worker processes write shard databases
+
+    Writer stages:
+      - wait: waiting for batches from worker processes
+      - deserialize: reading and decoding batches from the transport
+      - insert: database inserts
+      - merge: merging shard databases into the output database
+    """
+
+    # Number of slowest files listed in the report
+    SLOWEST = 10
+
+    def __init__(self):
+        """
+        Creates a new report and starts the run clock.
+        """
+
+        self.start = time.perf_counter()
+
+        # Worker clock, starts when worker processes are started
+        self.launched = None
+
+        # Total run time
+        self.seconds = 0.0
+
+        # Worker statistics, per file statistics and worker completion times relative to when workers started
+        self.workers, self.files, self.elapsed = [], [], []
+
+        # Writer stage timings
+        self.writer = {}
+
+        # Database results
+        self.inserted, self.duplicates = 0, 0
+
+        # Makespan report
+        self.makespan = None
+
+    @property
+    def articles(self):
+        """
+        Total number of articles parsed.
+
+        Returns:
+            number of articles
+        """
+
+        return sum(x["articles"] for x in self.workers)
+
+    @property
+    def bytes(self):
+        """
+        Total number of input bytes processed.
+
+        Returns:
+            number of bytes
+        """
+
+        return sum(x["bytes"] for x in self.workers)
+
+    def launch(self):
+        """
+        Starts the worker clock. Worker completion times exclude time spent before workers start, such as scanning
+        and decompressing inputs.
+        """
+
+        self.launched = time.perf_counter()
+
+    def worker(self, stats):
+        """
+        Adds statistics for a completed worker process.
+
+        Args:
+            stats: worker statistics
+        """
+
+        self.workers.append(stats)
+        self.elapsed.append(time.perf_counter() - (self.launched if self.launched is not None else self.start))
+
+    def add(self, files):
+        """
+        Adds statistics for processed files.
+
+        Args:
+            files: list of file statistics
+        """
+
+        self.files.extend(files)
+
+    def save(self, saved):
+        """
+        Records a database save result.
+
+        Args:
+            saved: True if the article was saved, False if skipped as a duplicate
+        """
+
+        if saved:
+            self.inserted += 1
+        else:
+            self.duplicates += 1
+
+    def merged(self, inserted, seconds):
+        """
+        Records the result of merging shard databases. Articles that weren't inserted were skipped as duplicates.
+
+        Args:
+            inserted: number of articles inserted
+            seconds: merge time in seconds
+        """
+
+        self.inserted, self.duplicates = inserted, self.articles - inserted
+        self.writer["merge"] = seconds
+
+    def complete(self, makespan=None):
+        """
+        Stops the run clock.
+
+        Args:
+            makespan: makespan report
+        """
+
+        self.seconds = time.perf_counter() - self.start
+        self.makespan = makespan
+
+    def stages(self):
+        """
+        Sums worker stage timings across all worker processes.
+
+        Returns:
+            {stage: seconds}
+        """
+
+        stages = {}
+        for worker in self.workers:
+            for stage, seconds in worker.get("stages", {}).items():
+                stages[stage] = stages.get(stage, 0.0) + seconds
+
+        return stages
+
+    def slowest(self, limit=None):
+        """
+        Gets the slowest processed files.
+
+        Args:
+            limit: maximum number of files, defaults to SLOWEST
+
+        Returns:
+            list of file statistics, slowest first
+        """
+
+        return sorted(self.files, key=lambda x: -x.get("seconds", 0.0))[: limit if limit else Report.SLOWEST]
+
+    def summary(self):
+        """
+        Builds the run report.
+
+        Returns:
+            dict
+        """
+
+        seconds = max(self.seconds, 1e-9)
+
+        return {
+            "seconds": self.seconds,
+            "files": len(self.files),
+            "articles": self.articles,
+            "inserted": self.inserted,
+            "duplicates": self.duplicates,
+            "bytes": self.bytes,
+            "articles/s": self.articles / seconds,
+            "bytes/s": self.bytes / seconds,
+            "stages": {"workers": self.stages(), "writer": self.writer},
+            "makespan": self.makespan,
+            "workers": sorted(self.workers, key=lambda x: x["worker"]),
+            "slowest": [Report.file(x) for x in self.slowest()],
+            "inputs": [Report.file(x) for x in self.files],
+        }
+
+    def write(self, path):
+        """
+        Writes the run report to path as JSON.
+
+        Args:
+            path: output path
+        """
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with open(path, "w", encoding="utf-8") as output:
+            json.dump(self.summary(), output, indent=1)
+
+    @staticmethod
+    def file(stats):
+        """
+        Formats statistics for a single input file.
+
+        Args:
+            stats: file statistics
+
+        Returns:
+            dict
+        """
+
+        return {key: stats.get(key) for key in ["path", "part", "worker", "bytes", "articles", "seconds", "stages"]}
+
+    def __str__(self):
+        lines = []
+
+        # Per worker throughput
+        for x in sorted(self.workers, key=lambda x: x["worker"]):
+            lines.append(
+                f"Worker {x['worker']} (cpu {x['cpu']}): {x['files']} files, {x['articles']} articles, "
+                f"{x['bytes'] / 1e6:.1f} MB in {x['seconds']:.2f}s - {x['articles'] / max(x['seconds'], 1e-9):.1f} articles/s, "
+                f"{x['bytes'] / 1e6 / max(x['seconds'], 1e-9):.2f} MB/s"
+            )
+
+        # Stage timings
+        for name, stages in [("Worker", self.stages()), ("Writer", self.writer)]:
+            if stages:
+                lines.append(f"{name} stages: " + ", ".join(f"{stage} {seconds:.2f}s" for stage, seconds in stages.items()))
+
+        # Compare predicted and actual makespan
+        if self.makespan:
+            lines.append(
+                f"Makespan ({self.makespan['policy']}): predicted {self.makespan['predicted']:.2f}s, "
+                f"actual {self.makespan['actual']:.2f}s, ideal {self.makespan['ideal']:.2f}s"
+            )
+
+        # Overall throughput
+        seconds = max(self.seconds, 1e-9)
+        lines.append(
+            f"Total: {len(self.files)} files, {self.articles} articles ({self.inserted} inserted, {self.duplicates} duplicates), "
+            f"{self.bytes / 1e6:.1f} MB in {self.seconds:.2f}s - {self.articles / seconds:.1f} articles/s, {self.bytes / 1e6 / seconds:.2f} MB/s"
+        )
+
+        return "\n".join(lines)
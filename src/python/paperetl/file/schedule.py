@@ -0,0 +1,147 @@
+"""
+Schedule module
+"""
+
+import heapq
+import os
+
+
+class Schedule:
+    """
+    Orders input files for processing. Worker processes pull files from a shared queue, so dispatching the most expensive
+    files first keeps a single large file from running long after all other workers have finished.
+    """
+
+    # Relative parsing cost per byte by data format
+    FORMATS = {"csv": 0.5, "pdf": 0.1, "xml": 1.0}
+
+    # Estimated compression ratio for gzip compressed files
+    COMPRESSION = 6.0
+
+    def __init__(self, policy="cost"):
+        """
+        Creates a new schedule.
+
+        Policies:
+          - path: sorted path order
+          - size: largest file size first
+          - cost: largest estimated cost first, accounts for data format and compression
+          - callable: custom cost function with the signature cost(path, extension, compress, size), largest cost first
+
+        Args:
+            policy: ordering policy
+        """
+
+        self.policy = policy if policy else "path"
+
+        # Cost of each scheduled task in dispatch order
+        self.costs = []
+
+    def __call__(self, tasks):
+        """
+        Orders tasks for processing.
+
+        Args:
+            tasks: list of task tuples - (path, source, extension, compress, config, part)
+
+        Returns:
+            ordered list of tasks
+        """
+
+        costs = [self.cost(*task[:4], task[5] if len(task) > 5 else None) for task in tasks]
+
+        # Sort descending by cost, keep path order when costs are equal
+        order = list(range(len(tasks)))
+        if self.policy != "path":
+            order = sorted(order, key=lambda x: -costs[x])
+
+        self.costs = [costs[x] for x in order]
+        return [tasks[x] for x in order]
+
+    def cost(self, path, source, extension, compress, part=None):
+        """
+        Estimates the processing cost of a file.
+
+        Args:
+            path: path to input file
+            source: text string describing stream source
+            extension: data format
+            compress: True if file is gzip compressed
+            part: byte range of file, if set
+
+        Returns:
+            estimated cost
+        """
+
+        # pylint: disable=W0613
+        size = part["end"] - part["start"] if part else self.size(path)
+
+        if callable(self.policy):
+            return self.policy(path, extension, compress, size)
+
+        if self.policy == "cost":
+            return size * Schedule.FORMATS.get(extension, 1.0) * (Schedule.COMPRESSION if compress else 1.0)
+
+        return size
+
+    def size(self, path):
+        """
+        Gets the size of a file in bytes.
+
+        Args:
+            path: path to input file
+
+        Returns:
+            file size, 0 if file can't be read
+        """
+
+        try:
+            return os.path.getsize(path)
+        except OSError:
+            return 0
+
+    def makespan(self, workers):
+        """
+        Predicts the makespan in cost units of the scheduled tasks. This simulates each worker pulling the next task
+        from the queue as soon as it's free.
+
+        Args:
+            workers: number of worker processes
+
+        Returns:
+            predicted makespan in cost units
+        """
+
+        if not workers or not self.costs:
+            return 0
+
+        # Time at which each worker is free
+        free = [0] * workers
+        for cost in self.costs:
+            heapq.heapreplace(free, free[0] + cost)
+
+        return max(free)
+
+    def report(self, elapsed):
+        """
+        Builds a makespan report. Predicted makespan is converted from cost units to seconds using the observed
+        throughput of this run, which allows comparing ordering policies across runs on the same corpus.
+
+        Args:
+            elapsed: list of elapsed seconds for each worker process
+
+        Returns:
+            dict with predicted, actual and ideal makespan in seconds
+        """
+
+        total, busy = sum(self.costs), sum(elapsed)
+
+        # Seconds per cost unit observed for this run
+        rate = busy / total if total else 0
+
+        return {
+            "policy": self.policy if isinstance(self.policy, str) else "custom",
+            "predicted": self.makespan(len(elapsed)) * rate,
+            "actual": max(elapsed) if elapsed else 0,
+            "ideal": busy / len(elapsed) if elapsed else 0,
+        }
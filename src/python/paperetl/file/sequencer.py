@@ -0,0 +1,80 @@
+"""
+Sequencer module
+"""
+
+
+class Sequencer:
+    """
+    Reorders articles received from worker processes into task order. Articles of the task at the head of the order are
+    released as they arrive, articles of later tasks are buffered until all preceding tasks are complete.
+    """
+
+    def __init__(self, keys):
+        """
+        Creates a new sequencer.
+
+        Args:
+            keys: list of task keys in order
+        """
+
+        # Position of each task key
+        self.position = {key: x for x, key in enumerate(keys)}
+
+        # Current head of the order, buffered articles and completed tasks by position
+        self.head, self.buffers, self.completed = 0, {}, set()
+
+    def add(self, articles, segments):
+        """
+        Adds a batch of articles.
+
+        Args:
+            articles: list of articles
+            segments: list of (task key, count) for articles
+
+        Returns:
+            list of articles ready to be released
+        """
+
+        ready, start = [], 0
+        for key, count in segments:
+            x, chunk = self.position[key], articles[start : start + count]
+            if x == self.head:
+                ready.extend(chunk)
+            else:
+                self.buffers.setdefault(x, []).extend(chunk)
+
+            start += count
+
+        return ready
+
+    def complete(self, keys):
+        """
+        Marks tasks as complete.
+
+        Args:
+            keys: list of completed task keys
+
+        Returns:
+            list of articles ready to be released
+        """
+
+        ready = []
+
+        self.completed.update(self.position[key] for key in keys)
+        while self.head in self.completed:
+            # Advance to the next task and release its buffered articles
+            self.completed.remove(self.head)
+            self.head += 1
+            ready.extend(self.buffers.pop(self.head, []))
+
+        return ready
+
+    def pending(self):
+        """
+        Number of buffered articles.
+
+        Returns:
+            number of articles
+        """
+
+        return sum(len(x) for x in self.buffers.values())
@@ -0,0 +1,109 @@
+"""
+Stream module
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+
+from .cache import Cache
+from .channel import Channel
+from .pool import Pool
+from .schedule import Schedule
+from .sequencer import Sequencer
+from .tasks import Tasks
+from .transport import Transport
+from .worker import Worker
+
+
+class Stream:
+    """
+    Parses files with worker processes and yields articles, without writing to a database. Memory is bounded by the
+    outputs channel limits. Articles are only read from the channel as they are consumed.
+
+    Orderings:
+      - completion: articles are yielded as soon as they are received from worker processes
+      - input: articles are yielded in scheduled task order and in file order within each task. Use schedule="path"
+               for sorted path order. Workers run at most window tasks ahead of the oldest incomplete task,
+               which bounds the number of buffered articles.
+    """
+
+    @staticmethod
+    def articles(indir, config, options):
+        """
+        Parses files in indir and yields articles.
+
+        Args:
+            indir: input directory
+            config: path to config directory, if any
+            options: Options
+
+        Returns:
+            generator of articles
+        """
+
+        processes, inputs, outputs, affinity, tempdir = None, None, None, None, None
+        try:
+            # Create inputs queue
+            context = multiprocessing.get_context(options["method"])
+            inputs = context.Queue()
+
+            # Scan input directory
+            tempdir = tempfile.mkdtemp()
+            tasks = Tasks.scan(indir, config, Schedule(options["schedule"]), None, options["split"], tempdir)
+
+            # Create bounded outputs channel
+            workers, cpus, writer = Pool.cpus(len(tasks), options["workers"], options["reserve"], options["pin"])
+            outputs = Channel(context, workers * 4 if options["maxbatches"] is None else options["maxbatches"], options["maxbytes"])
+
+            # Start worker processes, input ordering requires files to be reported as soon as they are complete
+            sequencer = Sequencer([Tasks.key(*task) for task in tasks]) if options["ordering"] == "input" else None
+            processes = Pool.start(context, inputs, outputs, options.worker(flush=bool(sequencer)), cpus)
+
+            # Input ordering limits how far ahead of the oldest incomplete task workers run
+            window = (options["window"] if options["window"] else workers * 2) if sequencer else len(tasks)
+
+            # Write initial tasks to inputs queue
+            dispatched = Tasks.dispatch(inputs, tasks, 0, window, len(processes))
+
+            # Pin main process to reserved cpus
+            if writer:
+                affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, writer)
+
+            reader = Transport.create(options["transport"])
+            for (message, (result, files, segments)), size in Pool.receive(processes, outputs):
+                articles = []
+                if message == Worker.BATCH:
+                    articles = reader.read(result)
+                    outputs.release(size)
+
+                if sequencer:
+                    articles = sequencer.add(articles, segments) if segments else []
+                    articles.extend(sequencer.complete([(f["path"], f["part"][0] if f.get("part") else 0) for f in files]))
+
+                    # Dispatch more tasks as the oldest incomplete task advances
+                    dispatched = Tasks.dispatch(inputs, tasks, dispatched, sequencer.head + window, len(processes))
+
+                for article in articles:
+                    yield article.build() if options["build"] else article
+
+            # Wait for processes to terminate
+            for process in processes:
+                process.join()
+
+            # Evict least recently used cache entries
+            if options["cache"] and options["cachesize"]:
+                Cache(options["cache"], options["cachesize"]).evict()
+
+        finally:
+            # Restore main process cpu affinity
+            if affinity:
+                os.sched_setaffinity(0, affinity)
+
+            # Delete decompressed files
+            if tempdir:
+                shutil.rmtree(tempdir, ignore_errors=True)
+
+            Pool.close(processes, inputs, outputs, options["transport"])
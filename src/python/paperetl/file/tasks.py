@@ -0,0 +1,227 @@
+"""
+Tasks module
+"""
+
+import os
+
+from .archive import Archive
+from .manifest import Manifest
+from .partition import Partition
+
+
+class Tasks:
+    """
+    Builds and dispatches tasks. Each task is an input file, a byte range of a large input file or an archive member.
+    Tasks are tuples of (path, source, extension, compress, config, part).
+    """
+
+    # Accepted input file extensions
+    EXTENSIONS = ("csv", "pdf", "xml")
+
+    @staticmethod
+    def scan(indir, config, schedule, manifest=None, split=None, tempdir=None):
+        """
+        Scans for files in indir and builds a list of tasks to process.
+
+        Args:
+            indir: input directory
+            config: path to config directory, if any
+            schedule: schedule that orders files for processing
+            manifest: skips files that are unchanged in this manifest, if set
+            split: splits PubMed XML and CSV files larger than this many bytes into parts, if set
+            tempdir: directory for decompressed files that are split and decompressed tar archives
+
+        Returns:
+            list of tasks in scheduled order
+        """
+
+        # Files to process
+        tasks = []
+
+        # Recursively walk directory looking for files
+        for root, _, files in sorted(os.walk(indir)):
+            for f in sorted(files):
+                # Extract file extension
+                extension, compress = Tasks.extension(f)
+
+                # Archive members are processed as separate tasks
+                if Archive.format(f):
+                    path = os.path.join(root, f)
+                    if not manifest or manifest.changed(path):
+                        tasks.extend(Tasks.archive(path, config, tempdir))
+
+                # Check if file ends with accepted extension
+                elif extension in Tasks.EXTENSIONS:
+                    # Build full path to file
+                    path = os.path.join(root, f)
+
+                    # Skip unchanged files
+                    if manifest and not manifest.changed(path):
+                        continue
+
+                    # Split large PubMed and CSV files into parts
+                    splittable = extension == "csv" or (extension == "xml" and f.lower().startswith("pubmed"))
+                    if split and splittable and Partition.size(path, compress) > split:
+                        tasks.extend(Tasks.partition(path, f, extension, compress, config, split, tempdir))
+                    else:
+                        tasks.append((path, f, extension, compress, config, None))
+
+        return schedule(tasks)
+
+    @staticmethod
+    def extension(name):
+        """
+        Gets the data format of a file from its name.
+
+        Args:
+            name: file name
+
+        Returns:
+            (extension, True if file is gzip compressed)
+        """
+
+        parts = name.lower().split(".")
+        return (parts[-2], True) if parts[-1] == "gz" else (parts[-1], False)
+
+    @staticmethod
+    def archive(path, config, tempdir):
+        """
+        Builds a task for each input file in an archive. Compressed tar archives are decompressed into tempdir.
+
+        Args:
+            path: path to archive
+            config: path to config directory
+            tempdir: directory for decompressed archives
+
+        Returns:
+            list of tasks, one per archive member
+        """
+
+        # Original archive metadata
+        stat = Manifest.stat(path)
+
+        target, archive, members = Archive.members(path, tempdir)
+
+        # Filter members with accepted extensions
+        members = [(name, start, end) for name, start, end in members if Tasks.extension(name)[0] in Tasks.EXTENSIONS]
+
+        tasks = []
+        for x, (name, start, end) in enumerate(members):
+            extension, compress = Tasks.extension(name)
+            part = {"path": path, "size": stat["size"], "mtime": stat["mtime"], "start": start, "end": end, "index": x, "count": len(members)}
+            part.update({"archive": archive, "member": name})
+
+            tasks.append((target, os.path.basename(name), extension, compress, config, part))
+
+        return tasks
+
+    @staticmethod
+    def partition(path, source, extension, compress, config, split, tempdir):
+        """
+        Splits a PubMed XML file into parts aligned on article boundaries or a CSV file into parts aligned on row
+        boundaries. Compressed files are decompressed into tempdir.
+
+        Args:
+            path: path to input file
+            source: text string describing stream source
+            extension: data format
+            compress: True if file is gzip compressed
+            config: path to config directory
+            split: target part size in bytes
+            tempdir: directory for decompressed files
+
+        Returns:
+            list of tasks, one per part
+        """
+
+        # Original file metadata
+        stat = Manifest.stat(path)
+
+        # Decompress file so it can be read at arbitrary offsets
+        target = Partition.decompress(path, tempdir) if compress else path
+
+        # CSV parts are read with the header row of the file
+        header, ranges = Partition.rows(target, split) if extension == "csv" else (None, Partition.ranges(target, split))
+
+        tasks = []
+        for x, (start, end) in enumerate(ranges):
+            part = {"path": path, "size": stat["size"], "mtime": stat["mtime"], "start": start, "end": end, "index": x, "count": len(ranges)}
+            if header is not None:
+                part["header"] = header
+
+            tasks.append((target, source, extension, False, config, part))
+
+        return tasks
+
+    @staticmethod
+    def stat(path, source, extension, compress, config, part=None):
+        """
+        Reads metadata for an input file.
+
+        Args:
+            path: path to input file
+            source: text string describing stream source
+            extension: data format
+            compress: True if file is gzip compressed
+            config: path to config directory
+            part: byte range of file to parse, if set
+
+        Returns:
+            (file metadata, part)
+        """
+
+        # pylint: disable=W0613
+        if part:
+            # Metadata of the original file, read when the file was split
+            return {"path": part["path"], "size": part["size"], "mtime": part["mtime"], "part": [part["index"], part["count"]]}, part
+
+        return Manifest.stat(path), None
+
+    @staticmethod
+    def key(path, source, extension, compress, config, part=None):
+        """
+        Builds a unique key for a task.
+
+        Args:
+            path: path to input file
+            source: text string describing stream source
+            extension: data format
+            compress: True if file is gzip compressed
+            config: path to config directory
+            part: byte range of file to parse, if set
+
+        Returns:
+            (path to original file, part index)
+        """
+
+        # pylint: disable=W0613
+        return (part["path"], part["index"]) if part else (path, 0)
+
+    @staticmethod
+    def dispatch(inputs, tasks, dispatched, limit, workers):
+        """
+        Writes tasks to the inputs queue up to limit. Writes end of work sentinels, one per worker process,
+        once all tasks are written.
+
+        Args:
+            inputs: inputs queue
+            tasks: list of tasks
+            dispatched: number of tasks already written
+            limit: maximum number of tasks to write in total
+            workers: number of worker processes
+
+        Returns:
+            number of tasks written, len(tasks) + 1 once sentinels are written
+        """
+
+        for task in tasks[dispatched:limit]:
+            inputs.put(task)
+            dispatched += 1
+
+        if dispatched == len(tasks):
+            for _ in range(workers):
+                inputs.put(None)
+
+            dispatched += 1
+
+        return dispatched
@@ -2,40 +2,104 @@
 TEI (Text Encoding Initiative) XML processing module
 """
 
-import datetime
 import hashlib
 
-from bs4 import BeautifulSoup
-from dateutil import parser
-from nltk.tokenize import sent_tokenize
+from lxml import etree
 
+from ..date import Date
 from ..schema.article import Article
 from ..table import Table
 from ..text import Text
 
+from .teisoup import TEISoup
 
+
+# pylint: disable=c-extension-no-member
 class TEI:
     """
-    Methods to transform TEI (Text Encoding Initiative) XML into article objects.
+    Methods to transform TEI (Text Encoding Initiative) XML into article objects. Documents are parsed with lxml and
+    queried with compiled XPath expressions.
+
+    The output matches the original BeautifulSoup parser (see TEISoup), which read TEI as HTML. This parser reproduces
+    how the HTML parser read the following elements:
+
+      - body and head elements are ignored, their content is moved into the parent element. Body divs are read as
+        children of the text element and section heads are read as the leading text of a div.
+      - title content is read as raw text, child elements are kept as markup
+
+    Documents the BeautifulSoup parser fails on, such as tables without rows or references without titles, are parsed.
     """
 
+    # Parsers - lxml (default) or soup (BeautifulSoup)
+    ENGINE = "lxml"
+
+    # TEI namespace
+    NAMESPACE = "http://www.tei-c.org/ns/1.0"
+    NAMESPACES = {"tei": NAMESPACE}
+
+    # XML parser, tolerates malformed documents
+    PARSER = etree.XMLParser(recover=True, remove_comments=True, remove_pis=True, huge_tree=True)
+
+    # Compiled XPath expressions
+    TITLE = etree.XPath("(//tei:title)[1]", namespaces=NAMESPACES)
+    SOURCE = etree.XPath("(//tei:sourceDesc)[1]", namespaces=NAMESPACES)
+    MONOGR = etree.XPath("(.//tei:monogr)[1]", namespaces=NAMESPACES)
+    DATE = etree.XPath("(.//tei:date)[1]", namespaces=NAMESPACES)
+    PUBLICATION = etree.XPath("(.//tei:title)[1]", namespaces=NAMESPACES)
+    PERSNAME = etree.XPath(".//tei:persName", namespaces=NAMESPACES)
+    SURNAME = etree.XPath("(.//tei:surname)[1]", namespaces=NAMESPACES)
+    FORENAME = etree.XPath("(.//tei:forename)[1]", namespaces=NAMESPACES)
+    AFFILIATION = etree.XPath(".//tei:affiliation", namespaces=NAMESPACES)
+    ORGNAME = etree.XPath(".//tei:orgName", namespaces=NAMESPACES)
+    BIBLSTRUCT = etree.XPath("(//tei:biblStruct)[1]", namespaces=NAMESPACES)
+    IDNO = etree.XPath("(.//tei:idno)[1]", namespaces=NAMESPACES)
+    ABSTRACT = etree.XPath("(//tei:abstract)[1]", namespaces=NAMESPACES)
+    TEXT = etree.XPath("(//tei:text)[1]", namespaces=NAMESPACES)
+    FIGURE = etree.XPath(".//tei:figure", namespaces=NAMESPACES)
+    TABLE = etree.XPath("(.//tei:table)[1]", namespaces=NAMESPACES)
+    REFERENCES = etree.XPath("(//tei:div[@type='references'])[1]", namespaces=NAMESPACES)
+    REFERENCE = etree.XPath("(.//tei:title[@level='a'])[1]", namespaces=NAMESPACES)
+
+    # Elements ignored by the HTML parser, content is moved into the parent element
+    IGNORED = {f"{{{NAMESPACE}}}body", f"{{{NAMESPACE}}}head"}
+
+    # Section elements
+    DIV = f"{{{NAMESPACE}}}div"
+
+    # xml:id attribute
+    ID = "{http://www.w3.org/XML/1998/namespace}id"
+
     @staticmethod
-    def parse(stream, source):
+    def parse(stream, source, engine=None):
         """
         Parses a TEI XML datastream and returns a processed article.
 
         Args:
             stream: handle to input data stream
             source: text string describing stream source, can be None
+            engine: parser engine - lxml or soup, defaults to ENGINE
 
         Returns:
             Article
         """
 
-        soup = BeautifulSoup(stream, "lxml")
+        if (engine if engine else TEI.ENGINE) == "soup":
+            return TEISoup.parse(stream, source)
 
-        title = soup.find("title")
-        title = title.text if title and title.text else None
+        # Parse XML, text streams are encoded since lxml doesn't support text with an encoding declaration
+        data = stream.read()
+        root = etree.fromstring(data.encode("utf-8") if isinstance(data, str) else data, TEI.PARSER)
+        if root is None:
+            print("Failed to parse content - invalid XML")
+            return None
+
+        # Add TEI namespace to documents without a namespace
+        if etree.QName(root).namespace is None:
+            TEI.namespace(root)
+
+        title = TEI.first(TEI.TITLE, root)
+        title = TEI.raw(title) if title is not None else None
+        title = title if title else None
 
         # Extract article metadata
         (
@@ -45,7 +109,7 @@ class TEI:
             affiliations,
             affiliation,
             reference,
-        ) = TEI.metadata(soup)
+        ) = TEI.metadata(root)
 
         # Validate parsed data
         if not title and not reference:
@@ -53,7 +117,7 @@ class TEI:
             return None
 
         # Parse text sections
-        sections = TEI.text(soup, title)
+        sections = TEI.text(root, title)
 
         # Derive uid
         uid = hashlib.sha1(title.encode("utf-8") if title else reference.encode("utf-8")).hexdigest()
@@ -74,22 +138,141 @@ class TEI:
             title,
             "PDF",
             reference,
-            parser.parse(datetime.datetime.now().strftime("%Y-%m-%d")),
+            Date.today(),
         )
 
         # Citation references
-        citations = TEI.citations(soup)
+        citations = TEI.citations(root)
 
         # Create article and return
         return Article(metadata, sections, citations)
 
+    @staticmethod
+    def namespace(root):
+        """
+        Moves all elements without a namespace into the TEI namespace.
+
+        Args:
+            root: root element
+        """
+
+        for element in root.iter(tag=etree.Element):
+            if etree.QName(element).namespace is None:
+                element.tag = f"{{{TEI.NAMESPACE}}}{element.tag}"
+
+    @staticmethod
+    def first(xpath, element):
+        """
+        Runs a XPath expression that selects a single element.
+
+        Args:
+            xpath: compiled XPath expression
+            element: context element
+
+        Returns:
+            first matching element or None
+        """
+
+        result = xpath(element)
+        return result[0] if result else None
+
+    @staticmethod
+    def string(element):
+        """
+        Flattens element into a single text string.
+
+        Args:
+            element: XML element
+
+        Returns:
+            string
+        """
+
+        return "".join(element.itertext())
+
+    @staticmethod
+    def raw(element):
+        """
+        Reads element content as raw text. Text is unescaped and child elements are kept as markup. This is how the HTML
+        parser reads title elements.
+
+        Args:
+            element: XML element
+
+        Returns:
+            string
+        """
+
+        text = element.text if element.text else ""
+        for child in element:
+            # Markup for child element
+            name = etree.QName(child).localname
+            attributes = "".join(f' {TEI.attribute(key)}="{value}"' for key, value in child.attrib.items())
+            content = TEI.raw(child)
+
+            text += f"<{name}{attributes}>{content}</{name}>" if content else f"<{name}{attributes}/>"
+            text += child.tail if child.tail else ""
+
+        return text
+
+    @staticmethod
+    def attribute(name):
+        """
+        Formats an attribute name as it's written in a document.
+
+        Args:
+            name: attribute name
+
+        Returns:
+            formatted attribute name
+        """
+
+        return "xml:id" if name == TEI.ID else etree.QName(name).localname
+
+    @staticmethod
+    def children(element):
+        """
+        Lists the child nodes of an element as read by the HTML parser. Ignored elements are replaced with their content.
+        Adjacent text is merged.
+
+        Args:
+            element: XML element
+
+        Returns:
+            list of text strings and elements
+        """
+
+        nodes = []
+
+        def add(text):
+            if text:
+                if nodes and isinstance(nodes[-1], str):
+                    nodes[-1] += text
+                else:
+                    nodes.append(text)
+
+        add(element.text)
+        for child in element:
+            if child.tag in TEI.IGNORED:
+                for node in TEI.children(child):
+                    if isinstance(node, str):
+                        add(node)
+                    else:
+                        nodes.append(node)
+            else:
+                nodes.append(child)
+
+            add(child.tail)
+
+        return nodes
+
     @staticmethod
     def date(published):
         """
         Attempts to parse a publication date, if available. Otherwise, None is returned.
 
         Args:
-            published: published object
+            published: published element
 
         Returns:
             publication date if available/found, None otherwise
@@ -98,7 +281,7 @@ class TEI:
         # Parse publication date
         # pylint: disable=W0702
         try:
-            published = parser.parse(published["when"]) if published and "when" in published.attrs else None
+            published = Date.parse(published.get("when")) if published is not None and "when" in published.attrib else None
         except:
             published = None
 
@@ -110,7 +293,7 @@ class TEI:
         Parses authors and associated affiliations from the article.
 
         Args:
-            elements: authors elements
+            source: source description element
 
         Returns:
             (semicolon separated list of authors, semicolon separated list of affiliations, primary affiliation)
@@ -119,15 +302,15 @@ class TEI:
         authors = []
         affiliations = []
 
-        for name in source.find_all("persname"):
-            surname = name.find("surname")
-            forename = name.find("forename")
+        for name in TEI.PERSNAME(source):
+            surname = TEI.first(TEI.SURNAME, name)
+            forename = TEI.first(TEI.FORENAME, name)
 
-            if surname and forename:
-                authors.append(f"{surname.text}, {forename.text}")
+            if surname is not None and forename is not None:
+                authors.append(f"{TEI.string(surname)}, {TEI.string(forename)}")
 
-        for affiliation in source.find_all("affiliation"):
-            names = [name.text for name in affiliation.find_all("orgname")]
+        for affiliation in TEI.AFFILIATION(source):
+            names = [TEI.string(name) for name in TEI.ORGNAME(affiliation)]
             affiliations.append((", ".join(names)))
 
         return (
@@ -137,30 +320,32 @@ class TEI:
         )
 
     @staticmethod
-    def metadata(soup):
+    def metadata(root):
         """
         Extracts article metadata.
 
         Args:
-            soup: bs4 handle
+            root: root element
 
         Returns:
-            (published, publication, authors, reference)
+            (published, publication, authors, affiliations, affiliation, reference)
         """
 
         # Build reference link
-        source = soup.find("sourcedesc")
-        if source:
-            published = source.find("monogr").find("date")
-            publication = source.find("monogr").find("title")
+        source = TEI.first(TEI.SOURCE, root)
+        if source is not None:
+            monogr = TEI.first(TEI.MONOGR, source)
+            published = TEI.first(TEI.DATE, monogr) if monogr is not None else None
+            publication = TEI.first(TEI.PUBLICATION, monogr) if monogr is not None else None
 
             # Parse publication information
             published = TEI.date(published)
-            publication = publication.text if publication else None
+            publication = TEI.raw(publication) if publication is not None else None
             authors, affiliations, affiliation = TEI.authors(source)
 
-            struct = soup.find("biblstruct")
-            reference = "https://doi.org/" + struct.find("idno").text if struct and struct.find("idno") else None
+            struct = TEI.first(TEI.BIBLSTRUCT, root)
+            idno = TEI.first(TEI.IDNO, struct) if struct is not None else None
+            reference = "https://doi.org/" + TEI.string(idno) if idno is not None else None
         else:
             published, publication, authors, affiliations, affiliation, reference = (
                 None,
@@ -174,12 +359,12 @@ class TEI:
         return (published, publication, authors, affiliations, affiliation, reference)
 
     @staticmethod
-    def abstract(soup, title):
+    def abstract(root, title):
         """
         Builds a list of title and abstract sections.
 
         Args:
-            soup: bs4 handle
+            root: root element
             title: article title
 
         Returns:
@@ -188,23 +373,24 @@ class TEI:
 
         sections = [("TITLE", title)]
 
-        abstract = soup.find("abstract").text
+        abstract = TEI.first(TEI.ABSTRACT, root)
+        abstract = TEI.string(abstract) if abstract is not None else None
         if abstract:
             # Transform and clean text
             abstract = Text.transform(abstract)
             abstract = abstract.replace("\n", " ")
 
-            sections.extend([("ABSTRACT", x) for x in sent_tokenize(abstract)])
+            sections.extend([("ABSTRACT", x) for x in Text.sentences(abstract)])
 
         return sections
 
     @staticmethod
-    def text(soup, title):
+    def text(root, title):
         """
         Builds a list of text sections.
 
         Args:
-            soup: bs4 handle
+            root: root element
             title: article title
 
         Returns:
@@ -212,48 +398,58 @@ class TEI:
         """
 
         # Initialize with title and abstract text
-        sections = TEI.abstract(soup, title)
+        sections = TEI.abstract(root, title)
+
+        body = TEI.first(TEI.TEXT, root)
+        if body is None:
+            return sections
+
+        # Section names and texts, split into sentences as a batch
+        names, texts = [], []
+        for section in TEI.children(body):
+            if isinstance(section, str) or section.tag != TEI.DIV:
+                continue
 
-        for section in soup.find("text").find_all("div", recursive=False):
             # Section name and text
-            children = list(section.children)
+            children = TEI.children(section)
 
             # Attempt to parse section header
-            if children and not children[0].name:
-                name = str(children[0]).upper()
+            if children and isinstance(children[0], str):
+                name = children[0].upper()
                 children = children[1:]
             else:
                 name = None
 
-            text = " ".join([str(e.text) if hasattr(e, "text") else str(e) for e in children])
+            text = " ".join([e if isinstance(e, str) else TEI.string(e) for e in children])
             text = text.replace("\n", " ")
 
-            # Transform and clean text
-            text = Text.transform(text)
+            names.append(name)
+            texts.append(text)
 
-            # Split text into sentences, transform text and add to sections
-            sections.extend([(name, x) for x in sent_tokenize(text)])
+        # Transform and clean text, split text into sentences and add to sections
+        for name, sentences in zip(names, Text.batch(Text.transform(texts))):
+            sections.extend([(name, x) for x in sentences])
 
         # Extract text from tables
-        for i, figure in enumerate(soup.find("text").find_all("figure")):
+        for i, figure in enumerate(TEI.FIGURE(body)):
             # Use XML Id (if available) as figure name to ensure figures are uniquely named
-            name = figure.get("xml:id")
+            name = figure.get(TEI.ID)
             name = name.upper() if name else f"FIGURE_{i}"
 
             # Search for table
-            table = figure.find("table")
-            if table:
-                sections.extend([(name, x) for x in Table.extract(table)])
+            table = TEI.first(TEI.TABLE, figure)
+            if table is not None:
+                sections.extend([(name, x) for x in Table.build([[TEI.string(cell) for cell in row] for row in table])])
 
         return sections
 
     @staticmethod
-    def citations(soup):
+    def citations(root):
         """
         Gets a list of citation references for this article.
 
         Args:
-            soup: bs4 handle
+            root: root element
 
         Returns:
             list of citation references
@@ -262,9 +458,11 @@ class TEI:
         # Citation references
         citations = []
 
-        references = soup.find("div", {"type": "references"})
-        if references:
-            for title in references.find("title", {"level": "a"}):
+        references = TEI.first(TEI.REFERENCES, root)
+        title = TEI.first(TEI.REFERENCE, references) if references is not None else None
+        if title is not None:
+            title = TEI.raw(title)
+            if title:
                 citations.append(hashlib.sha1(title.encode("utf-8")).hexdigest())
 
         return citations
@@ -0,0 +1,194 @@
+"""
+Transport module
+"""
+
+import os
+import pickle
+import tempfile
+
+from abc import ABC, abstractmethod
+from multiprocessing import resource_tracker, shared_memory
+
+from ..schema.article import Article
+
+
+class Transport(ABC):
+    """
+    Base class for moving batches of articles from worker processes to the main process. Batches are encoded as
+    compact tuples instead of pickled Article objects.
+    """
+
+    # Messages reference resources outside of the outputs channel that must be released
+    RESOURCES = False
+
+    @staticmethod
+    def create(method):
+        """
+        Creates a new transport.
+
+        Args:
+            method: transport method - file, pipe or shm
+
+        Returns:
+            Transport
+        """
+
+        if method == "pipe":
+            return PipeTransport()
+        if method == "shm":
+            # Blocks are freed on Windows as soon as the last handle closes
+            if os.name != "posix":
+                raise ValueError("Shared memory transport requires a POSIX platform")
+
+            return SharedMemoryTransport()
+        if method in (None, "file"):
+            return FileTransport()
+
+        raise ValueError(f"Unknown transport method: {method}")
+
+    def encode(self, batch):
+        """
+        Encodes a batch of articles.
+
+        Args:
+            batch: list of articles
+
+        Returns:
+            encoded bytes
+        """
+
+        return pickle.dumps([(x.metadata, x.sections, x.citations) for x in batch], protocol=pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, data):
+        """
+        Decodes a batch of articles.
+
+        Args:
+            data: encoded bytes
+
+        Returns:
+            list of articles
+        """
+
+        return [Article(*x) for x in pickle.loads(data)]
+
+    @abstractmethod
+    def write(self, data):
+        """
+        Writes encoded data to the transport. Called in worker processes.
+
+        Args:
+            data: encoded bytes
+
+        Returns:
+            message to send to the main process
+        """
+
+    @abstractmethod
+    def read(self, message):
+        """
+        Reads a batch of articles from the transport and releases any resources held. Called in the main process.
+
+        Args:
+            message: message sent by a worker process
+
+        Returns:
+            list of articles
+        """
+
+    def discard(self, message):
+        """
+        Releases any resources held by a message that will never be read. Called in the main process.
+
+        Args:
+            message: message sent by a worker process
+        """
+
+
+class FileTransport(Transport):
+    """
+    Transports batches through temporary files.
+    """
+
+    RESOURCES = True
+
+    def write(self, data):
+        with tempfile.NamedTemporaryFile(mode="wb", delete=False) as output:
+            # Write batch to temporary file
+            output.write(data)
+
+            # Temporary file name
+            return output.name
+
+    def read(self, message):
+        with open(message, "rb") as f:
+            batch = self.decode(f.read())
+
+        # Delete temporary file
+        os.remove(message)
+
+        return batch
+
+    def discard(self, message):
+        if os.path.exists(message):
+            os.remove(message)
+
+
+class PipeTransport(Transport):
+    """
+    Transports batches directly through the outputs channel pipe.
+    """
+
+    def write(self, data):
+        return data
+
+    def read(self, message):
+        return self.decode(message)
+
+
+class SharedMemoryTransport(Transport):
+    """
+    Transports batches through shared memory blocks. Each batch is written to a new block owned by the main
+    process once sent. Only the block name and size are sent through the outputs channel.
+
+    Blocks stay registered with the resource tracker until the main process unlinks them. The main process starts the
+    tracker before worker processes are started, so workers share it and blocks outlive the worker that wrote them. Blocks
+    that are never read are unlinked by the tracker when the main process exits.
+    """
+
+    RESOURCES = True
+
+    def __init__(self):
+        # Start the resource tracker shared with worker processes, no-op when already running
+        resource_tracker.ensure_running()
+
+    def write(self, data):
+        block = shared_memory.SharedMemory(create=True, size=len(data))
+        block.buf[: len(data)] = data
+        block.close()
+
+        return (block.name, len(data))
+
+    def read(self, message):
+        name, size = message
+
+        block = shared_memory.SharedMemory(name=name)
+        try:
+            with block.buf[:size] as view:
+                batch = self.decode(view)
+        finally:
+            block.close()
+            block.unlink()
+
+        return batch
+
+    def discard(self, message):
+        name, _ = message
+
+        try:
+            block = shared_memory.SharedMemory(name=name)
+        except FileNotFoundError:
+            return
+
+        block.close()
+        block.unlink()
@@ -0,0 +1,381 @@
+"""
+Worker module
+"""
+
+import os
+import time
+
+from io import StringIO
+
+from ..metrics import Metrics, Timed
+from ..sqlite import SQLite
+from ..text import Text
+
+from .archive import Archive
+from .arx import ARX
+from .cache import Cache
+from .csvf import CSV
+from .grobid import Grobid
+from .manifest import Manifest
+from .partition import Partition
+from .pdf import PDF
+from .pmb import PMB
+from .profiler import Profiler
+from .reader import Reader
+from .tasks import Tasks
+from .tei import TEI
+from .transport import Transport
+
+
+class Worker:
+    """
+    Parses tasks in worker processes and sends batches of articles to the main process.
+    """
+
+    # Worker process message types
+    BATCH, COMPLETE = 0, 1
+
+    @staticmethod
+    def mode(extension):
+        """
+        Determines file open mode for a data format.
+
+        Args:
+            extension: data format
+
+        Returns:
+            file open mode
+        """
+
+        # PDF, XML and CSV files are parsed from binary streams
+        return "rb" if extension in ("pdf", "xml", "csv") else "r"
+
+    @staticmethod
+    def parse(path, source, extension, compress, config, part=None):
+        """
+        Parses articles from file at path.
+
+        Args:
+            path: path to input file
+            source: text string describing stream source
+            extension: data format
+            compress: True if file is gzip compressed
+            config: path to config directory
+            part: byte range of file to parse, if set
+        """
+
+        print(Worker.describe(path, part))
+
+        # Determine if file needs to be open in binary or text mode
+        mode = Worker.mode(extension)
+
+        with Worker.open(path, mode, compress, part) as stream:
+            if extension == "pdf":
+                yield PDF.parse(stream, source)
+            elif extension == "xml":
+                if source and source.lower().startswith("arxiv"):
+                    yield from ARX.parse(stream, source)
+                elif source and source.lower().startswith("pubmed"):
+                    yield from PMB.parse(stream, source, config)
+                else:
+                    yield TEI.parse(stream, source)
+            elif extension == "csv":
+                yield from CSV.parse(stream, source)
+
+    @staticmethod
+    def describe(path, part=None):
+        """
+        Builds a progress message for a task.
+
+        Args:
+            path: path to input file
+            part: byte range or archive member of file, if set
+
+        Returns:
+            progress message
+        """
+
+        if part and part.get("member"):
+            return f"Processing: {part['path']}:{part['member']} [{part['index'] + 1}/{part['count']}]"
+
+        return f"Processing: {part['path']} [{part['index'] + 1}/{part['count']}]" if part else f"Processing: {path}"
+
+    @staticmethod
+    def open(path, mode, compress, part):
+        """
+        Opens an input file stream. Time spent reading is recorded as the read stage.
+
+        Args:
+            path: path to input file
+            mode: file open mode
+            compress: True if file is gzip compressed
+            part: byte range or archive member of file to read, if set
+
+        Returns:
+            input stream
+        """
+
+        if part and part.get("member"):
+            return Timed(Archive.open(path, part, mode, compress))
+        if part:
+            return Timed(Partition.open(path, part["start"], part["end"], part.get("header")))
+        if compress:
+            return Timed(Reader.open(path, mode))
+
+        return Timed(open(path, mode, encoding="utf-8" if mode == "r" else None))
+
+    @staticmethod
+    def process(inputs, outputs, settings, worker=0, cpu=None, shard=None):
+        """
+        Main worker process loop. Processes file paths stored in inputs and writes articles
+        to outputs. Runs until an end of work sentinel (None) is read from inputs. Writes a final
+        message with worker statistics upon completion.
+
+        Processed files are sent along with the batch containing their last article. This ensures
+        files are only recorded as processed once all their articles are saved. Each processed file
+        also carries its elapsed time by stage. Each batch also lists the task each article was
+        parsed from as a list of (task key, count) segments.
+
+        Args:
+            inputs: inputs queue
+            outputs: outputs channel
+            settings: worker settings, see Options.worker
+            worker: worker index
+            cpu: pin this process to cpu, if set
+            shard: saves articles to a SQLite shard database in this directory instead of sending them to outputs, if set
+        """
+
+        profiler = Worker.setup(settings, worker, cpu)
+
+        start, stats = time.perf_counter(), {"worker": worker, "cpu": cpu, "files": 0, "articles": 0, "bytes": 0}
+        transport, batch, files, segments = Transport.create(settings["transport"]), [], [], []
+
+        # Task results, PDFs are converted in the background with a GROBID client created on the first PDF
+        tasks = Worker.tasks(inputs, settings["grobid"])
+
+        # Shard database, shards are temporary and always bulk loaded
+        db = SQLite(shard, True, settings["transaction"], True) if shard else None
+        try:
+            # Process until the end of work sentinel is received
+            for params, results in tasks:
+                # Read file metadata before parsing
+                stat, part = Tasks.stat(*params)
+                key = Tasks.key(*params)
+                stat.update({"worker": worker, "bytes": part["end"] - part["start"] if part else stat["size"], "articles": 0})
+
+                # Parse file and save successfully parsed (not None) results
+                clock, snapshot = time.perf_counter(), Metrics.snapshot()
+                for result in results:
+                    if result:
+                        batch.append(result)
+
+                        # Track the task of each article in the batch
+                        if segments and segments[-1][0] == key:
+                            segments[-1][1] += 1
+                        else:
+                            segments.append([key, 1])
+
+                        if len(batch) == settings["batchsize"]:
+                            Worker.send(outputs, transport, batch, files, segments, db)
+                            batch, files, segments = [], [], []
+
+                        stat["articles"] += 1
+
+                # Parse time is the time spent on this file not covered by another stage
+                stat["seconds"] = time.perf_counter() - clock
+                stat["stages"] = Metrics.since(snapshot)
+                stat["stages"]["parse"] = max(stat["seconds"] - sum(stat["stages"].values()), 0.0)
+                Metrics.add("parse", stat["stages"]["parse"])
+
+                # File complete, hash is only calculated once for files split into parts
+                clock = time.perf_counter()
+                stat["hash"] = Manifest.hash(stat["path"]) if settings["manifest"] and not (part and part["index"]) else None
+                Metrics.add("hash", time.perf_counter() - clock)
+
+                files.append(stat)
+
+                # Send pending batch and completed files
+                if settings["flush"]:
+                    Worker.send(outputs, transport, batch, files, segments, db)
+                    batch, files, segments = [], [], []
+
+                stats["files"] += 1
+                stats["articles"] += stat["articles"]
+                stats["bytes"] += stat["bytes"]
+
+        finally:
+            # Close GROBID client
+            tasks.close()
+
+            # Final batch
+            if batch:
+                Worker.send(outputs, transport, batch, files, segments, db)
+                files = []
+
+            # Commit and close shard database before signaling completion
+            if db:
+                db.close()
+
+            # Write profile before signaling completion
+            if profiler:
+                profiler.stop()
+
+            # Write message that process is complete
+            stats["seconds"] = time.perf_counter() - start
+            stats["stages"] = Metrics.snapshot()
+            outputs.put((Worker.COMPLETE, (stats, files, None)))
+
+    @staticmethod
+    def setup(settings, worker, cpu):
+        """
+        Prepares a worker process before processing tasks.
+
+        Args:
+            settings: worker settings, see Options.worker
+            worker: worker index
+            cpu: pin this process to cpu, if set
+
+        Returns:
+            started profiler, if profiling is enabled
+        """
+
+        # Pin process to cpu
+        if cpu is not None:
+            os.sched_setaffinity(0, {cpu})
+
+        # Clear stage timings inherited from the parent process
+        Metrics.clear()
+
+        # Load sentence splitter once per process
+        if settings["splitter"]:
+            Text.splitter(settings["splitter"])
+
+        # Start profiler
+        profiler = Profiler(settings["profile"], f"worker-{worker}") if settings["profile"] else None
+        if profiler:
+            profiler.start()
+
+        return profiler
+
+    @staticmethod
+    def tasks(inputs, grobid=None):
+        """
+        Reads tasks from inputs until an end of work sentinel (None) is read. When GROBID settings are set, PDFs are
+        converted in the background with multiple requests in flight. The GROBID client is created when the first PDF
+        is read and closed when this generator is closed. All other tasks are parsed as they are read.
+
+        Args:
+            inputs: inputs queue
+            grobid: GROBID settings (url, concurrency, cache) for background PDF conversion, if set
+
+        Returns:
+            generator of (task parameters, generator of parsed articles)
+        """
+
+        client = None
+        try:
+            # Zip archives stay open across consecutive members until this generator is closed
+            with Archive.scope():
+                for params in iter(inputs.get, None):
+                    if grobid is not None and params[2] == "pdf":
+                        path, _, _, compress, _, part = params
+                        print(Worker.describe(path, part))
+
+                        # Read PDF and submit for conversion
+                        with Worker.open(path, "rb", compress, part) as stream:
+                            data = stream.read()
+
+                        if not client:
+                            client = Grobid(
+                                grobid.get("url"), grobid.get("concurrency"), cache=Cache(grobid["cache"]) if grobid.get("cache") else None
+                            )
+
+                        for result in client.submit(params, data):
+                            yield Worker.converted(*result)
+                    else:
+                        yield params, Worker.parse(*params)
+
+            # Wait for remaining conversions
+            if client:
+                for result in client.complete():
+                    yield Worker.converted(*result)
+        finally:
+            if client:
+                client.close()
+
+    @staticmethod
+    def converted(params, xml, seconds):
+        """
+        Builds a task result for a converted PDF.
+
+        Args:
+            params: task parameters
+            xml: TEI XML string, None if conversion failed
+            seconds: conversion time in seconds
+
+        Returns:
+            (task parameters, generator of parsed articles)
+        """
+
+        Metrics.add("convert", seconds)
+        return params, Worker.tei(xml, params[1])
+
+    @staticmethod
+    def tei(xml, source):
+        """
+        Parses a TEI XML string.
+
+        Args:
+            xml: TEI XML string, can be None
+            source: text string describing stream source
+
+        Returns:
+            generator with the parsed article
+        """
+
+        yield TEI.parse(StringIO(xml), source) if xml else None
+
+    @staticmethod
+    def send(outputs, transport, batch, files, segments, db=None):
+        """
+        Encodes and writes a batch to outputs. Blocks while the outputs channel is full. When a shard database is set,
+        the batch is saved to the shard database and only completed files are written to outputs.
+
+        Args:
+            outputs: outputs channel
+            transport: batch transport
+            batch: batch to send
+            files: list of files completed with this batch
+            segments: list of (task key, count) for the articles in batch
+            db: shard database, if set
+        """
+
+        if db:
+            # Save batch to shard database, this method will skip duplicates based on entry date
+            start = time.perf_counter()
+            for article in batch:
+                db.save(article)
+            Metrics.add("insert", time.perf_counter() - start)
+
+            start = time.perf_counter()
+            outputs.put((Worker.BATCH, (None, files, segments)))
+            Metrics.add("wait", time.perf_counter() - start)
+            return
+
+        # Encode batch
+        start = time.perf_counter()
+        data = transport.encode(batch)
+        Metrics.add("serialize", time.perf_counter() - start)
+
+        # Wait for room in the outputs channel before writing to the transport
+        start = time.perf_counter()
+        outputs.reserve(len(data))
+        Metrics.add("wait", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        message = transport.write(data)
+        Metrics.add("serialize", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        outputs.put((Worker.BATCH, (message, files, segments)), len(data))
+        Metrics.add("wait", time.perf_counter() - start)
@@ -35,6 +35,8 @@ class FileSystem(Database):
         with open(os.path.join(self.outdir, output), "w", encoding="utf-8") as output:
             self.write(output, article.build())
 
+        return True
+
     def extension(self):
         """
         Returns file extension for generated files
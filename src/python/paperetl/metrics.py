@@ -0,0 +1,128 @@
+"""
+Metrics module
+"""
+
+import time
+
+
+class Metrics:
+    """
+    Accumulates elapsed time by processing stage for the current process.
+    """
+
+    # Elapsed seconds by stage
+    STAGES = {}
+
+    @staticmethod
+    def add(stage, seconds):
+        """
+        Adds elapsed time to a stage.
+
+        Args:
+            stage: stage name
+            seconds: elapsed seconds
+        """
+
+        Metrics.STAGES[stage] = Metrics.STAGES.get(stage, 0.0) + seconds
+
+    @staticmethod
+    def snapshot():
+        """
+        Copies the current stage totals.
+
+        Returns:
+            {stage: seconds}
+        """
+
+        return dict(Metrics.STAGES)
+
+    @staticmethod
+    def since(snapshot):
+        """
+        Gets elapsed time by stage since snapshot was taken.
+
+        Args:
+            snapshot: stage totals from a previous snapshot call
+
+        Returns:
+            {stage: seconds}
+        """
+
+        return {stage: seconds - snapshot.get(stage, 0.0) for stage, seconds in Metrics.STAGES.items()}
+
+    @staticmethod
+    def clear():
+        """
+        Clears all stage totals.
+        """
+
+        Metrics.STAGES = {}
+
+
+class Timed:
+    """
+    Wraps a file-like stream and records time spent reading as the read stage. For compressed streams, this includes time
+    spent waiting on decompression.
+    """
+
+    def __init__(self, stream, stage="read"):
+        """
+        Creates a new timed stream.
+
+        Args:
+            stream: file-like stream
+            stage: stage name
+        """
+
+        self.stream, self.stage = stream, stage
+
+    def read(self, *args):
+        """
+        Reads from the stream and records the elapsed time.
+        """
+
+        start = time.perf_counter()
+        try:
+            return self.stream.read(*args)
+        finally:
+            Metrics.add(self.stage, time.perf_counter() - start)
+
+    def readline(self, *args):
+        """
+        Reads a line from the stream and records the elapsed time.
+        """
+
+        start = time.perf_counter()
+        try:
+            return self.stream.readline(*args)
+        finally:
+            Metrics.add(self.stage, time.perf_counter() - start)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        try:
+            return next(self.stream)
+        finally:
+            Metrics.add(self.stage, time.perf_counter() - start)
+
+    @property
+    def mode(self):
+        """
+        Gets the stream mode.
+        """
+
+        # Some binary streams (ex. gzip.GzipFile) report mode as an integer, only string modes are passed through
+        mode = getattr(self.stream, "mode", "")
+        return mode if isinstance(mode, str) else ""
+
+    def __getattr__(self, name):
+        return getattr(self.stream, name)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.stream.close()
@@ -0,0 +1,143 @@
+"""
+Splitter module
+"""
+
+import re
+
+import nltk
+
+from nltk.tokenize import punkt
+
+
+class Splitter:
+    """
+    Splits text into sentences. Splitters are created once per process and split a batch of paragraphs per call.
+
+    The following methods are supported:
+
+      - nltk: NLTK punkt model, the most accurate method
+      - rules: rule-based splitting on sentence-ending punctuation followed by an uppercase character or number
+      - none: no splitting, each paragraph is a single sentence
+    """
+
+    # Sentence splitting methods
+    METHODS = ("nltk", "rules", "none")
+
+    # Sentence boundary candidates: terminal punctuation, optional closing quotes/brackets, whitespace, then the start of
+    # a sentence
+    BOUNDARY = re.compile(r"[.!?]+[\"'\)\]]*\s+(?=[\"'\(\[]?[A-Z0-9])")
+
+    # Words that end with a period and don't end a sentence
+    ABBREVIATIONS = {
+        "al.",
+        "approx.",
+        "ca.",
+        "cf.",
+        "dr.",
+        "e.g.",
+        "eq.",
+        "eqs.",
+        "etc.",
+        "fig.",
+        "figs.",
+        "i.e.",
+        "inc.",
+        "mr.",
+        "mrs.",
+        "ms.",
+        "no.",
+        "nos.",
+        "prof.",
+        "ref.",
+        "refs.",
+        "sp.",
+        "spp.",
+        "st.",
+        "u.s.",
+        "vs.",
+    }
+
+    # Initials and single letter abbreviations (ex. A.)
+    INITIAL = re.compile(r"^(?:[A-Za-z]\.)+$")
+
+    def __init__(self, method="nltk"):
+        """
+        Creates a new splitter.
+
+        Args:
+            method: sentence splitting method - nltk, rules or none
+        """
+
+        if method not in Splitter.METHODS:
+            raise ValueError(f"Unknown sentence splitting method: {method}")
+
+        self.method = method
+
+        # Load punkt model once
+        self.tokenizer = Splitter.punkt() if method == "nltk" else None
+
+    def __call__(self, texts):
+        """
+        Splits a batch of texts into sentences.
+
+        Args:
+            texts: list of texts
+
+        Returns:
+            list of sentences per text
+        """
+
+        if self.method == "nltk":
+            tokenize = self.tokenizer.tokenize
+            return [tokenize(text) for text in texts]
+
+        if self.method == "rules":
+            return [self.rules(text) for text in texts]
+
+        return [[text.strip()] if text and not text.isspace() else [] for text in texts]
+
+    def rules(self, text):
+        """
+        Splits text into sentences with rule-based boundary detection.
+
+        Args:
+            text: input text
+
+        Returns:
+            list of sentences
+        """
+
+        sentences, start = [], 0
+        for match in Splitter.BOUNDARY.finditer(text):
+            # Skip periods after abbreviations and initials
+            if text[match.start()] == ".":
+                word = text[text.rfind(" ", 0, match.start()) + 1 : match.start() + 1]
+                if word.lower() in Splitter.ABBREVIATIONS or Splitter.INITIAL.match(word):
+                    continue
+
+            sentence = text[start : match.end()].strip()
+            if sentence:
+                sentences.append(sentence)
+
+            start = match.end()
+
+        sentence = text[start:].strip()
+        if sentence:
+            sentences.append(sentence)
+
+        return sentences
+
+    @staticmethod
+    def punkt():
+        """
+        Loads the NLTK punkt model.
+
+        Returns:
+            punkt tokenizer
+        """
+
+        # NLTK 3.8.2+ loads punkt_tab models, earlier versions load pickled models
+        if hasattr(punkt, "PunktTokenizer"):
+            return punkt.PunktTokenizer("english")
+
+        return nltk.data.load("tokenizers/punkt/english.pickle")
@@ -3,11 +3,12 @@ SQLite module
 """
 
 import os
+import shutil
 import sqlite3
 
-from dateutil import parser
-
+from .bloom import Bloom
 from .database import Database
+from .date import Date
 
 
 class SQLite(Database):
@@ -60,42 +61,108 @@ class SQLite(Database):
         "Reference": "TEXT",
     }
 
+    # Number of buffered section and citation rows written per batch
+    BATCH = 10000
+
+    # Default number of articles per transaction
+    TRANSACTION = 1000
+
+    # Maximum number of existing articles with entry dates held in memory, larger databases use a bloom filter of ids
+    ENTRIES = 1000000
+
+    # Settings used while loading a new database, trades durability for speed. A failed load leaves a database that
+    # must be recreated.
+    BULK = {"journal_mode": "MEMORY", "synchronous": "OFF", "cache_size": -262144, "temp_store": "MEMORY", "mmap_size": 268435456}
+
+    # Default settings, restored once loading is complete
+    SAFE = {"journal_mode": "DELETE", "synchronous": "FULL", "cache_size": -2000, "temp_store": "DEFAULT", "mmap_size": 0}
+
     # SQL statements
     CREATE_TABLE = "CREATE TABLE IF NOT EXISTS {table} ({fields})"
     INSERT_ROW = "INSERT INTO {table} ({columns}) VALUES ({values})"
-    CREATE_SECTION_INDEX = "CREATE INDEX section_article ON sections(article)"
-    CREATE_CITATION_INDEX_1 = "CREATE INDEX citation_article ON citations(article)"
-    CREATE_CITATION_INDEX_2 = "CREATE INDEX citation_reference ON citations(reference)"
+    UPSERT_ROW = "INSERT INTO {table} ({columns}) VALUES ({values}) ON CONFLICT(Id) DO UPDATE SET {updates}"
+    CREATE_SECTION_INDEX = "CREATE INDEX IF NOT EXISTS section_article ON sections(article)"
+    CREATE_CITATION_INDEX_1 = "CREATE INDEX IF NOT EXISTS citation_article ON citations(article)"
+    CREATE_CITATION_INDEX_2 = "CREATE INDEX IF NOT EXISTS citation_reference ON citations(reference)"
+    PRAGMA = "PRAGMA {name} = {value}"
 
     # Restore index when updating an existing database
     SECTION_COUNT = "SELECT MAX(Id) FROM sections"
     CITATION_COUNT = "SELECT MAX(Id) FROM citations"
 
+    # Load existing articles
+    COUNT_ARTICLES = "SELECT COUNT(*) FROM articles"
+    SELECT_ENTRIES = "SELECT Id, Entry FROM articles"
+    SELECT_IDS = "SELECT Id FROM articles"
+
     # Lookup entry date for an article
     LOOKUP_ENTRY = "SELECT Entry FROM articles WHERE id = ?"
 
-    # Delete article
-    DELETE_ARTICLE = "DELETE FROM articles WHERE id = ?"
+    # Delete sections and citations of a replaced article
     DELETE_SECTIONS = "DELETE FROM sections WHERE article = ?"
+    DELETE_CITATIONS = "DELETE FROM citations WHERE article = ?"
+
+    # Merge shard databases
+    ATTACH_SHARD = "ATTACH DATABASE ? AS shard"
+    DETACH_SHARD = "DETACH DATABASE shard"
+    CREATE_MERGED = "CREATE TEMP TABLE merged (Id TEXT PRIMARY KEY)"
+    DROP_MERGED = "DROP TABLE temp.merged"
+
+    # Shard articles that are new, replace an existing article without an entry date or have a later entry date than the
+    # existing article. Same rules as savearticle.
+    SELECT_MERGED = (
+        "INSERT INTO temp.merged SELECT s.Id FROM shard.articles s LEFT JOIN main.articles a ON a.Id = s.Id "
+        "WHERE a.Id IS NULL OR a.Entry IS NULL OR julianday(s.Entry) > julianday(a.Entry)"
+    )
+
+    DELETE_MERGED_ARTICLES = "DELETE FROM main.articles WHERE Id IN (SELECT Id FROM temp.merged)"
+    DELETE_MERGED_SECTIONS = "DELETE FROM main.sections WHERE Article IN (SELECT Id FROM temp.merged)"
+    DELETE_MERGED_CITATIONS = "DELETE FROM main.citations WHERE Article IN (SELECT Id FROM temp.merged)"
+    MERGE_ARTICLES = "INSERT INTO main.articles SELECT * FROM shard.articles WHERE Id IN (SELECT Id FROM temp.merged)"
 
-    def __init__(self, outdir, replace):
+    # Section and citation ids are renumbered starting at the next id
+    MERGE_SECTIONS = (
+        "INSERT INTO main.sections (Id, Article, Name, Text) SELECT ? + ROW_NUMBER() OVER (ORDER BY Id) - 1, Article, Name, Text "
+        "FROM shard.sections WHERE Article IN (SELECT Id FROM temp.merged)"
+    )
+    MERGE_CITATIONS = (
+        "INSERT INTO main.citations (Id, Article, Reference) SELECT ? + ROW_NUMBER() OVER (ORDER BY Id) - 1, Article, Reference "
+        "FROM shard.citations WHERE Article IN (SELECT Id FROM temp.merged)"
+    )
+
+    def __init__(self, outdir, replace, transaction=None, bulk=False):
         """
-        Creates and initializes a new output SQLite database.
+        Creates and initializes a new output SQLite database. New databases can be loaded in bulk-load mode, which relaxes
+        journaling and syncing while loading and creates indexes when complete.
 
         Args:
             outdir: output directory
             replace: If database should be recreated
+            transaction: number of articles per transaction, defaults to TRANSACTION
+            bulk: if True, new databases are loaded in bulk-load mode, a failed load leaves a database that must be recreated
         """
 
+        if transaction is not None and transaction < 1:
+            raise ValueError(f"Invalid transaction size: {transaction}")
+
+        # Number of articles per transaction
+        self.size = transaction if transaction else SQLite.TRANSACTION
+
         # Create if output path doesn't exist
         os.makedirs(outdir, exist_ok=True)
 
+        # Shard databases merged into this database when complete
+        self.outdir, self.shards = outdir, []
+
         # Output database file
         dbfile = os.path.join(outdir, "articles.sqlite")
 
         # Create flag
         create = replace or not os.path.exists(dbfile)
 
+        # New database flag, state kept for a previous database (e.g. a manifest of processed files) is stale
+        self.created = create
+
         # Delete existing file if replace set
         if replace and os.path.exists(dbfile):
             os.remove(dbfile)
@@ -103,12 +170,33 @@ class SQLite(Database):
         # Index fields
         self.aindex, self.sindex, self.cindex = 0, 0, 0
 
+        # Insert statements and column converters, built once per table. Articles are upserted.
+        self.statements = {
+            "articles": self.statement(SQLite.ARTICLES, "articles", True),
+            "sections": self.statement(SQLite.SECTIONS, "sections"),
+            "citations": self.statement(SQLite.CITATIONS, "citations"),
+        }
+
+        # Article, section and citation rows buffered for batch inserts
+        self.buffers = {"articles": [], "sections": [], "citations": []}
+
+        # Replaced articles with the first section and citation id of the replacement, applied when buffered rows are written
+        self.replaced = {}
+
+        # Entry dates by article id and bloom filter of existing article ids, loaded on first save
+        self.entries, self.bloom = {} if create else None, None
+
         # Connect to output database
         self.db = sqlite3.connect(dbfile)
 
         # Create database cursor
         self.cur = self.db.cursor()
 
+        # Bulk-load new databases when enabled, indexes are created when complete
+        self.bulk, self.indexed = create and bulk, False
+        if self.bulk:
+            self.pragmas(SQLite.BULK)
+
         if create:
             # Create articles table
             self.create(SQLite.ARTICLES, "articles")
@@ -118,14 +206,14 @@ class SQLite(Database):
 
             # Create citations table
             self.create(SQLite.CITATIONS, "citations")
-
-            # Create indexes
-            for index in [SQLite.CREATE_SECTION_INDEX, SQLite.CREATE_CITATION_INDEX_1, SQLite.CREATE_CITATION_INDEX_2]:
-                self.execute(index)
         else:
             # Restore section and citation index id
-            self.sindex = int(self.cur.execute(SQLite.SECTION_COUNT).fetchone()[0]) + 1
-            self.cindex = int(self.cur.execute(SQLite.CITATION_COUNT).fetchone()[0]) + 1
+            self.sindex = self.next(SQLite.SECTION_COUNT)
+            self.cindex = self.next(SQLite.CITATION_COUNT)
+
+        # Create indexes unless bulk loading. Also creates indexes missing from a bulk load that wasn't completed.
+        if not self.bulk:
+            self.index()
 
         # Start transaction
         self.cur.execute("BEGIN")
@@ -135,29 +223,25 @@ class SQLite(Database):
         if self.savearticle(article):
             # Increment number of articles processed
             self.aindex += 1
-            if self.aindex % 1000 == 0:
+            if self.aindex % self.size == 0:
                 print(f"Inserted {self.aindex} articles", end="\r")
 
                 # Commit current transaction and start a new one
                 self.transaction()
 
-            for name, text in article.sections:
-                # Section row - id, article, name, text
-                self.insert(
-                    SQLite.SECTIONS,
-                    "sections",
-                    (self.sindex, article.uid(), name, text),
-                )
-                self.sindex += 1
-
-            for reference in article.citations:
-                # Citation row - id, article, reference
-                self.insert(
-                    SQLite.CITATIONS,
-                    "citations",
-                    (self.cindex, article.uid(), reference),
-                )
-                self.cindex += 1
+            uid = article.uid()
+
+            # Section rows - id, article, name, text
+            self.buffer("sections", [(self.sindex + x, uid, name, text) for x, (name, text) in enumerate(article.sections)])
+            self.sindex += len(article.sections)
+
+            # Citation rows - id, article, reference
+            self.buffer("citations", [(self.cindex + x, uid, reference) for x, reference in enumerate(article.citations)])
+            self.cindex += len(article.citations)
+
+            return True
+
+        return False
 
     def savearticle(self, article):
         """
@@ -171,28 +255,180 @@ class SQLite(Database):
             True if article saved, False otherwise
         """
 
-        try:
-            # Article row
-            self.insert(SQLite.ARTICLES, "articles", article.metadata)
-        except sqlite3.IntegrityError:
-            # Duplicate detected get entry date to determine action
-            entry = parser.parse(self.cur.execute(SQLite.LOOKUP_ENTRY, [article.uid()]).fetchone()[0])
-
-            # Keep existing article if existing entry date is same or newer
-            if article.entry() <= entry:
+        uid, entry = article.uid(), article.entry()
+
+        # Duplicate detected, keep existing article if existing entry date is same or newer. Existing articles without an
+        # entry date are replaced.
+        exists, existing = self.entry(uid)
+        if exists:
+            if existing is not None and entry <= existing:
                 return False
 
-            # Delete and re-insert article
-            self.cur.execute(SQLite.DELETE_ARTICLE, [article.uid()])
-            self.cur.execute(SQLite.DELETE_SECTIONS, [article.uid()])
-            self.insert(SQLite.ARTICLES, "articles", article.metadata)
+            # Replace article, sections and citations of the existing article are deleted when buffered rows are written
+            self.replaced[uid] = (self.sindex, self.cindex)
+
+        # Article row
+        self.entries[uid] = entry
+        self.buffer("articles", [article.metadata])
+
+        if self.bloom is not None:
+            self.bloom.add(uid)
+
+        # Limit memory used to track articles
+        if (self.bloom is None and len(self.entries) > SQLite.ENTRIES) or (self.bloom is not None and len(self.bloom) > self.bloom.capacity):
+            # Switch to a bloom filter or rebuild a full bloom filter
+            self.flush()
+            self.load()
+        elif self.bloom is not None and len(self.entries) > SQLite.ENTRIES:
+            # Entry dates of written articles are queried on bloom filter matches
+            self.flush()
+            self.entries = {}
 
         return True
 
+    def entry(self, uid):
+        """
+        Gets the entry date of an existing article.
+
+        Args:
+            uid: article id
+
+        Returns:
+            (True if the article exists, entry date or None if not set)
+        """
+
+        if self.entries is None:
+            self.load()
+
+        exists, entry = uid in self.entries, self.entries.get(uid)
+
+        # Bloom filter matches are checked against the database
+        if not exists and self.bloom is not None and uid in self.bloom:
+            row = self.cur.execute(SQLite.LOOKUP_ENTRY, [uid]).fetchone()
+            exists, entry = row is not None, row[0] if row else None
+
+        return exists, Date.parse(entry) if isinstance(entry, str) else entry
+
+    def load(self):
+        """
+        Loads existing articles. Entry dates are loaded into memory unless the number of articles is over ENTRIES. Otherwise,
+        a bloom filter of article ids, sized for twice the number of articles, is built and entry dates are queried when there
+        is a match.
+        """
+
+        self.entries, self.bloom = {}, None
+
+        count = self.cur.execute(SQLite.COUNT_ARTICLES).fetchone()[0]
+        if count > SQLite.ENTRIES:
+            self.bloom = Bloom(count * 2)
+            for (uid,) in self.cur.execute(SQLite.SELECT_IDS):
+                self.bloom.add(uid)
+        elif count:
+            # Entry date strings are parsed on first use, duplicate strings are shared
+            dates = {}
+            self.entries = {uid: dates.setdefault(entry, entry) for uid, entry in self.cur.execute(SQLite.SELECT_ENTRIES)}
+
     def complete(self):
+        # Merge shard databases
+        for shard in self.shards:
+            dbfile = os.path.join(shard, "articles.sqlite")
+            if os.path.exists(dbfile):
+                self.merge(dbfile)
+
+        if self.shards:
+            shutil.rmtree(os.path.join(self.outdir, "shards"), ignore_errors=True)
+            self.shards = []
+
+        # Create indexes, update query planner statistics and restore default settings
+        if self.bulk:
+            self.flush()
+            self.index()
+            self.execute("ANALYZE")
+            self.db.commit()
+
+            self.pragmas(SQLite.SAFE)
+            self.bulk = False
+
+            self.cur.execute("BEGIN")
+
         print(f"Total articles inserted: {self.aindex}")
 
+    def shard(self, name):
+        """
+        Builds the output directory for a shard database. Shard databases are written by other processes with the same schema
+        as this database and merged into this database when complete.
+
+        Args:
+            name: shard name
+
+        Returns:
+            shard output directory
+        """
+
+        path = os.path.join(self.outdir, "shards", name)
+        self.shards.append(path)
+
+        return path
+
+    def merge(self, dbfile):
+        """
+        Merges a shard database into this database. Duplicate articles are resolved the same way as savearticle, the article
+        with the latest entry date is kept. Section and citation ids are renumbered.
+
+        Args:
+            dbfile: path to shard database file
+
+        Returns:
+            number of articles merged
+        """
+
+        # Databases can't be attached within a transaction
+        self.flush()
+        self.db.commit()
+        self.cur.execute(SQLite.ATTACH_SHARD, [dbfile])
+
+        try:
+            self.cur.execute("BEGIN")
+
+            # Select articles to merge
+            self.cur.execute(SQLite.CREATE_MERGED)
+            self.cur.execute(SQLite.SELECT_MERGED)
+
+            # Delete articles replaced by shard articles
+            self.cur.execute(SQLite.DELETE_MERGED_ARTICLES)
+            self.cur.execute(SQLite.DELETE_MERGED_SECTIONS)
+            self.cur.execute(SQLite.DELETE_MERGED_CITATIONS)
+
+            # Copy articles, sections and citations
+            self.cur.execute(SQLite.MERGE_ARTICLES)
+            count = self.cur.rowcount
+
+            self.cur.execute(SQLite.MERGE_SECTIONS, [self.sindex])
+            self.sindex += self.cur.rowcount
+
+            self.cur.execute(SQLite.MERGE_CITATIONS, [self.cindex])
+            self.cindex += self.cur.rowcount
+
+            self.cur.execute(SQLite.DROP_MERGED)
+            self.db.commit()
+        except sqlite3.Error:
+            self.db.rollback()
+            raise
+        finally:
+            self.cur.execute(SQLite.DETACH_SHARD)
+
+        self.aindex += count
+
+        # Existing articles are reloaded on next save
+        self.entries, self.bloom = None, None
+
+        # Start a new transaction
+        self.cur.execute("BEGIN")
+
+        return count
+
     def close(self):
+        self.flush()
         self.db.commit()
         self.db.close()
 
@@ -201,9 +437,32 @@ class SQLite(Database):
         Commits current transaction and creates a new one.
         """
 
+        self.flush()
         self.db.commit()
         self.cur.execute("BEGIN")
 
+    def pragmas(self, settings):
+        """
+        Applies database settings. Settings can't be changed within a transaction.
+
+        Args:
+            settings: dict of pragma name to value
+        """
+
+        for name, value in settings.items():
+            self.cur.execute(SQLite.PRAGMA.format(name=name, value=value))
+
+    def index(self):
+        """
+        Creates section and citation indexes if they don't exist.
+        """
+
+        if not self.indexed:
+            for index in [SQLite.CREATE_SECTION_INDEX, SQLite.CREATE_CITATION_INDEX_1, SQLite.CREATE_CITATION_INDEX_2]:
+                self.execute(index)
+
+            self.indexed = True
+
     def create(self, table, name):
         """
         Creates a SQLite table.
@@ -229,49 +488,118 @@ class SQLite(Database):
 
         self.cur.execute(sql)
 
-    def insert(self, table, name, row):
+    def next(self, sql):
+        """
+        Gets the next id for a table.
+
+        Args:
+            sql: max id query
+
+        Returns:
+            next id, 0 if table is empty
+        """
+
+        uid = self.cur.execute(sql).fetchone()[0]
+        return int(uid) + 1 if uid is not None else 0
+
+    def statement(self, table, name, upsert=False):
         """
-        Builds and inserts a row.
+        Builds an insert prepared statement and a list of column converters for a table.
 
         Args:
-            table: table object
+            table: table schema
             name: table name
-            row: row to insert
+            upsert: if True, rows with an existing id replace the existing row
+
+        Returns:
+            (insert statement, list of converters)
         """
 
-        # Build insert prepared statement
-        columns = [name for name, _ in table.items()]
-        insert = SQLite.INSERT_ROW.format(table=name, columns=", ".join(columns), values=("?, " * len(columns))[:-2])
+        columns = list(table)
+        values = ", ".join(["?"] * len(columns))
 
-        # Execute insert statement
-        self.cur.execute(insert, self.values(table, row, columns))
+        if upsert:
+            updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != "Id")
+            insert = SQLite.UPSERT_ROW.format(table=name, columns=", ".join(columns), values=values, updates=updates)
+        else:
+            insert = SQLite.INSERT_ROW.format(table=name, columns=", ".join(columns), values=values)
 
-    def values(self, table, row, columns):
+        return insert, [SQLite.converter(ctype) for ctype in table.values()]
+
+    def buffer(self, name, rows):
         """
-        Formats and converts row into database types based on table schema.
+        Buffers rows for a batch insert. Buffered rows are written when the buffer is full and before the current
+        transaction is committed.
 
         Args:
-            table: table schema
+            name: table name
+            rows: list of rows to insert
+        """
+
+        buffer = self.buffers[name]
+        buffer.extend(rows)
+
+        if len(buffer) >= SQLite.BATCH:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes all buffered rows.
+        """
+
+        # Delete sections and citations of replaced articles
+        if self.replaced:
+            # Deletes require the section and citation indexes
+            self.index()
+
+            uids = [(uid,) for uid in self.replaced]
+            self.cur.executemany(SQLite.DELETE_SECTIONS, uids)
+            self.cur.executemany(SQLite.DELETE_CITATIONS, uids)
+
+            # Drop buffered rows of replaced articles, rows of the replacement start at the recorded ids
+            for x, name in enumerate(["sections", "citations"]):
+                self.buffers[name] = [row for row in self.buffers[name] if row[1] not in self.replaced or row[0] >= self.replaced[row[1]][x]]
+
+            self.replaced.clear()
+
+        for name, buffer in self.buffers.items():
+            if buffer:
+                insert, converters = self.statements[name]
+                self.cur.executemany(insert, [self.values(converters, row) for row in buffer])
+                buffer.clear()
+
+    def values(self, converters, row):
+        """
+        Formats and converts row into database types.
+
+        Args:
+            converters: list of column converters
             row: row tuple
-            columns: column names
 
         Returns:
-            Database schema formatted row tuple
+            Database schema formatted row
+        """
+
+        return [convert(value) for convert, value in zip(converters, row)]
+
+    @staticmethod
+    def converter(ctype):
         """
+        Gets a function that converts values to a database column type.
 
-        values = []
-        for x, column in enumerate(columns):
-            # Get value
-            value = row[x]
+        Args:
+            ctype: column type
+
+        Returns:
+            converter function
+        """
 
-            if table[column].startswith("INTEGER"):
-                values.append(int(value) if value else 0)
-            elif table[column].startswith("BOOLEAN"):
-                values.append(1 if value == "TRUE" else 0)
-            elif table[column].startswith("TEXT"):
-                # Clean empty text and replace with None
-                values.append(value if value and len(value.strip()) > 0 else None)
-            else:
-                values.append(value)
+        if ctype.startswith("INTEGER"):
+            return lambda value: int(value) if value else 0
+        if ctype.startswith("BOOLEAN"):
+            return lambda value: 1 if value == "TRUE" else 0
+        if ctype.startswith("TEXT"):
+            # Clean empty text and replace with None
+            return lambda value: value if value and value.strip() else None
 
-        return values
+        return lambda value: value
@@ -2,10 +2,10 @@
 Table module
 """
 
-import re
-
 from lxml import etree
 
+from .text import Text
+
 
 class Table:
     """
@@ -42,22 +42,36 @@ class Table:
             list of header-value pairs for each row
         """
 
+        return Table.build([[column.text for column in row] for row in table])
+
+    @staticmethod
+    def build(rows):
+        """
+        Builds a list of header-value pairs for each row. The first row is the header row.
+
+        Args:
+            rows: list of rows, each row is a list of column text
+
+        Returns:
+            list of header-value pairs for each row
+        """
+
         # Table rows
         output = []
 
-        if len(table) > 0:
-            rows = iter(table)
-            headers = [col.text for col in next(rows)]
+        if len(rows) > 0:
+            rows = iter(rows)
+            headers = next(rows)
 
             for row in rows:
                 # Build concatenated header value string
-                values = [f"{headers[x] if x < len(headers) else ''} {column.text}" for x, column in enumerate(row)]
+                values = [f"{headers[x] if x < len(headers) else ''} {column}" for x, column in enumerate(row)]
 
                 # Create single row string
                 value = " ".join(values)
 
                 # Remove whitespace
-                value = re.sub(r"[\n\xa0\t]|\s{2,}", " ", value).strip()
+                value = Text.table(value)
                 if value:
                     output.append(value)
 
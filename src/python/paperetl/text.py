@@ -3,6 +3,10 @@ Text module
 """
 
 import re
+import time
+
+from .metrics import Metrics
+from .splitter import Splitter
 
 # Compiled pattern for cleaning text
 # pylint: disable=W0603
@@ -11,7 +15,7 @@ PATTERN = None
 
 def getPattern():
     """
-    Gets or builds a pre-compiled regex for cleaning text.
+    Gets or builds a pre-compiled regex for cleaning text. The regex removes content and extra spacing in a single pass.
 
     Returns:
         compiled regex
@@ -24,28 +28,60 @@ def getPattern():
         patterns = []
 
         # Remove emails
-        patterns.append(r"\w+@\w+(\.[a-z]{2,})+")
+        patterns.append(r"(?<!\w)\w+@\w+(?:\.[a-z]{2,})+(?:\w+@\w+(?:\.[a-z]{2,})+)*")
 
         # Remove urls
-        patterns.append(r"http(s)?\:\/\/\S+")
+        patterns.append(r"https?\:\/\/\S+")
 
         # Remove single characters repeated at least 3 times (ex. j o u r n a l)
-        patterns.append(r"(^|\s)(\w\s+){3,}")
+        patterns.append(r"(?:^|\s)(?:\w\s+){3,}")
 
         # Remove citations references (ex. [3] [4] [5])
-        patterns.append(r"(\[\d+\]\,?\s?){3,}(\.|\,)?")
+        patterns.append(r"(?:\[\d+\]\,?\s?){3,}[\.\,]?")
 
         # Remove citations references (ex. [3, 4, 5])
         patterns.append(r"\[[\d\,\s]+\]")
 
         # Remove citations references (ex. (NUM1) repeated at least 3 times with whitespace
-        patterns.append(r"(\(\d+\)\s){3,}")
+        patterns.append(r"(?:\(\d+\)\s){3,}")
+
+        # Removed content is replaced with a space. Consecutive removals along with spaces around them are replaced with
+        # a single space. Spaces are matched lazily before each removal, so removals are matched at the same positions as
+        # a separate pass would.
+        removals = "|".join(patterns)
+        removals = f"(?: *?(?:{removals}))+ *"
 
-        PATTERN = re.compile("|".join([f"({p})" for p in patterns]))
+        # Remove extra spacing either caused by replacements or already in text
+        PATTERN = re.compile(f"{removals}| {{2,}}|\\.{{2,}}")
 
     return PATTERN
 
 
+# Compiled patterns for cleaning whitespace
+WHITESPACE = re.compile(r"\s+")
+TABLESPACE = re.compile(r"[\n\xa0\t]|\s{2,}")
+
+
+# Sentence splitter, loaded once per process
+SPLITTER = None
+
+
+def getSplitter():
+    """
+    Gets or creates the sentence splitter for this process.
+
+    Returns:
+        Splitter
+    """
+
+    global SPLITTER
+
+    if not SPLITTER:
+        SPLITTER = Splitter()
+
+    return SPLITTER
+
+
 class Text:
     """
     Methods for formatting and cleaning text.
@@ -57,16 +93,90 @@ class Text:
         Transforms and cleans text to help improve text indexing accuracy.
 
         Args:
-            text: input text line
+            text: input text line or list of text lines
 
         Returns:
-            transformed text
+            transformed text or list of transformed text
         """
 
-        # Clean/transform text
-        text = getPattern().sub(" ", text)
+        start = time.perf_counter()
 
-        # Remove extra spacing either caused by replacements or already in text
-        text = re.sub(r" {2,}|\.{2,}", " ", text)
+        # Clean/transform text
+        sub = getPattern().sub
+        text = [sub(" ", x) for x in text] if isinstance(text, list) else sub(" ", text)
 
+        Metrics.add("transform", time.perf_counter() - start)
         return text
+
+    @staticmethod
+    def clean(text):
+        """
+        Removes newlines and extra spacing from text.
+
+        Args:
+            text: text to clean
+
+        Returns:
+            clean text
+        """
+
+        return WHITESPACE.sub(" ", text).strip()
+
+    @staticmethod
+    def table(text):
+        """
+        Replaces newlines, tabs and non-breaking spaces in table text with a space. Runs of whitespace are replaced with a
+        single space.
+
+        Args:
+            text: table text
+
+        Returns:
+            clean text
+        """
+
+        return TABLESPACE.sub(" ", text).strip()
+
+    @staticmethod
+    def splitter(method):
+        """
+        Sets the sentence splitting method for this process.
+
+        Args:
+            method: sentence splitting method - nltk, rules or none
+        """
+
+        global SPLITTER
+        SPLITTER = Splitter(method)
+
+    @staticmethod
+    def sentences(text):
+        """
+        Splits text into sentences.
+
+        Args:
+            text: input text
+
+        Returns:
+            list of sentences
+        """
+
+        return Text.batch([text])[0]
+
+    @staticmethod
+    def batch(texts):
+        """
+        Splits a batch of texts into sentences.
+
+        Args:
+            texts: list of input texts
+
+        Returns:
+            list of sentences per text
+        """
+
+        start = time.perf_counter()
+        sentences = getSplitter()(texts)
+        Metrics.add("tokenize", time.perf_counter() - start)
+
+        return sentences
@@ -0,0 +1,132 @@
+"""
+GROBID stub server module
+"""
+
+import threading
+import time
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from paperetl.benchmark import Corpus
+
+
+class GrobidStub:
+    """
+    Local GROBID server stub for offline testing. Returns a generated TEI document for each request. Can simulate
+    latency and a busy server.
+    """
+
+    def __init__(self, delay=0.0, capacity=None):
+        """
+        Starts a stub server on a random local port.
+
+        Args:
+            delay: seconds to wait before responding
+            capacity: maximum number of concurrent requests, requests over capacity receive a 503 response
+        """
+
+        self.delay, self.capacity = delay, capacity
+
+        # Request statistics
+        self.lock = threading.Lock()
+        self.active, self.peak, self.requests, self.busy = 0, 0, 0, 0
+
+        self.corpus = Corpus(0)
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), GrobidStub.handler(self))
+        self.server.daemon_threads = True
+
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def respond(self):
+        """
+        Handles a single request.
+
+        Returns:
+            (status code, body)
+        """
+
+        with self.lock:
+            self.requests += 1
+            if self.capacity and self.active >= self.capacity:
+                self.busy += 1
+                return 503, "Busy"
+
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            xml = self.corpus.teidocument(self.requests)
+
+        time.sleep(self.delay)
+
+        with self.lock:
+            self.active -= 1
+
+        return 200, xml
+
+    def close(self):
+        """
+        Stops the server.
+        """
+
+        self.server.shutdown()
+        self.server.server_close()
+
+    @staticmethod
+    def handler(stub):
+        """
+        Builds a request handler class for stub.
+
+        Args:
+            stub: GrobidStub instance
+
+        Returns:
+            request handler class
+        """
+
+        class Handler(BaseHTTPRequestHandler):
+            """
+            GROBID stub request handler.
+            """
+
+            protocol_version = "HTTP/1.1"
+
+            # pylint: disable=C0103
+            def do_POST(self):
+                """
+                Handles a conversion request.
+                """
+
+                # Read request body
+                self.rfile.read(int(self.headers.get("Content-Length", 0)))
+
+                status, body = stub.respond() if self.path == "/api/processFulltextDocument" else (404, "Not Found")
+
+                body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/xml")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            # pylint: disable=C0103
+            def do_GET(self):
+                """
+                Handles a version request.
+                """
+
+                status, body = (200, "0.8.0-stub") if self.path == "/api/version" else (404, "Not Found")
+
+                body = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "text/plain")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
@@ -0,0 +1,125 @@
+"""
+Archive tests
+"""
+
+import os
+import sqlite3
+import tarfile
+import tempfile
+import unittest
+import zipfile
+
+from paperetl.benchmark import Corpus
+from paperetl.file.archive import Archive
+from paperetl.file.execute import Execute
+from paperetl.file.schedule import Schedule
+from paperetl.file.tasks import Tasks
+from paperetl.file.worker import Worker
+
+
+class TestArchive(unittest.TestCase):
+    """
+    Archive tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Generate input files and archives with the same files.
+        """
+
+        cls.files = tempfile.mkdtemp()
+
+        corpus = Corpus(0)
+        corpus.csv(os.path.join(cls.files, "metadata.csv"), 20)
+        corpus.csv(os.path.join(cls.files, "metadata.csv.gz"), 10, 100)
+        corpus.pubmed(os.path.join(cls.files, "pubmed.xml.gz"), 15)
+        corpus.arxiv(os.path.join(cls.files, "arxiv.xml"), 5)
+
+        names = sorted(os.listdir(cls.files))
+
+        cls.archives = {}
+        for name in ["inputs.tar", "inputs.tar.gz", "inputs.zip"]:
+            directory = tempfile.mkdtemp()
+            path = os.path.join(directory, name)
+
+            if name.endswith(".zip"):
+                with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                    for f in names:
+                        archive.write(os.path.join(cls.files, f), f"data/{f}")
+            else:
+                with tarfile.open(path, "w:gz" if name.endswith(".gz") else "w") as archive:
+                    for f in names:
+                        archive.add(os.path.join(cls.files, f), f"data/{f}")
+
+            cls.archives[name] = directory
+
+        # Expected article ids
+        cls.uids = sorted(article.uid() for task in Tasks.scan(cls.files, None, Schedule("path")) for article in Worker.parse(*task) if article)
+
+    def testIncremental(self):
+        """
+        Test unchanged archives are skipped
+        """
+
+        models = tempfile.mkdtemp()
+        for count in [len(self.uids), 0]:
+            report = Execute.run(self.archives["inputs.zip"], models, workers=2, incremental=True)
+            self.assertEqual(report.articles, count)
+
+    def testMembers(self):
+        """
+        Test each archive member is a separate task
+        """
+
+        for directory in self.archives.values():
+            tasks = Tasks.scan(directory, None, Schedule("path"), tempdir=tempfile.mkdtemp())
+            self.assertEqual(sorted(task[1] for task in tasks), sorted(os.listdir(self.files)))
+
+    def testCost(self):
+        """
+        Test archive member cost is based on the uncompressed size
+        """
+
+        for directory in self.archives.values():
+            tasks = Tasks.scan(directory, None, Schedule("path"), tempdir=tempfile.mkdtemp())
+            for task in tasks:
+                self.assertEqual(task[-1]["end"] - task[-1]["start"], os.path.getsize(os.path.join(self.files, task[1])))
+
+    def testRun(self):
+        """
+        Test loading articles from archives
+        """
+
+        for directory in self.archives.values():
+            models = tempfile.mkdtemp()
+            Execute.run(directory, models, replace=True, workers=2)
+
+            db = sqlite3.connect(os.path.join(models, "articles.sqlite"))
+            self.assertEqual([uid for (uid,) in db.execute("SELECT Id FROM articles ORDER BY Id")], self.uids)
+            db.close()
+
+    def testScope(self):
+        """
+        Test zip archives are closed when the scope exits
+        """
+
+        path = os.path.join(self.archives["inputs.zip"], "inputs.zip")
+        parts = [{"archive": "zip", "member": f"data/{name}"} for name in sorted(os.listdir(self.files))]
+
+        # Consecutive members share the open archive
+        with Archive.scope():
+            for part in parts:
+                with Archive.open(path, part, "rb", False) as stream:
+                    self.assertTrue(stream.read())
+
+            archive = Archive.ZIP[path]
+
+        self.assertFalse(Archive.ZIP)
+        self.assertIsNone(archive.fp)
+
+        # Outside of a scope, member streams own the archive
+        with Archive.open(path, parts[0], "rb", False) as stream:
+            self.assertTrue(stream.read())
+
+        self.assertFalse(Archive.ZIP)
@@ -0,0 +1,89 @@
+"""
+arXiv parser tests
+"""
+
+import io
+import unittest
+import warnings
+
+from paperetl.benchmark import Corpus
+from paperetl.file.arx import ARX
+
+# arXiv API response with namespaced elements and escaped text
+FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <link href="http://arxiv.org/api/query?search_query%3Dall%26id_list%3D%26start%3D0%26max_results%3D1" rel="self" type="application/atom+xml"/>
+  <title type="html">ArXiv Query: search_query=all&amp;id_list=&amp;start=0&amp;max_results=1</title>
+  <id>http://arxiv.org/api/cHxbiOdZaP56ODnBPIenZhzg5f8</id>
+  <updated>2024-01-01T00:00:00-05:00</updated>
+  <opensearch:totalResults xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/">1</opensearch:totalResults>
+  <entry>
+    <id>http://arxiv.org/abs/2101.00001v2</id>
+    <updated>2021-02-03T18:59:59Z</updated>
+    <published>2021-01-01T00:00:01Z</published>
+    <title>Learning &amp; Reasoning: A Study of
+  Models &lt;Large&gt;</title>
+    <summary>  We study models. Results show improvements of 5%
+over baselines.  Code is available.
+</summary>
+    <author>
+      <name>Ada Lovelace</name>
+      <arxiv:affiliation xmlns:arxiv="http://arxiv.org/schemas/atom">University of London</arxiv:affiliation>
+    </author>
+    <author>
+      <name>Alan M. Turing</name>
+    </author>
+    <arxiv:doi xmlns:arxiv="http://arxiv.org/schemas/atom">10.1000/xyz</arxiv:doi>
+    <arxiv:comment xmlns:arxiv="http://arxiv.org/schemas/atom">10 pages</arxiv:comment>
+    <arxiv:journal_ref xmlns:arxiv="http://arxiv.org/schemas/atom">J. Test 1 (2021)</arxiv:journal_ref>
+    <link href="http://arxiv.org/abs/2101.00001v2" rel="alternate" type="text/html"/>
+    <arxiv:primary_category xmlns:arxiv="http://arxiv.org/schemas/atom" term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.LG" scheme="http://arxiv.org/schemas/atom"/>
+    <category term="cs.AI" scheme="http://arxiv.org/schemas/atom"/>
+  </entry>
+</feed>
+"""
+
+
+class TestARX(unittest.TestCase):
+    """
+    arXiv parser tests
+    """
+
+    def testFeed(self):
+        """
+        Test parsing an arXiv API response
+        """
+
+        article = list(ARX.parse(io.BytesIO(FEED.encode("utf-8")), "arxiv"))[0]
+
+        self.assertEqual(article.metadata[3:5], ("J. Test 1 (2021)", "Lovelace, Ada; Turing, Alan M."))
+        self.assertEqual(article.metadata[6:9], ("University of London", "Learning & Reasoning: A Study of Models <Large>", "ARX; cs.LG; cs.AI"))
+        self.assertEqual((article.metadata[2].year, article.metadata[10].month), (2021, 2))
+        self.assertEqual(self.soup(FEED), [(article.metadata, article.sections)])
+
+    def testSoup(self):
+        """
+        Test streaming parser output matches BeautifulSoup parser output
+        """
+
+        xml = "".join(Corpus(0).arxivstream(50))
+        articles = [(article.metadata, article.sections) for article in ARX.parse(io.BytesIO(xml.encode("utf-8")), "arxiv")]
+
+        self.assertEqual(len(articles), 50)
+        self.assertEqual(articles, self.soup(xml))
+
+    def soup(self, xml):
+        """
+        Parses xml with the BeautifulSoup parser.
+
+        Args:
+            xml: XML string
+
+        Returns:
+            list of (metadata, sections)
+        """
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return [(article.metadata, article.sections) for article in ARX.soup(io.BytesIO(xml.encode("utf-8")), "arxiv")]
@@ -0,0 +1,48 @@
+"""
+Benchmark tests
+"""
+
+import tempfile
+import unittest
+
+from paperetl.benchmark import DatabaseBenchmark, ParserBenchmark
+
+
+class TestBenchmark(unittest.TestCase):
+    """
+    Benchmark tests
+    """
+
+    def testDatabase(self):
+        """
+        Test database benchmark
+        """
+
+        directory = tempfile.mkdtemp()
+        results = DatabaseBenchmark(directory, 20, urls=[f"sqlite://{directory}/models", f"json://{directory}/json"])()
+
+        self.assertEqual(list(results), ["sqlite", "json"])
+        self.assertEqual(results["sqlite"]["articles"], 20)
+        self.assertGreater(results["sqlite"]["rows"], 20)
+
+    def testParser(self):
+        """
+        Test parser benchmark
+        """
+
+        results = ParserBenchmark(tempfile.mkdtemp(), 20)()
+
+        self.assertEqual(
+            {
+                name: result["articles"]
+                for name, result in results.items()
+                if name not in ("transform", "transform-twopass", "transform-batch", "splitter")
+            },
+            {"pubmed": 20, "arxiv": 20, "arxiv-soup": 20, "csv": 20, "tei": 2, "tei-soup": 2},
+        )
+        self.assertEqual(results["transform"]["sentences"], 200)
+        self.assertEqual(results["transform-twopass"]["sentences"], 200)
+        self.assertEqual(results["transform-batch"]["paragraphs"], 20)
+        self.assertEqual(list(results["splitter"]), ["nltk", "rules", "none"])
+        self.assertEqual(results["splitter"]["nltk"]["agreement"], 1.0)
+        self.assertEqual(results["splitter"]["none"]["sentences"], 20)
@@ -0,0 +1,30 @@
+"""
+Bloom tests
+"""
+
+import unittest
+
+from paperetl.bloom import Bloom
+
+
+class TestBloom(unittest.TestCase):
+    """
+    Bloom tests
+    """
+
+    def testFilter(self):
+        """
+        Test bloom filter membership
+        """
+
+        bloom = Bloom(10000)
+        for x in range(10000):
+            bloom.add(f"id-{x}")
+
+        # No false negatives and false positives close to the error rate
+        self.assertTrue(all(f"id-{x}" in bloom for x in range(10000)))
+        self.assertLess(sum(f"other-{x}" in bloom for x in range(10000)), 200)
+
+        self.assertEqual(len(bloom), 10000)
+        self.assertNotIn("id-0", Bloom(0))
+        self.assertFalse(Bloom(0))
@@ -0,0 +1,66 @@
+"""
+Cache tests
+"""
+
+import os
+import tempfile
+import time
+import unittest
+
+from paperetl.file.cache import Cache
+
+
+class TestCache(unittest.TestCase):
+    """
+    Cache tests
+    """
+
+    def testEvict(self):
+        """
+        Test least recently used entries are evicted
+        """
+
+        cache = Cache(tempfile.mkdtemp())
+
+        keys = [Cache.key(str(x).encode("utf-8"), {}) for x in range(4)]
+        for x, key in enumerate(keys):
+            cache.put(key, "<TEI>" + os.urandom(512).hex() + "</TEI>")
+
+            # Set distinct last use times
+            os.utime(cache.path(key), (time.time() - 100 + x, time.time() - 100 + x))
+
+        # Use first entry
+        cache.get(keys[0])
+
+        cache.maxsize = os.path.getsize(cache.path(keys[0])) + os.path.getsize(cache.path(keys[3]))
+        self.assertEqual(cache.evict(), 2)
+        self.assertEqual([cache.get(key) is not None for key in keys], [True, False, False, True])
+
+    def testKey(self):
+        """
+        Test cache keys include settings
+        """
+
+        self.assertEqual(Cache.key(b"pdf", {"version": "1"}), Cache.key(b"pdf", {"version": "1"}))
+        self.assertNotEqual(Cache.key(b"pdf", {"version": "1"}), Cache.key(b"pdf", {"version": "2"}))
+        self.assertNotEqual(Cache.key(b"pdf", {"version": "1"}), Cache.key(b"fdp", {"version": "1"}))
+
+    def testPut(self):
+        """
+        Test storing and reading entries
+        """
+
+        cache = Cache(tempfile.mkdtemp())
+        key = Cache.key(b"pdf", {})
+
+        self.assertIsNone(cache.get(key))
+
+        cache.put(key, "<TEI>text</TEI>")
+        self.assertEqual(cache.get(key), "<TEI>text</TEI>")
+        self.assertTrue(cache.path(key).endswith(".xml.gz"))
+
+        # Failed writes don't leave temporary files
+        with self.assertRaises(TypeError):
+            cache.put(Cache.key(b"other", {}), b"<TEI>bytes</TEI>")
+
+        self.assertEqual([f for _, _, files in os.walk(cache.directory) for f in files], [os.path.basename(cache.path(key))])
@@ -0,0 +1,110 @@
+"""
+CSV parser tests
+"""
+
+import csv
+import datetime
+import io
+import os
+import tempfile
+import unittest
+
+from paperetl.benchmark import Corpus
+from paperetl.file.csvf import CSV
+from paperetl.file.execute import Execute
+from paperetl.file.tasks import Tasks
+
+# CSV with quoted newlines, missing and extra columns, empty values and date formats
+DATA = """id,title,abstract,entry,published,extra
+1,"Multi
+line title","Abstract with ""quotes""
+and a newline",2020-01-02,2019,x
+2,Empty values,,,,
+3,,,,,
+4,Title,,"March 3, 2021 10:00",,y
+5,Title,Abstract,2021-05-06T10:00:00,2020-02-01,
+"""
+
+
+class TestCSV(unittest.TestCase):
+    """
+    CSV parser tests
+    """
+
+    def testChunks(self):
+        """
+        Test parsing is identical for all chunk sizes
+        """
+
+        data = "".join(Corpus(0).csvstream(100)).encode("utf-8")
+
+        expected = self.parse(data, 1000)
+        self.assertEqual(len(expected), 100)
+
+        for chunksize in [1, 7, 100]:
+            self.assertEqual(self.parse(data, chunksize), expected)
+
+    def testEmpty(self):
+        """
+        Test parsing empty files
+        """
+
+        self.assertEqual(self.parse(b"", 2), [])
+        self.assertEqual(self.parse(b"id,title,abstract\n", 2), [])
+
+    def testExtra(self):
+        """
+        Test fields past the header are ignored
+        """
+
+        articles = self.parse(b"id,title,entry\n1,Title,2020-01-02,extra\n2,Title 2\n", 2)
+        self.assertEqual(
+            [(metadata[0], metadata[7], metadata[10]) for metadata, _ in articles],
+            [("1", "Title", datetime.datetime(2020, 1, 2)), ("2", "Title 2", datetime.datetime.combine(datetime.date.today(), datetime.time()))],
+        )
+
+    def testParse(self):
+        """
+        Test parsing matches row by row parsing with csv.DictReader
+        """
+
+        today = datetime.datetime.combine(datetime.date.today(), datetime.time())
+
+        articles = self.parse(DATA.encode("utf-8"), 2)
+        self.assertEqual([metadata[0] for metadata, _ in articles], ["1", "2", "3", "4", "5"])
+        self.assertEqual([metadata[1] for metadata, _ in articles], ["csv"] * 5)
+        self.assertEqual(
+            [metadata[10] for metadata, _ in articles],
+            [datetime.datetime(2020, 1, 2), today, today, datetime.datetime(2021, 3, 3, 10), datetime.datetime(2021, 5, 6, 10)],
+        )
+
+        # Row by row parsing
+        for (metadata, sections), row in zip(articles, csv.DictReader(io.StringIO(DATA))):
+            self.assertEqual(metadata[:10], tuple(row.get(field, "csv" if field == "source" else None) for field in CSV.FIELDS[:10]))
+            self.assertEqual(sections, [(None, f"{row['title']} {row['abstract']}" if row.get("abstract") else row["title"])])
+
+    def testSplit(self):
+        """
+        Test parsing a CSV file split into parts
+        """
+
+        directory = tempfile.mkdtemp()
+        Corpus(0).csv(os.path.join(directory, "metadata.csv"), 300)
+
+        expected = sorted(article.uid() for article in Execute.stream(directory, workers=1))
+        self.assertGreater(len(Tasks.scan(directory, None, lambda tasks: tasks, split=10000, tempdir=tempfile.mkdtemp())), 1)
+        self.assertEqual(sorted(article.uid() for article in Execute.stream(directory, workers=2, split=10000)), expected)
+
+    def parse(self, data, chunksize):
+        """
+        Parses CSV data.
+
+        Args:
+            data: CSV bytes
+            chunksize: number of rows per chunk
+
+        Returns:
+            list of (metadata, sections)
+        """
+
+        return [(article.metadata, article.sections) for article in CSV.parse(io.BytesIO(data), "csv", chunksize)]
@@ -0,0 +1,81 @@
+"""
+Date tests
+"""
+
+import datetime
+import itertools
+import unittest
+
+from dateutil import parser
+
+from paperetl.date import Date
+
+
+class TestDate(unittest.TestCase):
+    """
+    Date tests
+    """
+
+    def testCache(self):
+        """
+        Test parsed strings are cached
+        """
+
+        Date.parse("2020-01-02")
+        hits = Date.parse.cache_info().hits
+
+        self.assertEqual(Date.parse("2020-01-02"), datetime.datetime(2020, 1, 2))
+        self.assertEqual(Date.parse.cache_info().hits, hits + 1)
+
+    def testISO(self):
+        """
+        Test ISO-8601 dates match dateutil
+        """
+
+        years, months, days = ["1999", "2020", "2024", "0099"], ["", "1", "02", "12", "13"], ["", "1", "29", "30", "31", "32"]
+        times = ["", "T10:00", " 23:59:59", "T00:00:00.5", " 10:00:00.123456", "T25:00", "T10:00:00Z"]
+
+        for year, month, day, time in itertools.product(years, months, days, times):
+            text = year + (f"-{month}" if month else "") + (f"-{day}{time}" if month and day else "")
+            self.assertEqual(self.parse(Date.parse, text), self.parse(parser.parse, text), text)
+
+    def testOther(self):
+        """
+        Test other date formats are parsed with dateutil
+        """
+
+        for text in ["March 3, 2021 10:00", "2021/05/06", "Jan 2019", "2020-01-02T10:00:00+05:00"]:
+            self.assertEqual(Date.parse(text), parser.parse(text))
+
+    def testParts(self):
+        """
+        Test PubMed year, month and day parts match dateutil
+        """
+
+        for year, month, day in itertools.product(["2020", "1998", None], ["Jan", "sept", "May", "05", "13", "Spring", None], ["1", "31", None]):
+            text = "-".join(part for part in (year, month, day) if part)
+            self.assertEqual(self.parse(Date.parts, year, month, day), self.parse(parser.parse, text) if text else None, text)
+
+    def testToday(self):
+        """
+        Test current date
+        """
+
+        self.assertEqual(Date.today(), parser.parse(datetime.datetime.now().strftime("%Y-%m-%d")))
+
+    def parse(self, method, *args):
+        """
+        Runs a date parsing method.
+
+        Args:
+            method: parsing method
+            args: method arguments
+
+        Returns:
+            parsed date or error type
+        """
+
+        try:
+            return method(*args)
+        except ValueError as e:
+            return ValueError if isinstance(e, parser.ParserError) else type(e)
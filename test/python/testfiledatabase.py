@@ -21,6 +21,7 @@ class RequestsStub:
 
     def __init__(self):
         self.ok = True
+        self.status_code = 200
         with open(Utils.DATA + "/0.xml", "r", encoding="utf-8") as xml:
             self.text = xml.read()
 
@@ -101,7 +102,7 @@ class TestFileDatabase(TestProcess):
 
         self.articles(hashes)
 
-    @mock.patch("paperetl.file.pdf.requests.post", mock.MagicMock(return_value=RequestsStub()))
+    @mock.patch("paperetl.file.grobid.requests.Session.post", mock.MagicMock(return_value=RequestsStub()))
     def testPDF(self):
         """
         Tests parsing PDFs
@@ -0,0 +1,159 @@
+"""
+GROBID tests
+"""
+
+import io
+import os
+import sqlite3
+import queue
+import tempfile
+import unittest
+
+from unittest import mock
+
+from paperetl.file.cache import Cache
+from paperetl.file.execute import Execute
+from paperetl.file.grobid import Grobid, Limiter
+from paperetl.file.worker import Worker
+
+# pylint: disable = C0411
+from grobidstub import GrobidStub
+
+
+class TestGrobid(unittest.TestCase):
+    """
+    GROBID tests
+    """
+
+    def testBusy(self):
+        """
+        Test conversions complete when server is busy
+        """
+
+        stub = GrobidStub(delay=0.02, capacity=1)
+        grobid = Grobid(stub.url, concurrency=4)
+
+        completed = []
+        for x in range(8):
+            completed.extend(grobid.submit(x, b"%PDF-1.4"))
+
+        completed.extend(grobid.complete())
+        grobid.close()
+        stub.close()
+
+        self.assertEqual(sorted(x for x, _, _ in completed), list(range(8)))
+        self.assertTrue(all(xml.startswith("<?xml") for _, xml, _ in completed))
+        self.assertEqual(stub.peak, 1)
+
+    def testCache(self):
+        """
+        Test cached conversions aren't sent to the server again
+        """
+
+        stub, cache = GrobidStub(), tempfile.mkdtemp()
+
+        grobid = Grobid(stub.url, cache=Cache(cache))
+        self.assertEqual(grobid.settings(), {"service": Grobid.SERVICE, "version": "0.8.0-stub"})
+
+        xml = grobid.convert(b"%PDF-1.4")
+        grobid.submit(0, b"%PDF-1.5")
+        grobid.complete()
+
+        # Second pass reads from cache
+        completed = grobid.submit(1, b"%PDF-1.5") + [(2, grobid.convert(io.BytesIO(b"%PDF-1.4")), 0.0)]
+        grobid.close()
+        stub.close()
+
+        self.assertEqual(stub.requests, 2)
+        self.assertEqual([x for x, _, _ in completed], [1, 2])
+        self.assertEqual(completed[1][1], xml)
+
+    def testConcurrency(self):
+        """
+        Test multiple requests are kept in flight
+        """
+
+        stub = GrobidStub(delay=0.05)
+        grobid = Grobid(stub.url, concurrency=4)
+
+        for x in range(40):
+            grobid.submit(x, b"%PDF-1.4")
+
+        grobid.complete()
+        grobid.close()
+        stub.close()
+
+        self.assertEqual(stub.requests, 40)
+        self.assertGreater(stub.peak, 1)
+        self.assertLessEqual(stub.peak, 4)
+
+    def testConvert(self):
+        """
+        Test converting a single PDF
+        """
+
+        stub = GrobidStub()
+
+        self.assertTrue(Grobid(stub.url).convert(b"%PDF-1.4").startswith("<?xml"))
+        self.assertIsNone(Grobid(stub.url + "/missing").convert(b"%PDF-1.4"))
+
+        stub.close()
+
+    def testLimiter(self):
+        """
+        Test adaptive limit
+        """
+
+        limiter = Limiter(8)
+        for _ in range(20):
+            limiter.update(1.0)
+
+        self.assertEqual(limiter.value(), 6)
+
+        # Busy server halves limit
+        limiter.update(1.0, 1)
+        self.assertEqual(limiter.value(), 3)
+
+        # Rising latency reduces limit
+        limiter.update(10.0)
+        self.assertEqual(limiter.value(), 2)
+
+    @mock.patch("paperetl.file.worker.Grobid")
+    def testLazy(self, grobid):
+        """
+        Test GROBID client is only created when there are PDFs
+        """
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "metadata.csv")
+        with open(path, "w", encoding="utf-8") as output:
+            output.write("id,title\n1,Title\n")
+
+        inputs = queue.Queue()
+        inputs.put((path, "metadata.csv", "csv", False, None, None))
+        inputs.put(None)
+
+        tasks = [(params, list(results)) for params, results in Worker.tasks(inputs, {"url": None})]
+        self.assertEqual(len(tasks[0][1]), 1)
+        grobid.assert_not_called()
+
+    def testPipeline(self):
+        """
+        Test loading PDFs into a database
+        """
+
+        stub = GrobidStub(delay=0.01)
+
+        data, models = tempfile.mkdtemp(), tempfile.mkdtemp()
+        for x in range(10):
+            with open(os.path.join(data, f"{x}.pdf"), "wb") as output:
+                output.write(b"%PDF-1.4")
+
+        report = Execute.run(data, models, replace=True, workers=2, grobid=stub.url, concurrency=3)
+        stub.close()
+
+        db = sqlite3.connect(os.path.join(models, "articles.sqlite"))
+        self.assertEqual(db.execute("SELECT COUNT(*) FROM articles").fetchone()[0], 10)
+        db.close()
+
+        self.assertEqual(report.inserted, 10)
@@ -0,0 +1,107 @@
+"""
+Manifest tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from paperetl.benchmark import Corpus
+from paperetl.file.execute import Execute
+from paperetl.file.manifest import Manifest
+
+
+class TestManifest(unittest.TestCase):
+    """
+    Manifest tests
+    """
+
+    def testChanged(self):
+        """
+        Test detecting new, unchanged and changed files
+        """
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "data.csv")
+        self.write(path, "id,title\n")
+
+        manifest = Manifest(os.path.join(directory, Manifest.NAME), directory)
+        self.assertTrue(manifest.changed(path))
+
+        # Record file as processed
+        manifest.add([{**Manifest.stat(path), "hash": Manifest.hash(path)}])
+        manifest.save()
+
+        # Reload and check file is unchanged
+        manifest = Manifest(os.path.join(directory, Manifest.NAME), directory)
+        self.assertFalse(manifest.changed(path))
+
+        # Same content with new modification time
+        os.utime(path, (0, 0))
+        self.assertFalse(manifest.changed(path))
+
+        # Changed content
+        self.write(path, "id,title\n1,title\n")
+        self.assertTrue(manifest.changed(path))
+
+        # Replace discards existing manifest
+        manifest = Manifest(os.path.join(directory, Manifest.NAME), directory, replace=True)
+        self.assertFalse(manifest.files)
+
+    def testConfig(self):
+        """
+        Test files are reprocessed when config filters change
+        """
+
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "data.csv")
+        self.write(path, "id,title\n")
+
+        manifest = Manifest(os.path.join(directory, Manifest.NAME), directory, directory)
+        manifest.add([{**Manifest.stat(path), "hash": Manifest.hash(path)}])
+        manifest.save()
+
+        # Add ids filter
+        self.write(os.path.join(directory, "ids"), "1\n")
+
+        manifest = Manifest(os.path.join(directory, Manifest.NAME), directory, directory)
+        self.assertTrue(manifest.changed(path))
+
+    def testDeleted(self):
+        """
+        Test files are reprocessed when the database is deleted and the manifest is left behind
+        """
+
+        indir, models = tempfile.mkdtemp(), tempfile.mkdtemp()
+        Corpus(0).pubmed(os.path.join(indir, "pubmed.xml"), 10)
+
+        for count in [10, 0]:
+            self.assertEqual(Execute.run(indir, models, workers=1, incremental=True).articles, count)
+
+        # Stale manifest with a deleted database
+        os.remove(os.path.join(models, "articles.sqlite"))
+        self.assertTrue(os.path.exists(os.path.join(models, Manifest.NAME)))
+        self.assertEqual(Execute.run(indir, models, workers=1, incremental=True).articles, 10)
+
+    def testLocation(self):
+        """
+        Test default manifest location
+        """
+
+        self.assertEqual(Manifest.location("sqlite://models"), os.path.join("models", Manifest.NAME))
+        self.assertEqual(Manifest.location("json://json"), os.path.join("json", Manifest.NAME))
+
+        with self.assertRaises(ValueError):
+            Manifest.location("http://localhost:9200")
+
+    def write(self, path, content):
+        """
+        Writes content to path.
+
+        Args:
+            path: output path
+            content: file content
+        """
+
+        with open(path, "w", encoding="utf-8") as output:
+            output.write(content)
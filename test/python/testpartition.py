@@ -0,0 +1,135 @@
+"""
+Partition tests
+"""
+
+import gzip
+import os
+import shutil
+import tempfile
+import unittest
+
+from paperetl.benchmark import Corpus
+from paperetl.file.csvf import CSV
+from paperetl.file.partition import Partition
+from paperetl.file.pmb import PMB
+
+
+class TestPartition(unittest.TestCase):
+    """
+    Partition tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Generate a PubMed XML file.
+        """
+
+        cls.directory = tempfile.mkdtemp()
+        cls.path = Corpus(0).pubmed(os.path.join(cls.directory, "pubmed.xml"), 200)
+
+        # Sequential parse
+        with open(cls.path, "rb") as stream:
+            cls.articles = [article.build() for article in PMB.parse(stream, "pubmed.xml", None) if article]
+
+    def testCompressed(self):
+        """
+        Test splitting a compressed file
+        """
+
+        path = os.path.join(self.directory, "pubmed.xml.gz")
+        with open(self.path, "rb") as source, gzip.open(path, "wb") as target:
+            shutil.copyfileobj(source, target)
+
+        self.assertEqual(Partition.size(path, True), os.path.getsize(self.path))
+
+        tempdir = tempfile.mkdtemp()
+        self.assertEqual(self.parse(Partition.decompress(path, tempdir), 20000), self.articles)
+
+    def testSize(self):
+        """
+        Test estimating the uncompressed size of gzip files
+        """
+
+        # Incompressible data is slightly larger when compressed
+        for size in [0, 100, 200000]:
+            path = os.path.join(self.directory, f"random{size}.gz")
+            with gzip.open(path, "wb") as output:
+                output.write(os.urandom(size))
+
+            self.assertGreater(os.path.getsize(path), size)
+            self.assertEqual(Partition.size(path, True), size)
+
+        # Trailer size wraps for files over 4GB
+        path = os.path.join(self.directory, "large.gz")
+        with open(path, "wb") as output:
+            output.truncate(10 * 1024 * 1024 - 4)
+            output.seek(0, os.SEEK_END)
+            output.write((100).to_bytes(4, "little"))
+
+        self.assertEqual(Partition.size(path, True), 2**32 + 100)
+
+    def testRanges(self):
+        """
+        Test ranges are aligned on article boundaries
+        """
+
+        with open(self.path, "rb") as f:
+            data = f.read()
+
+        ranges = Partition.ranges(self.path, 10000)
+        self.assertGreater(len(ranges), 1)
+
+        for start, end in ranges:
+            self.assertTrue(data[start:end].startswith(Partition.START))
+
+    def testRows(self):
+        """
+        Test CSV ranges are aligned on row boundaries, including values with quoted newlines and quotes
+        """
+
+        path = os.path.join(self.directory, "metadata.csv")
+        with open(path, "w", encoding="utf-8") as output:
+            output.write('id,title,abstract\n"1","Multi\nline, title","Abstract with ""quotes""\n\nand newlines"\n')
+            for x in range(2, 200):
+                output.write(f'{x},"Title {x}\n","Abstract\n""{x}"""\n' if x % 3 else f"{x},Title {x},Abstract {x}\n")
+
+        with open(path, "rb") as stream:
+            articles = [(article.metadata, article.sections) for article in CSV.parse(stream, "metadata.csv")]
+
+        self.assertEqual(len(articles), 199)
+        for size in [1, 100, 1000, os.path.getsize(path)]:
+            parts = []
+            header, ranges = Partition.rows(path, size)
+            for start, end in ranges:
+                with Partition.open(path, start, end, header) as stream:
+                    parts.extend((article.metadata, article.sections) for article in CSV.parse(stream, "metadata.csv"))
+
+            self.assertEqual(parts, articles)
+
+    def testSplit(self):
+        """
+        Test parsing a file split into parts is identical to a sequential parse
+        """
+
+        for size in [1, 10000, 100000, os.path.getsize(self.path)]:
+            self.assertEqual(self.parse(self.path, size), self.articles)
+
+    def parse(self, path, size):
+        """
+        Parses a file split into parts.
+
+        Args:
+            path: path to file
+            size: target part size in bytes
+
+        Returns:
+            list of articles
+        """
+
+        articles = []
+        for start, end in Partition.ranges(path, size):
+            with Partition.open(path, start, end) as stream:
+                articles.extend(article.build() for article in PMB.parse(stream, "pubmed.xml", None) if article)
+
+        return articles
@@ -0,0 +1,139 @@
+"""
+PubMed parser tests
+"""
+
+import io
+import os
+import tempfile
+import unittest
+
+from unittest import mock
+
+from paperetl.benchmark import Corpus
+from paperetl.file.pmb import PMB
+
+
+class Generator:
+    """
+    Read-only stream of generated PubMed XML. Repeats a set of articles until a target size is reached.
+    """
+
+    def __init__(self, articles, size):
+        """
+        Creates a new stream.
+
+        Args:
+            articles: list of PubmedArticle XML strings
+            size: target stream size in bytes
+        """
+
+        self.chunks = Generator.generate([article.encode("utf-8") for article in articles], size)
+
+    @staticmethod
+    def generate(articles, size):
+        """
+        Generates XML chunks.
+
+        Args:
+            articles: list of PubmedArticle XML bytes
+            size: target stream size in bytes
+
+        Returns:
+            generator of XML bytes
+        """
+
+        yield b'<?xml version="1.0" encoding="utf-8"?>\n<PubmedArticleSet>\n'
+
+        total = 0
+        while total < size:
+            for article in articles:
+                yield article
+                total += len(article)
+
+        yield b"</PubmedArticleSet>\n"
+
+    def read(self, size=-1):
+        """
+        Reads the next chunk.
+
+        Args:
+            size: ignored, chunks are returned as generated
+
+        Returns:
+            bytes
+        """
+
+        # pylint: disable=W0613
+        return next(self.chunks, b"")
+
+
+class TestPMB(unittest.TestCase):
+    """
+    PubMed parser tests
+    """
+
+    def testMemory(self):
+        """
+        Test memory stays flat while parsing a large file and processed articles are cleared
+        """
+
+        if not os.path.exists("/proc/self/statm"):
+            self.skipTest("Resident memory is only read on Linux")
+
+        # Skip article processing with an ids filter to only measure XML parsing
+        config = tempfile.mkdtemp()
+        with open(os.path.join(config, "ids"), "w", encoding="utf-8") as output:
+            output.write("0\n")
+
+        corpus = Corpus(0)
+        articles = [corpus.pubmedarticle(uid) for uid in range(1, 50)]
+
+        # Track processed article elements, the previous article must be cleared once the next article is parsed
+        process, previous, retained = PMB.process, [], [0]
+
+        def track(element, *args):
+            if previous and len(previous[0]):
+                retained[0] += 1
+
+            previous[:] = [element]
+            return process(element, *args)
+
+        # Resident memory after the first 1,000 articles and peak resident memory
+        baseline, peak, count = None, 0, 0
+        with mock.patch.object(PMB, "process", track):
+            for x, _ in enumerate(PMB.parse(Generator(articles, 64 * 1024 * 1024), "pubmed", config)):
+                if x % 500 == 0:
+                    rss = self.rss()
+                    baseline = rss if x == 1000 else baseline
+                    peak = max(peak, rss)
+
+                count += 1
+
+        self.assertGreater(count, 10000)
+        self.assertLess(peak - baseline, 8 * 1024 * 1024)
+        self.assertEqual(retained[0], 0)
+
+    def testParse(self):
+        """
+        Test parsing articles with other elements between articles
+        """
+
+        corpus = Corpus(0)
+        xml = "".join(corpus.pubmedstream(5)).replace(
+            "</PubmedArticle>\n", "</PubmedArticle>\n<PubmedBookArticle><BookDocument/></PubmedBookArticle>\n"
+        )
+
+        articles = list(PMB.parse(io.BytesIO(xml.encode("utf-8")), "pubmed", None))
+        self.assertEqual([article.uid() for article in articles], ["1", "2", "3", "4", "5"])
+        self.assertTrue(all(len(article.sections) > 1 for article in articles))
+
+    def rss(self):
+        """
+        Reads resident memory of this process.
+
+        Returns:
+            resident memory in bytes
+        """
+
+        with open("/proc/self/statm", encoding="utf-8") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
@@ -0,0 +1,53 @@
+"""
+Profiler tests
+"""
+
+import os
+import pstats
+import tempfile
+import unittest
+
+from paperetl.file.profiler import Profiler
+
+
+class TestProfiler(unittest.TestCase):
+    """
+    Profiler tests
+    """
+
+    def testMerge(self):
+        """
+        Test merging profiles from multiple processes
+        """
+
+        directory = tempfile.mkdtemp()
+
+        for name in ["worker-0", "worker-1", "writer"]:
+            profiler = Profiler(directory, name, 0.001)
+            profiler.start()
+            self.work()
+            profiler.stop()
+
+        outputs = Profiler.merge(directory)
+        self.assertEqual(outputs[0], os.path.join(directory, Profiler.PSTATS))
+
+        # Merged stats include calls from all processes
+        stats = pstats.Stats(outputs[0])
+        calls = [value[1] for key, value in stats.stats.items() if key[2] == "work"]
+        self.assertEqual(calls, [3])
+
+        # Sampled stacks are grouped by process type
+        if len(outputs) > 1:
+            stacks = Profiler.read(outputs[1])
+            self.assertTrue(stacks)
+            self.assertTrue(all(stack.split(";")[0] in ("worker", "writer") for stack in stacks))
+
+    def work(self):
+        """
+        Runs a cpu bound workload.
+
+        Returns:
+            result
+        """
+
+        return sum(x * x for x in range(300000))
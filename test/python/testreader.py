@@ -0,0 +1,68 @@
+"""
+Reader tests
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+
+from paperetl.file.reader import Reader
+
+
+class TestReader(unittest.TestCase):
+    """
+    Reader tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create a compressed test file.
+        """
+
+        cls.text = "".join(f"line {x}, ünïcödé text\n" for x in range(100000))
+        cls.path = os.path.join(tempfile.mkdtemp(), "data.csv.gz")
+
+        with gzip.open(cls.path, "wt", encoding="utf-8") as output:
+            output.write(cls.text)
+
+    def testBinary(self):
+        """
+        Test reading in binary mode
+        """
+
+        with Reader.open(self.path, "rb", chunksize=1000, buffers=2) as stream:
+            self.assertEqual(stream.read(), self.text.encode("utf-8"))
+
+    def testClose(self):
+        """
+        Test closing a stream before it's fully read
+        """
+
+        stream = Reader.open(self.path, "rb", chunksize=100, buffers=1)
+        self.assertEqual(len(stream.read(10)), 10)
+
+        stream.close()
+        self.assertTrue(stream.closed)
+
+    def testError(self):
+        """
+        Test decompression errors are raised in the reading thread
+        """
+
+        path = os.path.join(tempfile.mkdtemp(), "invalid.gz")
+        with open(path, "wb") as output:
+            output.write(b"invalid")
+
+        with self.assertRaises(OSError):
+            with Reader.open(path, "rb") as stream:
+                stream.read()
+
+    def testText(self):
+        """
+        Test reading in text mode
+        """
+
+        with Reader.open(self.path, "r", chunksize=777) as stream:
+            self.assertEqual(list(stream), self.text.splitlines(keepends=True))
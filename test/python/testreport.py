@@ -0,0 +1,93 @@
+"""
+Report tests
+"""
+
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from paperetl.file.report import Report
+from paperetl.metrics import Metrics, Timed
+
+
+class TestReport(unittest.TestCase):
+    """
+    Report tests
+    """
+
+    def testLaunch(self):
+        """
+        Test worker completion times are measured from when workers start
+        """
+
+        report = Report()
+        time.sleep(0.1)
+
+        report.launch()
+        report.worker({"worker": 0, "cpu": None, "files": 0, "articles": 0, "bytes": 0, "seconds": 0.0, "stages": {}})
+        report.complete()
+
+        self.assertLess(report.elapsed[0], 0.1)
+        self.assertGreaterEqual(report.seconds, 0.1)
+
+    def testMetrics(self):
+        """
+        Test stage timings
+        """
+
+        Metrics.clear()
+        Metrics.add("parse", 1.0)
+
+        snapshot = Metrics.snapshot()
+        Metrics.add("parse", 0.5)
+        Metrics.add("read", 0.25)
+
+        self.assertEqual(Metrics.since(snapshot), {"parse": 0.5, "read": 0.25})
+
+        # Timed streams record time spent reading
+        with Timed(io.StringIO("a\nb\n")) as stream:
+            self.assertEqual(list(stream), ["a\n", "b\n"])
+
+        self.assertGreater(Metrics.STAGES["read"], 0.25)
+        Metrics.clear()
+
+    def testSummary(self):
+        """
+        Test report aggregation
+        """
+
+        report = Report()
+        for x, (seconds, articles) in enumerate([(2.0, 10), (1.0, 30)]):
+            report.worker(
+                {
+                    "worker": x,
+                    "cpu": None,
+                    "files": 1,
+                    "articles": articles,
+                    "bytes": 100,
+                    "seconds": seconds,
+                    "stages": {"parse": seconds, "read": 0.5},
+                }
+            )
+            report.add([{"path": f"{x}.xml", "worker": x, "bytes": 100, "articles": articles, "seconds": seconds, "stages": {}}])
+
+        for saved in [True, True, False]:
+            report.save(saved)
+
+        report.complete()
+
+        summary = report.summary()
+        self.assertEqual((summary["articles"], summary["bytes"], summary["files"]), (40, 200, 2))
+        self.assertEqual((summary["inserted"], summary["duplicates"]), (2, 1))
+        self.assertEqual(summary["stages"]["workers"], {"parse": 3.0, "read": 1.0})
+        self.assertEqual([x["path"] for x in summary["slowest"]], ["0.xml", "1.xml"])
+
+        # Write JSON report
+        path = os.path.join(tempfile.mkdtemp(), "report.json")
+        report.write(path)
+
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["articles"], 40)
@@ -0,0 +1,79 @@
+"""
+Schedule tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from paperetl.file.schedule import Schedule
+
+
+class TestSchedule(unittest.TestCase):
+    """
+    Schedule tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Create test files of varying sizes.
+        """
+
+        cls.directory = tempfile.mkdtemp()
+
+        cls.tasks = []
+        for name, size in [("a.csv", 10), ("b.xml", 1000), ("c.xml.gz", 100), ("d.pdf", 500)]:
+            path = os.path.join(cls.directory, name)
+            with open(path, "wb") as output:
+                output.write(b"0" * size)
+
+            parts = name.split(".")
+            cls.tasks.append((path, name, parts[1], parts[-1] == "gz", None))
+
+    def testCost(self):
+        """
+        Test ordering by estimated cost
+        """
+
+        order = [task[1] for task in Schedule("cost")(self.tasks)]
+        self.assertEqual(order, ["b.xml", "c.xml.gz", "d.pdf", "a.csv"])
+
+    def testCustom(self):
+        """
+        Test ordering with a custom cost function
+        """
+
+        order = [task[1] for task in Schedule(lambda path, extension, compress, size: -size)(self.tasks)]
+        self.assertEqual(order, ["a.csv", "c.xml.gz", "d.pdf", "b.xml"])
+
+    def testMakespan(self):
+        """
+        Test predicted makespan
+        """
+
+        schedule = Schedule("size")
+        schedule(self.tasks)
+
+        self.assertEqual(schedule.makespan(1), 1610)
+        self.assertEqual(schedule.makespan(2), 1000)
+
+        report = schedule.report([2.0, 1.0])
+        self.assertEqual(report["actual"], 2.0)
+        self.assertEqual(report["ideal"], 1.5)
+
+    def testPath(self):
+        """
+        Test path ordering
+        """
+
+        order = [task[1] for task in Schedule("path")(self.tasks)]
+        self.assertEqual(order, ["a.csv", "b.xml", "c.xml.gz", "d.pdf"])
+
+    def testSize(self):
+        """
+        Test ordering by file size
+        """
+
+        order = [task[1] for task in Schedule("size")(self.tasks)]
+        self.assertEqual(order, ["b.xml", "d.pdf", "c.xml.gz", "a.csv"])
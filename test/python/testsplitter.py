@@ -0,0 +1,97 @@
+"""
+Splitter tests
+"""
+
+import os
+import tempfile
+import unittest
+
+from paperetl.benchmark import Corpus
+from paperetl.file.execute import Execute
+from paperetl.splitter import Splitter
+from paperetl.text import Text
+
+# Paragraphs with abbreviations, initials, decimals and quotes
+PARAGRAPHS = [
+    "Results were reported by Smith et al. in 2019. The accuracy was 3.5 percent, e.g. Fig. 2 shows it. J. R. Smith agreed! Next (Table 1) follows.",
+    'We used the U.S. dataset. It worked well [1]. "Quoted sentence." Another one?',
+    "",
+    "No terminal punctuation",
+]
+
+
+class TestSplitter(unittest.TestCase):
+    """
+    Splitter tests
+    """
+
+    def tearDown(self):
+        """
+        Resets the sentence splitter.
+        """
+
+        Text.splitter("nltk")
+
+    def testBatch(self):
+        """
+        Test splitting a batch of paragraphs
+        """
+
+        self.assertEqual(Text.batch(PARAGRAPHS), [Text.sentences(paragraph) for paragraph in PARAGRAPHS])
+
+        Text.splitter("none")
+        self.assertEqual(Text.sentences(PARAGRAPHS[1]), [PARAGRAPHS[1]])
+
+    def testMethods(self):
+        """
+        Test each sentence splitting method
+        """
+
+        self.assertEqual(
+            Splitter("nltk")(PARAGRAPHS[:2]),
+            [
+                ["Results were reported by Smith et al.", "in 2019.", "The accuracy was 3.5 percent, e.g. Fig. 2 shows it.", "J. R. Smith agreed!"]
+                + ["Next (Table 1) follows."],
+                ["We used the U.S.", "dataset.", "It worked well [1].", '"Quoted sentence."', "Another one?"],
+            ],
+        )
+
+        self.assertEqual(
+            Splitter("rules")(PARAGRAPHS),
+            [
+                ["Results were reported by Smith et al. in 2019.", "The accuracy was 3.5 percent, e.g. Fig. 2 shows it.", "J. R. Smith agreed!"]
+                + ["Next (Table 1) follows."],
+                ["We used the U.S. dataset.", "It worked well [1].", '"Quoted sentence."', "Another one?"],
+                [],
+                ["No terminal punctuation"],
+            ],
+        )
+
+        self.assertEqual(Splitter("none")(PARAGRAPHS), [[PARAGRAPHS[0]], [PARAGRAPHS[1]], [], [PARAGRAPHS[3]]])
+
+    def testRun(self):
+        """
+        Test sentence splitting method is used by worker processes
+        """
+
+        directory = tempfile.mkdtemp()
+        Corpus(0).pubmed(os.path.join(directory, "pubmed.xml"), 10)
+
+        counts = {}
+        for method in Splitter.METHODS:
+            articles = Execute.stream(directory, workers=1, splitter=method)
+            counts[method] = sum(len(article.sections) for article in articles)
+
+        self.assertEqual(counts["rules"], counts["nltk"])
+        self.assertLess(counts["none"], counts["nltk"])
+
+    def testUnknown(self):
+        """
+        Test unknown sentence splitting method
+        """
+
+        with self.assertRaises(ValueError):
+            Splitter("unknown")
+
+        with self.assertRaises(ValueError):
+            list(Execute.stream(tempfile.mkdtemp(), splitter="unknown"))
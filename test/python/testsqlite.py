@@ -0,0 +1,296 @@
+"""
+SQLite tests
+"""
+
+import datetime
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from paperetl.benchmark import Corpus
+from paperetl.file.execute import Execute
+from paperetl.schema.article import Article
+from paperetl.sqlite import SQLite
+
+
+class TestSQLite(unittest.TestCase):
+    """
+    SQLite tests
+    """
+
+    def article(self, uid, entry, sections, citations=0):
+        """
+        Builds a test article.
+
+        Args:
+            uid: article id
+            entry: entry year
+            sections: number of sections
+            citations: number of citations
+
+        Returns:
+            Article
+        """
+
+        metadata = (uid, "Test", None, None, None, None, None, f"{uid} {entry}", None, None, datetime.datetime(entry, 1, 1))
+        return Article(metadata, [(None, f"{uid} {entry} {x}") for x in range(sections)], [f"{uid} {x}" for x in range(citations)])
+
+    def testBatch(self):
+        """
+        Test buffered section and citation rows
+        """
+
+        outdir = tempfile.mkdtemp()
+
+        db = SQLite(outdir, True)
+        db.save(self.article("a", 2020, 3, 2))
+        db.save(self.article("b", 2020, 2, 1))
+
+        # Replace article with buffered sections
+        db.save(self.article("a", 2021, 1))
+        db.save(self.article("b", 2019, 4))
+        db.complete()
+        db.close()
+
+        connection = sqlite3.connect(os.path.join(outdir, "articles.sqlite"))
+        self.assertEqual(
+            connection.execute("SELECT Id, Article, Name, Text FROM sections ORDER BY Id").fetchall(),
+            [(3, "b", None, "b 2020 0"), (4, "b", None, "b 2020 1"), (5, "a", None, "a 2021 0")],
+        )
+        self.assertEqual(connection.execute("SELECT Id, Article, Reference FROM citations ORDER BY Id").fetchall(), [(2, "b", "b 0")])
+        self.assertEqual(
+            connection.execute("SELECT Source, Published, Entry FROM articles WHERE Id = 'a'").fetchone(), ("Test", None, "2021-01-01 00:00:00")
+        )
+
+        connection.close()
+
+    def testBulk(self):
+        """
+        Test bulk-load mode for new databases
+        """
+
+        outdir = tempfile.mkdtemp()
+        indexes = "SELECT name FROM sqlite_master WHERE type = 'index' AND sql IS NOT NULL ORDER BY name"
+
+        # Bulk-load mode is off by default
+        db = SQLite(outdir, True)
+        self.assertEqual(len(db.cur.execute(indexes).fetchall()), 3)
+        self.assertEqual(db.cur.execute("PRAGMA synchronous").fetchone()[0], 2)
+        db.close()
+
+        db = SQLite(outdir, True, 2, True)
+        for x in range(5):
+            db.save(self.article(str(x), 2020, 2, 1))
+
+        # Indexes are created when complete
+        self.assertEqual(db.cur.execute(indexes).fetchall(), [])
+        self.assertEqual(db.cur.execute("PRAGMA synchronous").fetchone()[0], 0)
+
+        db.complete()
+
+        self.assertEqual(
+            [name for (name,) in db.cur.execute(indexes).fetchall()],
+            ["citation_article", "citation_reference", "section_article"],
+        )
+        self.assertEqual(db.cur.execute("SELECT COUNT(*) FROM sqlite_stat1").fetchone()[0], 4)
+        self.assertEqual(db.cur.execute("PRAGMA synchronous").fetchone()[0], 2)
+        self.assertEqual(db.cur.execute("PRAGMA journal_mode").fetchone()[0], "delete")
+
+        db.close()
+
+        # Indexes are created for databases that weren't completed
+        db = SQLite(outdir, True, bulk=True)
+        db.save(self.article("a", 2020, 1))
+        db.close()
+
+        db = SQLite(outdir, False)
+        self.assertEqual(len(db.cur.execute(indexes).fetchall()), 3)
+        db.close()
+
+        with self.assertRaises(ValueError):
+            SQLite(outdir, False, 0)
+
+    def testDuplicates(self):
+        """
+        Test duplicate articles in an existing database
+        """
+
+        # Databases over the entries limit use a bloom filter
+        for entries in [SQLite.ENTRIES, 0, 2]:
+            outdir = tempfile.mkdtemp()
+
+            limit, SQLite.ENTRIES = SQLite.ENTRIES, entries
+            try:
+                db = SQLite(outdir, True)
+                for uid in ["a", "b", "c", "a"]:
+                    db.save(self.article(uid, 2020, 2, 2))
+                db.complete()
+                db.close()
+
+                db = SQLite(outdir, False)
+                saved = [
+                    db.save(self.article(*article)) for article in [("a", 2021, 1, 1), ("b", 2020, 3), ("c", 2019, 1), ("d", 2020, 1), ("a", 2022, 1)]
+                ]
+                self.assertEqual(db.bloom is not None, entries < 4)
+                db.complete()
+                db.close()
+            finally:
+                SQLite.ENTRIES = limit
+
+            self.assertEqual(saved, [True, False, False, True, True])
+
+            connection = sqlite3.connect(os.path.join(outdir, "articles.sqlite"))
+            self.assertEqual(
+                connection.execute("SELECT Id, Title FROM articles ORDER BY Id").fetchall(),
+                [("a", "a 2022"), ("b", "b 2020"), ("c", "c 2020"), ("d", "d 2020")],
+            )
+
+            # Sections and citations of replaced articles are removed
+            self.assertEqual(
+                connection.execute("SELECT Article, COUNT(*) FROM sections GROUP BY Article").fetchall(), [("a", 1), ("b", 2), ("c", 2), ("d", 1)]
+            )
+            self.assertEqual(connection.execute("SELECT Article, COUNT(*) FROM citations GROUP BY Article").fetchall(), [("b", 2), ("c", 2)])
+            connection.close()
+
+    def testNullEntry(self):
+        """
+        Test existing articles without an entry date are replaced
+        """
+
+        for entries in [SQLite.ENTRIES, 0]:
+            outdir = tempfile.mkdtemp()
+
+            db = SQLite(outdir, True)
+            db.save(self.article("a", 2020, 2, 2))
+            db.complete()
+            db.close()
+
+            connection = sqlite3.connect(os.path.join(outdir, "articles.sqlite"))
+            connection.execute("UPDATE articles SET Entry = NULL")
+            connection.commit()
+            connection.close()
+
+            limit, SQLite.ENTRIES = SQLite.ENTRIES, entries
+            try:
+                db = SQLite(outdir, False)
+                self.assertTrue(db.save(self.article("a", 2019, 1)))
+                db.close()
+            finally:
+                SQLite.ENTRIES = limit
+
+            connection = sqlite3.connect(os.path.join(outdir, "articles.sqlite"))
+            self.assertEqual(connection.execute("SELECT Title FROM articles").fetchall(), [("a 2019",)])
+            self.assertEqual(connection.execute("SELECT Text FROM sections").fetchall(), [("a 2019 0",)])
+            self.assertEqual(connection.execute("SELECT COUNT(*) FROM citations").fetchone()[0], 0)
+            connection.close()
+
+    def testMerge(self):
+        """
+        Test merging shard databases
+        """
+
+        outdir = tempfile.mkdtemp()
+
+        db = SQLite(outdir, True)
+        db.save(self.article("a", 2020, 2, 1))
+        db.save(self.article("b", 2020, 2, 1))
+
+        # Shards with new, newer, older and duplicate articles
+        for x, articles in enumerate([[("b", 2021, 3, 2), ("c", 2020, 1)], [("a", 2019, 4), ("c", 2020, 5), ("d", 2022, 1, 1)]]):
+            shard = SQLite(db.shard(f"worker-{x}"), True)
+            for article in articles:
+                shard.save(self.article(*article))
+            shard.close()
+
+        db.complete()
+        db.close()
+
+        self.assertFalse(os.path.exists(os.path.join(outdir, "shards")))
+        self.assertEqual(db.aindex, 5)
+
+        connection = sqlite3.connect(os.path.join(outdir, "articles.sqlite"))
+        self.assertEqual(
+            connection.execute("SELECT Id, Title FROM articles ORDER BY Id").fetchall(),
+            [("a", "a 2020"), ("b", "b 2021"), ("c", "c 2020"), ("d", "d 2022")],
+        )
+
+        # Shard section and citation ids are renumbered after existing ids
+        sections = connection.execute("SELECT Id, Text FROM sections ORDER BY Id").fetchall()
+        self.assertEqual([uid for uid, _ in sections], [0, 1, 4, 5, 6, 7, 8])
+        self.assertEqual([text for _, text in sections][2:], ["b 2021 0", "b 2021 1", "b 2021 2", "c 2020 0", "d 2022 0"])
+
+        citations = connection.execute("SELECT Id, Article FROM citations ORDER BY Id").fetchall()
+        self.assertEqual(citations, [(0, "a"), (2, "b"), (3, "b"), (4, "d")])
+
+        connection.close()
+
+    def testMergeNullEntry(self):
+        """
+        Test merging shard databases replaces existing articles without an entry date
+        """
+
+        outdir = tempfile.mkdtemp()
+
+        db = SQLite(outdir, True)
+        db.save(self.article("a", 2020, 2, 2))
+        db.complete()
+        db.close()
+
+        connection = sqlite3.connect(os.path.join(outdir, "articles.sqlite"))
+        connection.execute("UPDATE articles SET Entry = NULL")
+        connection.commit()
+        connection.close()
+
+        db = SQLite(outdir, False)
+        shard = SQLite(db.shard("worker-0"), True)
+        shard.save(self.article("a", 2019, 1))
+        shard.close()
+
+        db.complete()
+        db.close()
+
+        connection = sqlite3.connect(os.path.join(outdir, "articles.sqlite"))
+        self.assertEqual(connection.execute("SELECT Title FROM articles").fetchall(), [("a 2019",)])
+        self.assertEqual(connection.execute("SELECT Text FROM sections").fetchall(), [("a 2019 0",)])
+        self.assertEqual(connection.execute("SELECT COUNT(*) FROM citations").fetchone()[0], 0)
+        connection.close()
+
+    def testShards(self):
+        """
+        Test worker processes writing shard databases
+        """
+
+        data = tempfile.mkdtemp()
+
+        # Overlapping article ids with different entry dates
+        for x, start in enumerate([1, 20, 40]):
+            Corpus(x).csv(os.path.join(data, f"metadata{x}.csv"), 30, start)
+
+        results = []
+        for shards in [False, True]:
+            models = tempfile.mkdtemp()
+            report = Execute.run(data, models, replace=True, workers=2, shards=shards)
+
+            connection = sqlite3.connect(os.path.join(models, "articles.sqlite"))
+            results.append(
+                (
+                    connection.execute("SELECT Id, Entry FROM articles ORDER BY Id").fetchall(),
+                    connection.execute("SELECT COUNT(*) FROM sections WHERE Article NOT IN (SELECT Id FROM articles)").fetchone()[0],
+                )
+            )
+            connection.close()
+
+            self.assertEqual(report.inserted + report.duplicates, 90)
+
+        # Same articles are kept and there are no orphaned sections
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[1][1], 0)
+
+    def testUnsupported(self):
+        """
+        Test shards require a SQLite database
+        """
+
+        with self.assertRaises(ValueError):
+            Execute.run(tempfile.mkdtemp(), "json://" + tempfile.mkdtemp(), shards=True)
@@ -0,0 +1,134 @@
+"""
+Stream tests
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+
+from paperetl.benchmark import Corpus
+from paperetl.file.execute import Execute
+from paperetl.file.schedule import Schedule
+from paperetl.file.sequencer import Sequencer
+from paperetl.file.tasks import Tasks
+from paperetl.file.worker import Worker
+
+
+class TestStream(unittest.TestCase):
+    """
+    Stream tests
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Generate CSV files of varying sizes.
+        """
+
+        cls.directory = tempfile.mkdtemp()
+
+        corpus = Corpus(0)
+        for x, articles in enumerate([40, 10, 80, 20]):
+            corpus.csv(os.path.join(cls.directory, f"metadata{x}.csv"), articles, x * 100)
+
+        # Expected articles in path order
+        cls.uids = []
+        for task in Tasks.scan(cls.directory, None, Schedule("path")):
+            cls.uids.extend(article.uid() for article in Worker.parse(*task) if article)
+
+    def testBuild(self):
+        """
+        Test streaming article dicts
+        """
+
+        articles = list(Execute.stream(self.directory, workers=2, build=True))
+        self.assertEqual(sorted(x["id"] for x in articles), sorted(self.uids))
+
+    @unittest.skipIf(not os.path.isdir("/dev/shm"), "Requires /dev/shm")
+    def testClose(self):
+        """
+        Test closing a stream early releases shared memory blocks that were never read
+        """
+
+        blocks = set(os.listdir("/dev/shm"))
+
+        stream = Execute.stream(self.directory, transport="shm", workers=2, batchsize=8, maxbatches=0)
+        self.assertIsNotNone(next(stream))
+
+        # Let worker processes write all remaining batches
+        time.sleep(1)
+        stream.close()
+
+        self.assertEqual(set(os.listdir("/dev/shm")) - blocks, set())
+
+    def testCompletion(self):
+        """
+        Test streaming in completion order
+        """
+
+        uids = [article.uid() for article in Execute.stream(self.directory, workers=2, batchsize=8, maxbatches=1)]
+        self.assertEqual(sorted(uids), sorted(self.uids))
+
+    def testExit(self):
+        """
+        Test the interpreter exits after a stream is closed early with tasks left in the inputs queue
+        """
+
+        directory = tempfile.mkdtemp()
+        for x in range(3000):
+            with open(os.path.join(directory, f"metadata{x:05d}.csv"), "w", encoding="utf-8") as output:
+                output.write(f"cord_uid,title\n{x},title {x}\n")
+
+        code = (
+            "import sys\n"
+            "from paperetl.file.execute import Execute\n"
+            "stream = Execute.stream(sys.argv[1], workers=2)\n"
+            "next(stream)\n"
+            "stream.close()\n"
+        )
+
+        process = subprocess.run(
+            [sys.executable, "-c", code, directory],
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=60,
+            check=False,
+        )
+        self.assertEqual(process.returncode, 0)
+
+    def testInput(self):
+        """
+        Test streaming in input order
+        """
+
+        uids = [article.uid() for article in Execute.stream(self.directory, schedule="path", workers=2, batchsize=8, ordering="input", window=2)]
+        self.assertEqual(uids, self.uids)
+
+    def testInvalid(self):
+        """
+        Test invalid ordering
+        """
+
+        with self.assertRaises(ValueError):
+            list(Execute.stream(self.directory, ordering="random"))
+
+    def testSequencer(self):
+        """
+        Test reordering articles
+        """
+
+        sequencer = Sequencer(["a", "b", "c"])
+
+        # Articles of later tasks are buffered
+        self.assertEqual(sequencer.add([3, 4], [["b", 2]]), [])
+        self.assertEqual(sequencer.add([1, 5], [["a", 1], ["c", 1]]), [1])
+        self.assertEqual(sequencer.pending(), 3)
+
+        # Completing the head releases buffered articles in order
+        self.assertEqual(sequencer.complete(["b"]), [])
+        self.assertEqual(sequencer.complete(["a"]), [3, 4, 5])
+        self.assertEqual(sequencer.add([6], [["c", 1]]), [6])
@@ -0,0 +1,158 @@
+"""
+TEI parser tests
+"""
+
+import io
+import unittest
+import warnings
+
+from paperetl.benchmark import Corpus
+from paperetl.file.tei import TEI
+
+# GROBID output with section heads, nested divs, table figures and markup in the title
+DOCUMENT = """<?xml version="1.0" encoding="UTF-8"?>
+<TEI xml:space="preserve" xmlns="http://www.tei-c.org/ns/1.0">
+  <teiHeader xml:lang="en">
+    <fileDesc>
+      <titleStmt>
+        <title level="a" type="main">Deep Learning for <hi rend="italic">Protein</hi> Folding &amp; Design</title>
+      </titleStmt>
+      <publicationStmt>
+        <publisher>Elsevier BV</publisher>
+        <date type="published" when="2020-03-05">2020-03-05</date>
+      </publicationStmt>
+      <sourceDesc>
+        <biblStruct>
+          <analytic>
+            <author>
+              <persName><forename type="first">Ada</forename><surname>Lovelace</surname></persName>
+              <affiliation key="aff0"><orgName type="institution">University of London</orgName></affiliation>
+            </author>
+            <author>
+              <persName><forename type="first">Alan</forename><surname>Turing</surname></persName>
+            </author>
+          </analytic>
+          <monogr>
+            <title level="j">Journal of Proteins</title>
+            <imprint><date type="published" when="2020-03-05">2020-03-05</date></imprint>
+          </monogr>
+          <idno type="DOI">10.1000/xyz</idno>
+        </biblStruct>
+      </sourceDesc>
+    </fileDesc>
+    <profileDesc>
+      <abstract>
+<div xmlns="http://www.tei-c.org/ns/1.0"><head>Background</head><p>Proteins fold into structures. This is hard <ref type="bibr" target="#b0">[1]</ref>.</p></div>
+      </abstract>
+    </profileDesc>
+  </teiHeader>
+  <text xml:lang="en">
+    <body>
+<div xmlns="http://www.tei-c.org/ns/1.0"><head n="1.">Introduction</head><p>Protein folding is a problem <ref type="bibr" target="#b0">[1]</ref>. Many methods exist.</p></div>
+<div xmlns="http://www.tei-c.org/ns/1.0"><p>A div without a head. It has text.</p></div>
+<div xmlns="http://www.tei-c.org/ns/1.0"><head>Results</head><p>Accuracy was high.</p><div><head>Nested</head><p>Nested div text.</p></div></div>
+<figure xmlns="http://www.tei-c.org/ns/1.0" type="table" xml:id="tab_0"><head>Table 1</head><table><row><cell>Model</cell><cell>Score</cell></row><row><cell>A <hi>bold</hi></cell><cell>1</cell></row></table></figure>
+    </body>
+    <back>
+      <div type="references">
+        <listBibl>
+<biblStruct xml:id="b0">
+  <analytic><title level="a" type="main">A prior &amp; relevant study</title></analytic>
+  <monogr><title level="j">Nature</title><imprint><date type="published" when="2019">2019</date></imprint></monogr>
+</biblStruct>
+        </listBibl>
+      </div>
+    </back>
+  </text>
+</TEI>
+"""
+
+
+class TestTEI(unittest.TestCase):
+    """
+    TEI parser tests
+    """
+
+    def testDocument(self):
+        """
+        Test parsing a GROBID document
+        """
+
+        article = self.parse(DOCUMENT)
+
+        self.assertEqual(
+            article.metadata[3:8],
+            (
+                "Journal of Proteins",
+                "Lovelace, Ada; Turing, Alan",
+                "University of London",
+                "University of London",
+                'Deep Learning for <hi rend="italic">Protein</hi> Folding & Design',
+            ),
+        )
+        self.assertEqual(article.metadata[9], "https://doi.org/10.1000/xyz")
+        self.assertEqual(article.metadata[2].year, 2020)
+        self.assertEqual(sorted({name for name, _ in article.sections if name}), ["ABSTRACT", "INTRODUCTION", "RESULTS", "TAB_0", "TITLE"])
+        self.assertEqual(len(article.citations), 1)
+        self.assertEqual(self.soup(DOCUMENT), (article.metadata, article.sections, article.citations))
+
+    def testEngines(self):
+        """
+        Test lxml parser output matches BeautifulSoup parser output
+        """
+
+        corpus = Corpus(0)
+        for uid in range(1, 21):
+            xml = corpus.teidocument(uid)
+            article = self.parse(xml)
+            self.assertEqual((article.metadata, article.sections, article.citations), self.soup(xml))
+
+    def testNamespace(self):
+        """
+        Test parsing a document without the TEI namespace
+        """
+
+        xml = DOCUMENT.replace(' xmlns="http://www.tei-c.org/ns/1.0"', "")
+
+        article, expected = self.parse(xml), self.parse(DOCUMENT)
+        self.assertEqual((article.metadata, article.sections), (expected.metadata, expected.sections))
+
+    def testRobust(self):
+        """
+        Test parsing documents the BeautifulSoup parser fails on
+        """
+
+        xml = DOCUMENT.replace("<table>", "<table>Model Score").replace('<title level="a" type="main">A prior', '<title level="j">A prior')
+
+        article = self.parse(xml)
+        self.assertEqual(article.metadata[7], self.parse(DOCUMENT).metadata[7])
+        self.assertEqual(article.citations, [])
+
+    def parse(self, xml):
+        """
+        Parses xml with the lxml parser.
+
+        Args:
+            xml: XML string
+
+        Returns:
+            Article
+        """
+
+        return TEI.parse(io.BytesIO(xml.encode("utf-8")), "tei")
+
+    def soup(self, xml):
+        """
+        Parses xml with the BeautifulSoup parser.
+
+        Args:
+            xml: XML string
+
+        Returns:
+            (metadata, sections, citations)
+        """
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            article = TEI.parse(io.BytesIO(xml.encode("utf-8")), "tei", "soup")
+            return (article.metadata, article.sections, article.citations)
@@ -0,0 +1,92 @@
+"""
+Text tests
+"""
+
+import random
+import re
+import unittest
+
+from paperetl.benchmark import Corpus
+from paperetl.text import Text
+
+# Text cleaning inputs and expected outputs
+GOLDEN = [
+    ("Contact john.doe@example.com for details.", "Contact john. for details."),
+    ("Data is at https://example.org/data and http://x.y/z.", "Data is at and "),
+    ("The j o u r n a l of medicine.", "The of medicine."),
+    ("Prior work [3] [4] [5]. Shows this.", "Prior work Shows this."),
+    ("Prior work [3, 4, 5] shows this.", "Prior work shows this."),
+    ("Values (1) (2) (3) were measured.", "Values were measured."),
+    ("Too   many    spaces... and dots..", "Too many spaces  and dots "),
+    ("a@b.comX@c.org and [1,2].. next", " and   next"),
+    ("Removed [1] [2] [3],  [4, 5] and   (1) (2) (3) text", "Removed and text"),
+]
+
+# Original cleaning rules, applied as two separate passes
+PATTERN = re.compile(
+    r"(\w+@\w+(\.[a-z]{2,})+)|(http(s)?\:\/\/\S+)|((^|\s)(\w\s+){3,})|((\[\d+\]\,?\s?){3,}(\.|\,)?)|(\[[\d\,\s]+\])|((\(\d+\)\s){3,})"
+)
+SPACING = re.compile(r" {2,}|\.{2,}")
+
+
+class TestText(unittest.TestCase):
+    """
+    Text tests
+    """
+
+    def testBatch(self):
+        """
+        Test cleaning a list of text
+        """
+
+        self.assertEqual(Text.transform([text for text, _ in GOLDEN]), [expected for _, expected in GOLDEN])
+
+    def testClean(self):
+        """
+        Test whitespace cleaning
+        """
+
+        self.assertEqual(Text.clean("  University of\n   London \t"), "University of London")
+        self.assertEqual(Text.table("Model\xa0 Score\n\n 1\t"), "Model  Score   1")
+
+    def testGolden(self):
+        """
+        Test text cleaning output
+        """
+
+        for text, expected in GOLDEN:
+            self.assertEqual(Text.transform(text), expected)
+
+    def testPasses(self):
+        """
+        Test single pass cleaning matches cleaning with separate passes
+        """
+
+        corpus = Corpus(0)
+        texts = [corpus.paragraph() for _ in range(500)]
+
+        # Random combinations of content removed by cleaning, spacing and text
+        tokens = [
+            " ",
+            "  ",
+            ".",
+            "..",
+            "\n",
+            "a",
+            "X",
+            "word",
+            "j o u r n",
+            "[1]",
+            "[2],",
+            "[3] ",
+            "[1, 2]",
+            "(1) ",
+            "https://a.b/c",
+            "me@x.org",
+            "1@b.cc.dd",
+        ]
+        rand = random.Random(0)
+        texts += ["".join(rand.choice(tokens) for _ in range(rand.randint(1, 12))) for _ in range(20000)]
+
+        for text in texts:
+            self.assertEqual(Text.transform(text), SPACING.sub(" ", PATTERN.sub(" ", text)), repr(text))
@@ -0,0 +1,82 @@
+"""
+Transport tests
+"""
+
+import os
+import unittest
+
+from multiprocessing import shared_memory
+
+from paperetl.file.transport import Transport
+from paperetl.schema.article import Article
+
+
+class TestTransport(unittest.TestCase):
+    """
+    Transport tests
+    """
+
+    def testDiscard(self):
+        """
+        Test discarding unread batches
+        """
+
+        methods = ["file", "pipe"] + (["shm"] if os.name == "posix" else [])
+        for method in methods:
+            transport = Transport.create(method)
+            message = transport.write(transport.encode([]))
+
+            # Discarding twice is a no-op
+            transport.discard(message)
+            transport.discard(message)
+
+            if method == "file":
+                self.assertFalse(os.path.exists(message))
+            if method == "shm":
+                with self.assertRaises(FileNotFoundError):
+                    shared_memory.SharedMemory(name=message[0])
+
+    def testFile(self):
+        """
+        Test temporary file transport
+        """
+
+        self.transport("file")
+
+    def testInvalid(self):
+        """
+        Test invalid transport method
+        """
+
+        with self.assertRaises(ValueError):
+            Transport.create("invalid")
+
+    def testPipe(self):
+        """
+        Test pipe transport
+        """
+
+        self.transport("pipe")
+
+    @unittest.skipIf(os.name != "posix", "Shared memory transport requires a POSIX platform")
+    def testSharedMemory(self):
+        """
+        Test shared memory transport
+        """
+
+        self.transport("shm")
+
+    def transport(self, method):
+        """
+        Sends a batch through a transport and checks the result.
+
+        Args:
+            method: transport method
+        """
+
+        batch = [Article(Article.ARTICLE, [("TITLE", f"title {x}"), ("ABSTRACT", "text")], [str(x)]) for x in range(10)]
+
+        transport = Transport.create(method)
+        result = transport.read(transport.write(transport.encode(batch)))
+
+        self.assertEqual([x.build() for x in result], [x.build() for x in batch])